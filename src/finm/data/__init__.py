@@ -32,7 +32,7 @@ Example usage:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Union
+from typing import TYPE_CHECKING, Literal, Sequence, Union
 
 import pandas as pd
 import polars as pl
@@ -45,6 +45,9 @@ from finm.data import (
     open_source_bond,
     wrds,
 )
+from finm.data._cache import FileCache, cache_key
+from finm.data.wrds._constants import PARQUET_CORP_BOND
+from finm.data.wrds._load import _treasury_file
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -57,7 +60,7 @@ FormatType = Literal["wide", "long"]
 # ==============================================================================
 
 
-def pull_fed_yield_curve(data_dir: Path | str) -> tuple[pd.DataFrame, pd.DataFrame]:
+def pull_fed_yield_curve(data_dir: Path | str) -> Path:
     """Download Federal Reserve yield curve data.
 
     Parameters
@@ -67,18 +70,21 @@ def pull_fed_yield_curve(data_dir: Path | str) -> tuple[pd.DataFrame, pd.DataFra
 
     Returns
     -------
-    tuple[pd.DataFrame, pd.DataFrame]
-        (df_all, df_standard) - Full dataset and filtered dataset.
+    Path
+        Path to the saved parquet file.
     """
     return federal_reserve.pull(data_dir=data_dir)
 
 
 def load_fed_yield_curve(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load Federal Reserve yield curve data (SVENY01-30).
 
@@ -86,6 +92,10 @@ def load_fed_yield_curve(
     ----------
     data_dir : Path or str
         Directory containing the parquet files.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -94,6 +104,8 @@ def load_fed_yield_curve(
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only load these yield columns. The Date column is always kept.
 
     Returns
     -------
@@ -103,19 +115,25 @@ def load_fed_yield_curve(
     return federal_reserve.load(
         data_dir=data_dir,
         variant="standard",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
         lazy=lazy,
+        columns=columns,
     )
 
 
 def load_fed_yield_curve_all(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load full Federal Reserve yield curve data.
 
@@ -123,6 +141,10 @@ def load_fed_yield_curve_all(
     ----------
     data_dir : Path or str
         Directory containing the parquet files.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -131,6 +153,8 @@ def load_fed_yield_curve_all(
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only load these yield columns. The Date column is always kept.
 
     Returns
     -------
@@ -140,10 +164,13 @@ def load_fed_yield_curve_all(
     return federal_reserve.load(
         data_dir=data_dir,
         variant="all",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
         lazy=lazy,
+        columns=columns,
     )
 
 
@@ -157,6 +184,8 @@ def pull_fama_french_factors(
     start: str | datetime | None = None,
     end: str | datetime | None = None,
     frequency: Literal["daily", "monthly"] = "daily",
+    accept_license: bool = False,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """Download Fama-French factors from Ken French's Data Library.
 
@@ -170,16 +199,41 @@ def pull_fama_french_factors(
         End date.
     frequency : {"daily", "monthly"}, default "daily"
         Data frequency.
+    accept_license : bool, default False
+        Must be True to acknowledge the data provider's license terms.
+    use_cache : bool, default True
+        If True, read the saved file instead of downloading when the same
+        pull completed within the cache TTL.
 
     Returns
     -------
     pd.DataFrame
         Factor data.
     """
-    return fama_french.pull(
-        data_dir=data_dir, start=start, end=end, frequency=frequency
+    cacheable = use_cache and accept_license
+    if cacheable:
+        key = cache_key(
+            dataset="fama_french", start=start, end=end, frequency=frequency
+        )
+        paths = FileCache.for_data_dir(data_dir).get(key)
+        if paths is not None:
+            print(f"Cache hit: fama_french ({frequency}) already in {data_dir}")
+            return pd.read_parquet(paths[0]).set_index("Date")
+
+    df = fama_french.pull(
+        data_dir=data_dir,
+        start=start,
+        end=end,
+        frequency=frequency,
+        accept_license=accept_license,
     )
 
+    if cacheable:
+        FileCache.for_data_dir(data_dir).set(
+            key, [Path(data_dir) / f"ff3factors_{frequency}.parquet"]
+        )
+    return df
+
 
 def load_fama_french_factors(
     data_dir: Path | str | None = None,
@@ -252,6 +306,8 @@ def pull_he_kelly_manela(
 
 def load_he_kelly_manela_factors_monthly(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
@@ -263,6 +319,10 @@ def load_he_kelly_manela_factors_monthly(
     ----------
     data_dir : Path or str
         Directory containing the data.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -280,6 +340,8 @@ def load_he_kelly_manela_factors_monthly(
     return he_kelly_manela.load(
         data_dir=data_dir,
         variant="factors_monthly",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
@@ -289,6 +351,8 @@ def load_he_kelly_manela_factors_monthly(
 
 def load_he_kelly_manela_factors_daily(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
@@ -300,6 +364,10 @@ def load_he_kelly_manela_factors_daily(
     ----------
     data_dir : Path or str
         Directory containing the data.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -317,6 +385,8 @@ def load_he_kelly_manela_factors_daily(
     return he_kelly_manela.load(
         data_dir=data_dir,
         variant="factors_daily",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
@@ -326,6 +396,8 @@ def load_he_kelly_manela_factors_daily(
 
 def load_he_kelly_manela_all(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
@@ -337,6 +409,10 @@ def load_he_kelly_manela_all(
     ----------
     data_dir : Path or str
         Directory containing the data.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -354,6 +430,8 @@ def load_he_kelly_manela_all(
     return he_kelly_manela.load(
         data_dir=data_dir,
         variant="all",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
@@ -372,6 +450,7 @@ def pull_open_source_bond(
         "treasury", "corporate_daily", "corporate_monthly", "corporate_all", "all"
     ] = "all",
     accept_license: bool = False,
+    use_cache: bool = True,
 ) -> None:
     """Download Open Source Bond data.
 
@@ -391,18 +470,27 @@ def pull_open_source_bond(
         - "all": All datasets
     accept_license : bool, default False
         Must be True to acknowledge the data provider's license terms.
+    use_cache : bool, default True
+        If True, skip datasets whose source file is unchanged since the last
+        pull, judged by its ETag or Last-Modified header.
     """
     return open_source_bond.pull(
-        data_dir=data_dir, variant=variant, accept_license=accept_license
+        data_dir=data_dir,
+        variant=variant,
+        accept_license=accept_license,
+        use_cache=use_cache,
     )
 
 
 def load_treasury_returns(
     data_dir: Path | str,
-    format: FormatType = "wide",
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    format: Literal["wide", "long", "pivot"] = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load treasury bond returns.
 
@@ -410,14 +498,21 @@ def load_treasury_returns(
     ----------
     data_dir : Path or str
         Directory containing the data.
-    format : {"wide", "long"}, default "wide"
-        Output format.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
+    format : {"wide", "long", "pivot"}, default "wide"
+        Output format. "pivot" has one row per date and one return column
+        per CUSIP.
     pull_if_not_found : bool, default False
         If True and data doesn't exist locally, pull from source.
     accept_license : bool, default False
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only return these columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -427,29 +522,40 @@ def load_treasury_returns(
     return open_source_bond.load(
         data_dir=data_dir,
         variant="treasury",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
         lazy=lazy,
+        columns=columns,
     )
 
 
 def load_corporate_bond_returns(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load corporate bond returns (monthly).
 
     This loads the monthly corporate bond returns with 108 factor signals.
+    Also available as load_corporate_bond_returns_monthly().
     For daily prices, use load_corporate_bond_prices_daily().
 
     Parameters
     ----------
     data_dir : Path or str
         Directory containing the data.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -458,6 +564,8 @@ def load_corporate_bond_returns(
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only return these columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -472,19 +580,26 @@ def load_corporate_bond_returns(
     return open_source_bond.load(
         data_dir=data_dir,
         variant="corporate_monthly",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
         lazy=lazy,
+        columns=columns,
     )
 
 
 def load_corporate_bond_prices_daily(
     data_dir: Path | str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    cusips: Sequence[str] | None = None,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load daily corporate bond prices (TRACE Stage 1).
 
@@ -494,6 +609,10 @@ def load_corporate_bond_prices_daily(
     ----------
     data_dir : Path or str
         Directory containing the data.
+    start : str or datetime, optional
+        Start date to filter.
+    end : str or datetime, optional
+        End date to filter.
     format : {"wide", "long"}, default "wide"
         Output format.
     pull_if_not_found : bool, default False
@@ -502,6 +621,11 @@ def load_corporate_bond_prices_daily(
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    cusips : sequence of str, optional
+        Only return these bonds. The data is stored partitioned by CUSIP
+        prefix, so only the partitions holding these CUSIPs are read.
+    columns : sequence of str, optional
+        Only return these columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -516,48 +640,19 @@ def load_corporate_bond_prices_daily(
     return open_source_bond.load(
         data_dir=data_dir,
         variant="corporate_daily",
+        start=start,
+        end=end,
         format=format,
         pull_if_not_found=pull_if_not_found,
         accept_license=accept_license,
         lazy=lazy,
+        cusips=cusips,
+        columns=columns,
     )
 
 
-def load_corporate_bond_returns_monthly(
-    data_dir: Path | str,
-    format: FormatType = "wide",
-    pull_if_not_found: bool = False,
-    accept_license: bool = False,
-    lazy: bool = False,
-) -> Union[pl.DataFrame, pl.LazyFrame]:
-    """Load monthly corporate bond returns with factor signals.
-
-    Parameters
-    ----------
-    data_dir : Path or str
-        Directory containing the data.
-    format : {"wide", "long"}, default "wide"
-        Output format.
-    pull_if_not_found : bool, default False
-        If True and data doesn't exist locally, pull from source.
-    accept_license : bool, default False
-        Must be True when pull_if_not_found=True.
-    lazy : bool, default False
-        If True, return a polars LazyFrame instead of DataFrame.
-
-    Returns
-    -------
-    pl.DataFrame or pl.LazyFrame
-        Corporate bond returns (monthly) with 108 factor signals.
-    """
-    return open_source_bond.load(
-        data_dir=data_dir,
-        variant="corporate_monthly",
-        format=format,
-        pull_if_not_found=pull_if_not_found,
-        accept_license=accept_license,
-        lazy=lazy,
-    )
+# Alias of load_corporate_bond_returns (same function object)
+load_corporate_bond_returns_monthly = load_corporate_bond_returns
 
 
 # ==============================================================================
@@ -572,6 +667,7 @@ def pull_wrds_treasury(
     end_date: str,
     variant: Literal["daily", "info", "consolidated"] = "consolidated",
     with_runness: bool = True,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """Pull CRSP Treasury data from WRDS.
 
@@ -589,13 +685,27 @@ def pull_wrds_treasury(
         Which data variant to pull.
     with_runness : bool, default True
         Whether to calculate runness for consolidated data.
+    use_cache : bool, default True
+        If True, read the saved parquet file instead of querying WRDS when
+        the same pull completed within the cache TTL.
 
     Returns
     -------
     pd.DataFrame
         Treasury data.
     """
-    return wrds.pull(
+    key = cache_key(
+        dataset="wrds_treasury",
+        variant=variant,
+        start_date=start_date,
+        end_date=end_date,
+        with_runness=with_runness,
+    )
+    cached = _read_cached_pull(data_dir, key, use_cache, "wrds_treasury")
+    if cached is not None:
+        return cached
+
+    df = wrds.pull(
         data_dir=data_dir,
         variant="treasury",
         wrds_username=wrds_username,
@@ -604,6 +714,10 @@ def pull_wrds_treasury(
         treasury_variant=variant,
         with_runness=with_runness,
     )
+    FileCache.for_data_dir(data_dir).set(
+        key, [Path(data_dir) / _treasury_file(variant, with_runness)]
+    )
+    return df
 
 
 def load_wrds_treasury(
@@ -616,6 +730,7 @@ def load_wrds_treasury(
     start_date: str | None = None,
     end_date: str | None = None,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load CRSP Treasury data from local cache.
 
@@ -639,6 +754,8 @@ def load_wrds_treasury(
         End date ('YYYY-MM-DD'). Required when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only return these columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -656,6 +773,7 @@ def load_wrds_treasury(
         start_date=start_date,
         end_date=end_date,
         lazy=lazy,
+        columns=columns,
     )
 
 
@@ -664,6 +782,7 @@ def pull_wrds_corp_bond(
     wrds_username: str,
     start_date: str,
     end_date: str,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """Pull corporate bond data from WRDS.
 
@@ -677,19 +796,42 @@ def pull_wrds_corp_bond(
         Start date in 'YYYY-MM-DD' format.
     end_date : str
         End date in 'YYYY-MM-DD' format.
+    use_cache : bool, default True
+        If True, read the saved parquet file instead of querying WRDS when
+        the same pull completed within the cache TTL.
 
     Returns
     -------
     pd.DataFrame
         Corporate bond data.
     """
-    return wrds.pull(
+    key = cache_key(dataset="wrds_corp_bond", start_date=start_date, end_date=end_date)
+    cached = _read_cached_pull(data_dir, key, use_cache, "wrds_corp_bond")
+    if cached is not None:
+        return cached
+
+    df = wrds.pull(
         data_dir=data_dir,
         variant="corp_bond",
         wrds_username=wrds_username,
         start_date=start_date,
         end_date=end_date,
     )
+    FileCache.for_data_dir(data_dir).set(key, [Path(data_dir) / PARQUET_CORP_BOND])
+    return df
+
+
+def _read_cached_pull(
+    data_dir: Path | str, key: str, use_cache: bool, dataset: str
+) -> pd.DataFrame | None:
+    """Return the saved result of a cached WRDS pull, or None on a miss."""
+    if not use_cache:
+        return None
+    paths = FileCache.for_data_dir(data_dir).get(key)
+    if paths is None:
+        return None
+    print(f"Cache hit: {dataset} already in {data_dir}")
+    return pd.read_parquet(paths[0])
 
 
 def load_wrds_corp_bond(
@@ -700,6 +842,7 @@ def load_wrds_corp_bond(
     start_date: str | None = None,
     end_date: str | None = None,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load corporate bond data from local cache.
 
@@ -719,6 +862,8 @@ def load_wrds_corp_bond(
         End date ('YYYY-MM-DD'). Required when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only return these columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -734,6 +879,7 @@ def load_wrds_corp_bond(
         start_date=start_date,
         end_date=end_date,
         lazy=lazy,
+        columns=columns,
     )
 
 
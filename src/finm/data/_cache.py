@@ -0,0 +1,238 @@
+"""On-disk caches for data pulls.
+
+``FileCache`` entries are small JSON files mapping a hash of the pull
+parameters to the files the pull produced. ``HttpCache`` maps a source URL
+to the ETag/Last-Modified validators it was downloaded with. An entry is
+valid while it is younger than the TTL and every file it lists still exists
+with the modification time recorded when the entry was written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Final, Iterable
+
+import requests
+
+from finm.data._utils import get_session
+
+CACHE_DIR_NAME: Final[str] = ".cache"
+DEFAULT_TTL_DAYS: Final[int] = 90
+
+HTTP_CACHE_FILE: Final[str] = ".finm_http_cache.json"
+HTTP_CACHE_TTL_DAYS: Final[float] = 7
+# Environment variable overriding HTTP_CACHE_TTL_DAYS
+HTTP_CACHE_TTL_ENV: Final[str] = "FINM_HTTP_CACHE_TTL_DAYS"
+
+
+def _file_records(paths: Iterable[Path | str]) -> list[dict[str, Any]]:
+    """Record the resolved path and modification time of each file."""
+    return [
+        {"path": str(Path(p).resolve()), "mtime": Path(p).stat().st_mtime}
+        for p in paths
+    ]
+
+
+def _unchanged_paths(files: list[dict[str, Any]]) -> list[Path] | None:
+    """Return the recorded paths if all still have their recorded mtime."""
+    paths = []
+    for file in files:
+        path = Path(file["path"])
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+        if mtime != file["mtime"]:
+            return None
+        paths.append(path)
+    return paths or None
+
+
+def cache_key(**params: Any) -> str:
+    """Build a cache key from pull parameters.
+
+    Parameters
+    ----------
+    **params
+        JSON-serializable parameters identifying the pull, e.g. dataset,
+        variant, start_date, end_date.
+
+    Returns
+    -------
+    str
+        MD5 hex digest of the parameters.
+    """
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+class FileCache:
+    """Cache of files produced by pulls, stored under ``cache_dir``.
+
+    Parameters
+    ----------
+    cache_dir : Path or str
+        Directory holding the JSON cache entries.
+    ttl_days : float, default 90
+        Number of days an entry stays valid.
+
+    Examples
+    --------
+    >>> cache = FileCache.for_data_dir("./data")
+    >>> key = cache_key(dataset="wrds_corp_bond", start_date="2020-01-01")
+    >>> paths = cache.get(key)  # None on a miss
+    """
+
+    def __init__(
+        self, cache_dir: Path | str, ttl_days: float = DEFAULT_TTL_DAYS
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+
+    @classmethod
+    def for_data_dir(
+        cls, data_dir: Path | str, ttl_days: float = DEFAULT_TTL_DAYS
+    ) -> FileCache:
+        """Return the cache stored in ``data_dir/.cache``."""
+        return cls(Path(data_dir) / CACHE_DIR_NAME, ttl_days=ttl_days)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> list[Path] | None:
+        """Return the cached file paths for ``key``, or None on a miss.
+
+        Expired entries and entries whose files are missing or have been
+        modified since they were cached are treated as misses.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            entry = json.loads(entry_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created", 0) > self.ttl_seconds:
+            return None
+        return _unchanged_paths(entry.get("files", []))
+
+    def set(self, key: str, paths: Iterable[Path | str]) -> None:
+        """Record the files produced for ``key``."""
+        entry = {"created": time.time(), "files": _file_records(paths)}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entry_path(key).write_text(json.dumps(entry))
+
+    def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        self._entry_path(key).unlink(missing_ok=True)
+
+
+def remote_validators(
+    url: str, timeout: float = 30, verify: bool = True
+) -> dict[str, str | None]:
+    """Return the ETag and Last-Modified headers the server reports for ``url``.
+
+    Parameters
+    ----------
+    url : str
+        URL to send a HEAD request to.
+    timeout : float, default 30
+        Request timeout in seconds.
+    verify : bool, default True
+        Whether to verify the server's TLS certificate.
+
+    Returns
+    -------
+    dict
+        ``{"etag": ..., "last_modified": ...}``. Both are None if the
+        request fails or the server sends neither header.
+    """
+    try:
+        r = get_session().head(
+            url, timeout=timeout, verify=verify, allow_redirects=True
+        )
+        r.raise_for_status()
+    except requests.RequestException:
+        return {"etag": None, "last_modified": None}
+    return {
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+    }
+
+
+class HttpCache:
+    """Validators of downloaded source files, stored in one JSON file.
+
+    A pull looks up its source URL with the validators from a HEAD request
+    (see :func:`remote_validators`). If they match the ones recorded when
+    the files were last produced, the download can be skipped.
+
+    Parameters
+    ----------
+    data_dir : Path or str
+        Directory holding ``.finm_http_cache.json``.
+    ttl_days : float, optional
+        Number of days an entry stays valid. Defaults to the
+        ``FINM_HTTP_CACHE_TTL_DAYS`` environment variable, or 7.
+
+    Examples
+    --------
+    >>> cache = HttpCache("./data")
+    >>> validators = remote_validators(url)
+    >>> paths = cache.get(url, validators)  # None on a miss
+    """
+
+    # Pulls of several datasets into one directory run on threads
+    _lock = threading.Lock()
+
+    def __init__(self, data_dir: Path | str, ttl_days: float | None = None) -> None:
+        if ttl_days is None:
+            ttl_days = float(os.environ.get(HTTP_CACHE_TTL_ENV, HTTP_CACHE_TTL_DAYS))
+        self.path = Path(data_dir) / HTTP_CACHE_FILE
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            entries: dict[str, Any] = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return entries
+
+    def get(self, url: str, validators: dict[str, str | None]) -> list[Path] | None:
+        """Return the files saved from ``url``, or None if they may be stale.
+
+        Entries are misses if they are expired, if the server sent no
+        validators, if the ETag (or Last-Modified, without an ETag) differs
+        from the recorded one, or if a saved file is missing or modified.
+        """
+        entry = self._read().get(url)
+        if entry is None or not any(validators.values()):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl_seconds:
+            return None
+        key = "etag" if validators.get("etag") else "last_modified"
+        if entry.get(key) != validators[key]:
+            return None
+        return _unchanged_paths(entry.get("files", []))
+
+    def set(
+        self,
+        url: str,
+        validators: dict[str, str | None],
+        paths: Iterable[Path | str],
+    ) -> None:
+        """Record the validators ``url`` was downloaded with and its files."""
+        if not any(validators.values()):
+            return
+        entry = {**validators, "created": time.time(), "files": _file_records(paths)}
+        with self._lock:
+            entries = self._read()
+            entries[url] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(entries))
+            os.replace(tmp_path, self.path)
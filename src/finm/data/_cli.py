@@ -1,19 +1,30 @@
 """CLI for finm data module.
 
 Usage:
-    finm pull <dataset> [options]
+    finm pull <dataset> [<dataset> ...] [options]
     finm list
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Callable, Final, NamedTuple, Optional
 
 import typer
 
+from finm.data import (
+    federal_reserve,
+    he_kelly_manela,
+    pull_fama_french_factors,
+    pull_open_source_bond,
+    pull_wrds_corp_bond,
+    pull_wrds_treasury,
+)
 from finm.data._credentials import get_credentials, get_data_dir
+from finm.data.open_source_bond import VariantType as OpenSourceBondVariant
 
 app = typer.Typer(
     name="finm",
@@ -45,7 +56,10 @@ class Format(str, Enum):
 
 @app.command("pull")
 def pull(
-    dataset: Annotated[Dataset, typer.Argument(help="Dataset to pull")],
+    datasets: Annotated[
+        list[Dataset],
+        typer.Argument(help="Dataset(s) to pull. Several are pulled concurrently."),
+    ],
     data_dir: Annotated[
         Optional[Path],
         typer.Option(
@@ -80,13 +94,22 @@ def pull(
         Format,
         typer.Option("--format", "-f", help="Output format"),
     ] = Format.wide,
+    refresh: Annotated[
+        bool,
+        typer.Option(
+            "--refresh",
+            help="Ignore cached pulls and download again.",
+        ),
+    ] = False,
 ) -> None:
-    """Pull a dataset from its source and save locally.
+    """Pull one or more datasets from their sources and save locally.
 
     Examples:
 
         finm pull fed_yield_curve
 
+        finm pull fed_yield_curve fama_french he_kelly_manela
+
         finm pull wrds_treasury --wrds-username=myuser --start-date=2020-01-01
 
         finm pull he_kelly_manela --format=long
@@ -95,115 +118,160 @@ def pull(
     resolved_data_dir = get_data_dir(data_dir)
     resolved_data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get credentials (will prompt interactively if needed for WRDS)
-    requires_wrds = dataset.value.startswith("wrds_")
-    credentials = get_credentials(
-        wrds_username=wrds_username, interactive=requires_wrds
+    # Validate WRDS arguments once, before resolving credentials or pulling
+    wrds_datasets = [d for d in datasets if d.value.startswith("wrds_")]
+    wrds_opts: Optional[_WrdsOptions] = None
+    if wrds_datasets:
+        if not start_date or not end_date:
+            typer.echo(
+                f"Error: {wrds_datasets[0].value} requires --start-date and --end-date",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+
+        # Get credentials (will prompt interactively if needed for WRDS)
+        credentials = get_credentials(wrds_username=wrds_username, interactive=True)
+        username = credentials.get("wrds_username")
+        if not username:
+            typer.echo(
+                "Error: WRDS username required. "
+                "Provide via --wrds-username or WRDS_USERNAME env var.",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        wrds_opts = _WrdsOptions(username, start_date, end_date)
+
+    opts = _PullOptions(
+        data_dir=resolved_data_dir,
+        accept_license=accept_license,
+        refresh=refresh,
+        wrds=wrds_opts,
     )
 
-    typer.echo(f"Pulling {dataset.value} to {resolved_data_dir}...")
+    def _pull(dataset: Dataset) -> bool:
+        typer.echo(f"Pulling {dataset.value} to {resolved_data_dir}...")
+        try:
+            PULLERS[dataset](opts)
+        except Exception as e:
+            typer.echo(f"Error pulling {dataset.value}: {e}", err=True)
+            return False
+        typer.echo(f"Successfully pulled {dataset.value} to {resolved_data_dir}")
+        return True
 
-    try:
-        if dataset == Dataset.fed_yield_curve:
-            from finm.data import federal_reserve
+    # Aliases (e.g. open_source_bond_corporate) share a puller; pull each once
+    pullers: dict[Callable[[_PullOptions], None], Dataset] = {}
+    for dataset in datasets:
+        pullers.setdefault(PULLERS[dataset], dataset)
+    unique_datasets = list(pullers.values())
 
-            federal_reserve.pull(
-                data_dir=resolved_data_dir, accept_license=accept_license
-            )
+    # WRDS pulls may prompt for a password, so they run one at a time
+    results = [_pull(d) for d in unique_datasets if d.value.startswith("wrds_")]
 
-        elif dataset == Dataset.fama_french:
-            from finm.data import fama_french
+    # Other downloads are I/O bound, so independent datasets are pulled in threads
+    public_datasets = [d for d in unique_datasets if not d.value.startswith("wrds_")]
+    if public_datasets:
+        with ThreadPoolExecutor(max_workers=min(4, len(public_datasets))) as executor:
+            results.extend(executor.map(_pull, public_datasets))
 
-            fama_french.pull(data_dir=resolved_data_dir, accept_license=accept_license)
+    if not all(results):
+        raise typer.Exit(code=1)
 
-        elif dataset == Dataset.he_kelly_manela:
-            from finm.data import he_kelly_manela
 
-            he_kelly_manela.pull(
-                data_dir=resolved_data_dir, accept_license=accept_license
-            )
+class _WrdsOptions(NamedTuple):
+    """WRDS login and date range, checked by ``pull`` before any dataset runs."""
 
-        elif dataset == Dataset.open_source_bond_treasury:
-            from finm.data import open_source_bond
+    username: str
+    start_date: str
+    end_date: str
 
-            open_source_bond.pull(
-                data_dir=resolved_data_dir,
-                variant="treasury",
-                accept_license=accept_license,
-            )
 
-        elif dataset == Dataset.open_source_bond_corporate:
-            from finm.data import open_source_bond
+class _PullOptions(NamedTuple):
+    """Options shared by all single-dataset pulls."""
 
-            open_source_bond.pull(
-                data_dir=resolved_data_dir,
-                variant="corporate_monthly",
-                accept_license=accept_license,
-            )
+    data_dir: Path
+    accept_license: bool
+    refresh: bool
+    wrds: Optional[_WrdsOptions] = None
 
-        elif dataset == Dataset.open_source_bond_corporate_daily:
-            from finm.data import open_source_bond
 
-            open_source_bond.pull(
-                data_dir=resolved_data_dir,
-                variant="corporate_daily",
-                accept_license=accept_license,
-            )
+def _wrds_options(opts: _PullOptions) -> _WrdsOptions:
+    """Return the WRDS options that ``pull`` sets when WRDS data is requested."""
+    if opts.wrds is None:
+        raise ValueError("WRDS pulls require a username, start date and end date")
+    return opts.wrds
 
-        elif dataset == Dataset.open_source_bond_corporate_monthly:
-            from finm.data import open_source_bond
 
-            open_source_bond.pull(
-                data_dir=resolved_data_dir,
-                variant="corporate_monthly",
-                accept_license=accept_license,
-            )
+def _pull_fed_yield_curve(opts: _PullOptions) -> None:
+    federal_reserve.pull(data_dir=opts.data_dir, accept_license=opts.accept_license)
 
-        elif dataset == Dataset.wrds_treasury:
-            if not credentials.get("wrds_username"):
-                raise typer.BadParameter(
-                    "WRDS username required. Provide via --wrds-username or WRDS_USERNAME env var."
-                )
-            if not start_date or not end_date:
-                raise typer.BadParameter(
-                    "WRDS treasury requires --start-date and --end-date"
-                )
-
-            from finm.data import wrds
-
-            wrds.pull(
-                data_dir=resolved_data_dir,
-                variant="treasury",
-                wrds_username=credentials["wrds_username"],
-                start_date=start_date,
-                end_date=end_date,
-            )
 
-        elif dataset == Dataset.wrds_corp_bond:
-            if not credentials.get("wrds_username"):
-                raise typer.BadParameter(
-                    "WRDS username required. Provide via --wrds-username or WRDS_USERNAME env var."
-                )
-            if not start_date or not end_date:
-                raise typer.BadParameter(
-                    "WRDS corp bond requires --start-date and --end-date"
-                )
-
-            from finm.data import wrds
-
-            wrds.pull(
-                data_dir=resolved_data_dir,
-                variant="corp_bond",
-                wrds_username=credentials["wrds_username"],
-                start_date=start_date,
-                end_date=end_date,
-            )
+def _pull_fama_french(opts: _PullOptions) -> None:
+    pull_fama_french_factors(
+        data_dir=opts.data_dir,
+        accept_license=opts.accept_license,
+        use_cache=not opts.refresh,
+    )
 
-        typer.echo(f"Successfully pulled {dataset.value} to {resolved_data_dir}")
 
-    except Exception as e:
-        typer.echo(f"Error pulling {dataset.value}: {e}", err=True)
-        raise typer.Exit(code=1)
+def _pull_he_kelly_manela(opts: _PullOptions) -> None:
+    he_kelly_manela.pull(data_dir=opts.data_dir, accept_license=opts.accept_license)
+
+
+@cache
+def _open_source_bond_puller(
+    variant: OpenSourceBondVariant,
+) -> Callable[[_PullOptions], None]:
+    """Return the puller for one Open Source Bond variant."""
+
+    def _pull(opts: _PullOptions) -> None:
+        pull_open_source_bond(
+            data_dir=opts.data_dir,
+            variant=variant,
+            accept_license=opts.accept_license,
+            use_cache=not opts.refresh,
+        )
+
+    return _pull
+
+
+def _pull_wrds_treasury(opts: _PullOptions) -> None:
+    wrds = _wrds_options(opts)
+    pull_wrds_treasury(
+        data_dir=opts.data_dir,
+        wrds_username=wrds.username,
+        start_date=wrds.start_date,
+        end_date=wrds.end_date,
+        use_cache=not opts.refresh,
+    )
+
+
+def _pull_wrds_corp_bond(opts: _PullOptions) -> None:
+    wrds = _wrds_options(opts)
+    pull_wrds_corp_bond(
+        data_dir=opts.data_dir,
+        wrds_username=wrds.username,
+        start_date=wrds.start_date,
+        end_date=wrds.end_date,
+        use_cache=not opts.refresh,
+    )
+
+
+# Dataset -> function that pulls it. Raises on failure.
+PULLERS: dict[Dataset, Callable[[_PullOptions], None]] = {
+    Dataset.fed_yield_curve: _pull_fed_yield_curve,
+    Dataset.fama_french: _pull_fama_french,
+    Dataset.he_kelly_manela: _pull_he_kelly_manela,
+    Dataset.open_source_bond_treasury: _open_source_bond_puller("treasury"),
+    Dataset.open_source_bond_corporate: _open_source_bond_puller("corporate_monthly"),
+    Dataset.open_source_bond_corporate_daily: _open_source_bond_puller(
+        "corporate_daily"
+    ),
+    Dataset.open_source_bond_corporate_monthly: _open_source_bond_puller(
+        "corporate_monthly"
+    ),
+    Dataset.wrds_treasury: _pull_wrds_treasury,
+    Dataset.wrds_corp_bond: _pull_wrds_corp_bond,
+}
 
 
 @app.command("list")
@@ -247,78 +315,80 @@ def list_datasets() -> None:
         typer.echo(f"{name:<30} {description:<45} {requires_wrds:<6}")
 
 
+# Static dataset descriptions shown by `finm info`
+_INFO_MAP: Final[dict[Dataset, dict[str, Any]]] = {
+    Dataset.fed_yield_curve: {
+        "name": "Federal Reserve Yield Curve",
+        "source": "https://www.federalreserve.gov/data/yield-curve-tables/feds200628.csv",
+        "description": "GSW (Gurkaynak, Sack, Wright) yield curve model data",
+        "variants": ("standard (SVENY01-30)", "all (full dataset)"),
+        "credentials": "None required",
+    },
+    Dataset.fama_french: {
+        "name": "Fama-French 3 Factors",
+        "source": "Ken French Data Library (via pandas-datareader)",
+        "description": "Daily Fama-French 3 factors: Mkt-RF, SMB, HML, RF",
+        "variants": ("daily", "monthly"),
+        "credentials": "None required",
+    },
+    Dataset.he_kelly_manela: {
+        "name": "He-Kelly-Manela Factors",
+        "source": "https://asaf.manela.org/papers/hkm/intermediarycapitalrisk/",
+        "description": "Intermediary capital risk factors from He, Kelly, and Manela (2017)",
+        "variants": ("factors_monthly", "factors_daily", "all"),
+        "credentials": "None required",
+    },
+    Dataset.open_source_bond_treasury: {
+        "name": "Open Source Bond - Treasury Returns",
+        "source": "https://openbondassetpricing.com/",
+        "description": "Treasury bond returns from Open Bond Asset Pricing",
+        "variants": ("treasury",),
+        "credentials": "None required (--accept-license flag required)",
+    },
+    Dataset.open_source_bond_corporate: {
+        "name": "Open Source Bond - Corporate Returns (Deprecated)",
+        "source": "https://openbondassetpricing.com/",
+        "description": "Use open_source_bond_corporate_monthly instead",
+        "variants": ("corporate_monthly",),
+        "credentials": "None required (--accept-license flag required)",
+    },
+    Dataset.open_source_bond_corporate_daily: {
+        "name": "Open Source Bond - Corporate Daily Prices",
+        "source": "https://openbondassetpricing.com/",
+        "description": "Daily corporate bond PRICES from TRACE Stage 1 (~1.8GB)",
+        "variants": ("corporate_daily",),
+        "credentials": "None required (--accept-license flag required)",
+    },
+    Dataset.open_source_bond_corporate_monthly: {
+        "name": "Open Source Bond - Corporate Monthly Returns",
+        "source": "https://openbondassetpricing.com/",
+        "description": "Monthly corporate bond RETURNS + 108 factor signals (~1.2GB)",
+        "variants": ("corporate_monthly",),
+        "credentials": "None required (--accept-license flag required)",
+    },
+    Dataset.wrds_treasury: {
+        "name": "CRSP Treasury Data",
+        "source": "WRDS CRSP US Treasury Database",
+        "description": "Daily Treasury prices, yields, and characteristics",
+        "variants": ("daily", "info", "consolidated"),
+        "credentials": "WRDS_USERNAME required",
+    },
+    Dataset.wrds_corp_bond: {
+        "name": "WRDS Corporate Bond Returns",
+        "source": "WRDS wrdsapps.bondret",
+        "description": "Monthly corporate bond returns with ratings",
+        "variants": ("monthly",),
+        "credentials": "WRDS_USERNAME required",
+    },
+}
+
+
 @app.command("info")
 def info(
     dataset: Annotated[Dataset, typer.Argument(help="Dataset to get info about")],
 ) -> None:
     """Show detailed information about a dataset."""
-    info_map = {
-        Dataset.fed_yield_curve: {
-            "name": "Federal Reserve Yield Curve",
-            "source": "https://www.federalreserve.gov/data/yield-curve-tables/feds200628.csv",
-            "description": "GSW (Gurkaynak, Sack, Wright) yield curve model data",
-            "variants": ["standard (SVENY01-30)", "all (full dataset)"],
-            "credentials": "None required",
-        },
-        Dataset.fama_french: {
-            "name": "Fama-French 3 Factors",
-            "source": "Ken French Data Library (via pandas-datareader)",
-            "description": "Daily Fama-French 3 factors: Mkt-RF, SMB, HML, RF",
-            "variants": ["daily", "monthly"],
-            "credentials": "None required",
-        },
-        Dataset.he_kelly_manela: {
-            "name": "He-Kelly-Manela Factors",
-            "source": "https://asaf.manela.org/papers/hkm/intermediarycapitalrisk/",
-            "description": "Intermediary capital risk factors from He, Kelly, and Manela (2017)",
-            "variants": ["factors_monthly", "factors_daily", "all"],
-            "credentials": "None required",
-        },
-        Dataset.open_source_bond_treasury: {
-            "name": "Open Source Bond - Treasury Returns",
-            "source": "https://openbondassetpricing.com/",
-            "description": "Treasury bond returns from Open Bond Asset Pricing",
-            "variants": ["treasury"],
-            "credentials": "None required (--accept-license flag required)",
-        },
-        Dataset.open_source_bond_corporate: {
-            "name": "Open Source Bond - Corporate Returns (Deprecated)",
-            "source": "https://openbondassetpricing.com/",
-            "description": "Use open_source_bond_corporate_monthly instead",
-            "variants": ["corporate_monthly"],
-            "credentials": "None required (--accept-license flag required)",
-        },
-        Dataset.open_source_bond_corporate_daily: {
-            "name": "Open Source Bond - Corporate Daily Prices",
-            "source": "https://openbondassetpricing.com/",
-            "description": "Daily corporate bond PRICES from TRACE Stage 1 (~1.8GB)",
-            "variants": ["corporate_daily"],
-            "credentials": "None required (--accept-license flag required)",
-        },
-        Dataset.open_source_bond_corporate_monthly: {
-            "name": "Open Source Bond - Corporate Monthly Returns",
-            "source": "https://openbondassetpricing.com/",
-            "description": "Monthly corporate bond RETURNS + 108 factor signals (~1.2GB)",
-            "variants": ["corporate_monthly"],
-            "credentials": "None required (--accept-license flag required)",
-        },
-        Dataset.wrds_treasury: {
-            "name": "CRSP Treasury Data",
-            "source": "WRDS CRSP US Treasury Database",
-            "description": "Daily Treasury prices, yields, and characteristics",
-            "variants": ["daily", "info", "consolidated"],
-            "credentials": "WRDS_USERNAME required",
-        },
-        Dataset.wrds_corp_bond: {
-            "name": "WRDS Corporate Bond Returns",
-            "source": "WRDS wrdsapps.bondret",
-            "description": "Monthly corporate bond returns with ratings",
-            "variants": ["monthly"],
-            "credentials": "WRDS_USERNAME required",
-        },
-    }
-
-    dataset_info = info_map[dataset]
+    dataset_info = _INFO_MAP[dataset]
 
     typer.echo(f"\n{dataset_info['name']}")
     typer.echo("=" * len(dataset_info["name"]))
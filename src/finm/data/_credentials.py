@@ -11,11 +11,16 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 
+# Credentials resolved earlier in this process, so later lookups neither
+# re-read the environment nor prompt again. Explicit arguments still win.
+_credential_cache: dict[str, str] = {}
+
 
 def get_credentials(
     wrds_username: Optional[str] = None,
@@ -24,6 +29,9 @@ def get_credentials(
 ) -> dict[str, Optional[str]]:
     """Get credentials with precedence: CLI arg > env var > .env file > interactive.
 
+    A username resolved once (from any source, including the prompt) is
+    reused for the rest of the process unless a new one is passed in.
+
     Parameters
     ----------
     wrds_username : str, optional
@@ -39,14 +47,12 @@ def get_credentials(
         Dictionary with credential keys and values.
     """
     # Load .env file (lowest precedence, loaded into os.environ)
-    if env_file:
-        load_dotenv(env_file)
-    else:
-        load_dotenv()
+    _load_env_file(env_file)
 
     # Resolve WRDS username with precedence
     resolved_wrds_username = (
         wrds_username  # CLI arg (highest)
+        or _credential_cache.get("wrds_username")  # Resolved earlier this session
         or os.environ.get("WRDS_USERNAME")  # Env var or .env (middle)
     )
 
@@ -54,6 +60,9 @@ def get_credentials(
     if not resolved_wrds_username and interactive and _is_interactive():
         resolved_wrds_username = _prompt_for_credential("WRDS username")
 
+    if resolved_wrds_username:
+        _credential_cache["wrds_username"] = resolved_wrds_username
+
     credentials = {
         "wrds_username": resolved_wrds_username,
         "data_dir": os.environ.get("DATA_DIR"),
@@ -83,10 +92,7 @@ def get_data_dir(
     if data_dir:
         return Path(data_dir)
 
-    if env_file:
-        load_dotenv(env_file)
-    else:
-        load_dotenv()
+    _load_env_file(env_file)
 
     env_data_dir = os.environ.get("DATA_DIR")
     if env_data_dir:
@@ -96,6 +102,19 @@ def get_data_dir(
     return Path("./data_cache")
 
 
+def _load_env_file(env_file: Optional[Path] = None) -> None:
+    """Load a .env file into os.environ, at most once per file per process."""
+    _load_dotenv_once(Path(env_file).resolve() if env_file else None)
+
+
+@lru_cache(maxsize=4)
+def _load_dotenv_once(env_file: Optional[Path]) -> bool:
+    """Call load_dotenv for ``env_file`` (default lookup if None); memoized."""
+    if env_file:
+        return load_dotenv(env_file)
+    return load_dotenv()
+
+
 def validate_credentials(
     required: list[str],
     credentials: dict[str, Optional[str]],
@@ -122,8 +141,9 @@ def validate_credentials(
         )
 
 
+@lru_cache(maxsize=1)
 def _is_interactive() -> bool:
-    """Check if we're running in an interactive terminal."""
+    """Check if we're running in an interactive terminal (probed once)."""
     return sys.stdin.isatty() and sys.stdout.isatty()
 
 
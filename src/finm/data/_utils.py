@@ -2,10 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Union
+import os
+import shutil
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Iterable,
+    Literal,
+    Mapping,
+    Union,
+    overload,
+)
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+DOWNLOAD_CHUNK_SIZE: Final[int] = 1 << 20
+
+# Connection pool and retry settings for the shared HTTP session. The pool
+# holds enough connections for several concurrent ranged downloads.
+HTTP_POOL_SIZE: Final[int] = 16
+HTTP_RETRIES: Final[int] = 3
+HTTP_BACKOFF_FACTOR: Final[float] = 0.3
+
+# Files at least this large are fetched as DOWNLOAD_PARTS parallel byte
+# ranges when the server supports range requests
+DOWNLOAD_PARTS: Final[int] = 4
+RANGED_DOWNLOAD_MIN_SIZE: Final[int] = 64 << 20
+
+# Upper bound on threads used to extract zip archives, and the buffer each
+# one copies members through
+MAX_EXTRACT_WORKERS: Final[int] = 8
+EXTRACT_BUFFER_SIZE: Final[int] = 4 << 20
+
+# Parquet settings for files written by pulls
+PARQUET_COMPRESSION: Final[Literal["zstd"]] = "zstd"
+PARQUET_COMPRESSION_LEVEL: Final[int] = 3
+PARQUET_ROW_GROUP_SIZE: Final[int] = 65_536
+PARQUET_DATA_PAGE_SIZE: Final[int] = 1 << 20
 
 
 def pandas_to_polars(
@@ -14,7 +60,10 @@ def pandas_to_polars(
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Convert pandas DataFrame to polars DataFrame or LazyFrame.
 
-    Handles DatetimeIndex by resetting it to a column.
+    Handles DatetimeIndex or named index by resetting it to a column, unless
+    a column of the same name already exists. The frame is handed
+    to polars through an Arrow table, which is zero-copy for numeric columns;
+    frames with dtypes Arrow cannot represent fall back to ``pl.from_pandas``.
 
     Parameters
     ----------
@@ -28,13 +77,510 @@ def pandas_to_polars(
     pl.DataFrame or pl.LazyFrame
         Polars DataFrame (default) or LazyFrame.
     """
-    if isinstance(df.index, pd.DatetimeIndex):
-        df = df.reset_index()
-    elif df.index.name is not None:
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and index.name is None:
+        pass  # Flat frame: the index is dropped below without a copy
+    elif index.name is not None and index.name in df.columns:
+        pass  # Index duplicates an existing column (e.g. set_index(drop=False))
+    elif isinstance(index, pd.DatetimeIndex) or index.name is not None:
         df = df.reset_index()
 
-    result = pl.from_pandas(df)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        result = pl.from_pandas(df, rechunk=False)
+    else:
+        result = pl.DataFrame(pl.from_arrow(table, rechunk=False))
 
     if lazy:
         return result.lazy()
     return result
+
+
+@overload
+def read_parquet(path: Path | str, lazy: Literal[False] = ...) -> pl.DataFrame: ...
+
+
+@overload
+def read_parquet(path: Path | str, lazy: Literal[True]) -> pl.LazyFrame: ...
+
+
+@overload
+def read_parquet(
+    path: Path | str, lazy: bool = ...
+) -> Union[pl.DataFrame, pl.LazyFrame]: ...
+
+
+def read_parquet(
+    path: Path | str,
+    lazy: bool = False,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Read a parquet file with polars.
+
+    With ``lazy=True`` the file is scanned rather than read, so column
+    selections and filters applied downstream are pushed into the scan.
+
+    Parameters
+    ----------
+    path : Path or str
+        Path to the parquet file.
+    lazy : bool, default False
+        If True, return a LazyFrame from ``pl.scan_parquet``.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Polars DataFrame (default) or LazyFrame.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Data file not found: {path}")
+    if lazy:
+        return pl.scan_parquet(path)
+    return pl.read_parquet(path)
+
+
+def write_parquet(
+    df: Union[pd.DataFrame, pl.DataFrame],
+    path: Path | str,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> Path:
+    """Write a pandas or polars DataFrame to parquet with the package settings.
+
+    Files are zstd-compressed with dictionary encoding, so low-cardinality
+    columns such as CUSIPs and ratings are stored as dictionary indices and
+    scans filtering on them read less data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or pl.DataFrame
+        Frame to write.
+    path : Path or str
+        Output path.
+    row_group_size : int, default 65536
+        Maximum number of rows per row group.
+
+    Returns
+    -------
+    Path
+        Path to the written file.
+    """
+    path = Path(path)
+    if isinstance(df, pl.DataFrame):
+        df.write_parquet(
+            path,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            row_group_size=row_group_size,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+        )
+    else:
+        df.to_parquet(
+            path,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            use_dictionary=True,
+            row_group_size=row_group_size,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+        )
+    return path
+
+
+@overload
+def select_long_format(
+    df: pl.DataFrame, id_column: str, date_column: str, value_column: str
+) -> pl.DataFrame: ...
+
+
+@overload
+def select_long_format(
+    df: pl.LazyFrame, id_column: str, date_column: str, value_column: str
+) -> pl.LazyFrame: ...
+
+
+@overload
+def select_long_format(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    id_column: str,
+    date_column: str,
+    value_column: str,
+) -> Union[pl.DataFrame, pl.LazyFrame]: ...
+
+
+def select_long_format(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    id_column: str,
+    date_column: str,
+    value_column: str,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Select id, date and value columns of a polars frame as [unique_id, ds, y].
+
+    Rows with a missing (null or NaN) value are dropped.
+
+    Parameters
+    ----------
+    df : pl.DataFrame or pl.LazyFrame
+        Input frame.
+    id_column : str
+        Column to use as unique_id.
+    date_column : str
+        Column to use as ds.
+    value_column : str
+        Column to use as y.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Long-format frame of the same type as the input.
+    """
+    # Filter on the source column so a parquet scan applies the predicate
+    # while reading, rather than after the columns are renamed
+    value = pl.col(value_column)
+    return df.filter(value.is_not_null() & value.is_not_nan()).select(
+        pl.col(id_column).alias("unique_id"),
+        pl.col(date_column).alias("ds"),
+        value.alias("y"),
+    )
+
+
+@overload
+def filter_date_range(
+    df: pl.DataFrame,
+    date_column: str,
+    start: str | datetime | None = ...,
+    end: str | datetime | None = ...,
+) -> pl.DataFrame: ...
+
+
+@overload
+def filter_date_range(
+    df: pl.LazyFrame,
+    date_column: str,
+    start: str | datetime | None = ...,
+    end: str | datetime | None = ...,
+) -> pl.LazyFrame: ...
+
+
+@overload
+def filter_date_range(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    date_column: str,
+    start: str | datetime | None = ...,
+    end: str | datetime | None = ...,
+) -> Union[pl.DataFrame, pl.LazyFrame]: ...
+
+
+def filter_date_range(
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    date_column: str,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Restrict a polars frame to rows whose date falls in [start, end].
+
+    Applied to a LazyFrame, the filter is pushed down into the scan so
+    that parquet row groups outside the range are skipped.
+
+    Parameters
+    ----------
+    df : pl.DataFrame or pl.LazyFrame
+        Input frame.
+    date_column : str
+        Name of the date column to filter on.
+    start : str or datetime, optional
+        Start date (inclusive). Format: 'YYYY-MM-DD'.
+    end : str or datetime, optional
+        End date (inclusive). Format: 'YYYY-MM-DD'.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Filtered frame of the same type as the input.
+    """
+    predicates = []
+    if start is not None:
+        predicates.append(pl.col(date_column) >= pd.Timestamp(start).to_pydatetime())
+    if end is not None:
+        predicates.append(pl.col(date_column) <= pd.Timestamp(end).to_pydatetime())
+    if not predicates:
+        return df
+    # One filter over both bounds: a single pass on eager frames
+    return df.filter(*predicates)
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Return the HTTP session shared by all pulls.
+
+    Reusing one session keeps connections to a host alive between requests,
+    so repeated pulls skip the TCP and TLS handshakes. Connection errors and
+    transient 5xx responses are retried with exponential backoff. Responses
+    are requested gzip-compressed and decompressed transparently.
+
+    Returns
+    -------
+    requests.Session
+        Session with pooled, retrying adapters for http and https.
+    """
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _RangesNotSupported(Exception):
+    """Raised when a server answers a range request with the whole file."""
+
+
+def _probe_ranges(
+    url: str, timeout: float, verify: bool
+) -> tuple[int | None, str | None]:
+    """Return the size and validator of ``url`` if it serves byte ranges."""
+    r = get_session().head(
+        url,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=True,
+        headers={"Accept-Encoding": "identity"},
+    )
+    if not r.ok or r.headers.get("Accept-Ranges") != "bytes":
+        return None, None
+    try:
+        size = int(r.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None, None
+    return size, r.headers.get("ETag") or r.headers.get("Last-Modified")
+
+
+def _download_ranges(
+    url: str,
+    part_path: Path,
+    size: int,
+    validator: str | None,
+    parts: int,
+    timeout: float,
+    chunk_size: int,
+    verify: bool,
+) -> None:
+    """Download ``url`` into ``part_path`` as ``parts`` concurrent byte ranges."""
+    session = get_session()
+    with open(part_path, "wb") as f:
+        f.truncate(size)
+
+    def _fetch(start: int, end: int) -> None:
+        headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+        if validator:
+            # Every part must come from the same version of the file
+            headers["If-Range"] = validator
+        with session.get(
+            url, stream=True, timeout=timeout, headers=headers, verify=verify
+        ) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise _RangesNotSupported(url)
+            with open(part_path, "r+b") as f:
+                f.seek(start)
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                if f.tell() != end + 1:
+                    raise OSError(f"Incomplete byte range {start}-{end} from {url}")
+
+    bounds = [(i * size // parts, (i + 1) * size // parts - 1) for i in range(parts)]
+    with ThreadPoolExecutor(max_workers=parts) as executor:
+        futures = [executor.submit(_fetch, start, end) for start, end in bounds]
+        for future in futures:
+            future.result()
+
+
+def download_file(
+    url: str,
+    output_path: Path | str,
+    timeout: float = 300,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    verify: bool = True,
+    parts: int = DOWNLOAD_PARTS,
+) -> Path:
+    """Stream a URL to disk without holding the payload in memory.
+
+    The response is written in chunks to ``<output_path>.part`` and moved
+    into place with ``os.replace`` once complete, so ``output_path`` never
+    holds a partial file. If a ``.part`` file from an interrupted download
+    exists and the server sent an ETag or Last-Modified header for it, the
+    download resumes with a ``Range``/``If-Range`` request; the server
+    restarts from scratch if the file has changed since.
+
+    Large files (64 MiB or more) on servers that accept range requests are
+    fetched as ``parts`` concurrent byte ranges written into place, which
+    is faster when throughput per connection is limited. If the server
+    ignores the ranges, the file is downloaded as a single stream.
+
+    Parameters
+    ----------
+    url : str
+        URL to download from.
+    output_path : Path or str
+        Destination path.
+    timeout : float, default 300
+        Timeout in seconds for connecting and for each read.
+    chunk_size : int, default 1 MiB
+        Number of bytes written per chunk.
+    verify : bool, default True
+        Whether to verify the server's TLS certificate.
+    parts : int, default 4
+        Number of concurrent byte-range requests for large files. Use 1 to
+        always download as a single stream.
+
+    Returns
+    -------
+    Path
+        Path to the downloaded file.
+    """
+    output_path = Path(output_path)
+    part_path = output_path.with_name(output_path.name + ".part")
+    validator_path = output_path.with_name(output_path.name + ".part.validator")
+
+    headers = {}
+    if part_path.exists() and validator_path.exists():
+        headers["Range"] = f"bytes={part_path.stat().st_size}-"
+        headers["If-Range"] = validator_path.read_text()
+    elif parts > 1:
+        size, validator = _probe_ranges(url, timeout, verify)
+        if size is not None and size >= RANGED_DOWNLOAD_MIN_SIZE:
+            # A ranged .part file has gaps until every part finishes, so it
+            # is never resumed: no validator file is written for it
+            validator_path.unlink(missing_ok=True)
+            try:
+                _download_ranges(
+                    url, part_path, size, validator, parts, timeout, chunk_size, verify
+                )
+            except _RangesNotSupported:
+                pass
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+            else:
+                os.replace(part_path, output_path)
+                return output_path
+
+    session = get_session()
+    with session.get(
+        url, stream=True, timeout=timeout, headers=headers, verify=verify
+    ) as r:
+        r.raise_for_status()
+        validator = r.headers.get("ETag") or r.headers.get("Last-Modified")
+        if r.status_code == 206:
+            mode = "ab"
+        else:
+            mode = "wb"
+            if validator:
+                validator_path.write_text(validator)
+            else:
+                validator_path.unlink(missing_ok=True)
+        with open(part_path, mode) as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+
+    os.replace(part_path, output_path)
+    validator_path.unlink(missing_ok=True)
+    return output_path
+
+
+def _matches_zip_member(path: Path, info: zipfile.ZipInfo) -> bool:
+    """Return True if ``path`` has the size and CRC-32 of a zip member."""
+    try:
+        if path.stat().st_size != info.file_size:
+            return False
+    except OSError:
+        return False
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(EXTRACT_BUFFER_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc == info.CRC
+
+
+def extract_zip(
+    zip_path: Path | str,
+    output_dir: Path | str,
+    members: Iterable[str] | Mapping[str, str] | None = None,
+) -> list[Path]:
+    """Extract files from a zip archive, several members at a time.
+
+    zlib releases the GIL while decompressing, so members are extracted on
+    a thread pool. Each worker opens its own ``ZipFile`` on ``zip_path``,
+    since a single ``ZipFile`` cannot be read from several threads, and
+    copies its member in blocks of ``EXTRACT_BUFFER_SIZE`` bytes. Members
+    whose target file already has the same size and CRC-32 are left as is.
+
+    Parameters
+    ----------
+    zip_path : Path or str
+        Path to the zip archive on disk.
+    output_dir : Path or str
+        Directory to extract into.
+    members : iterable of str or mapping of str to str, optional
+        Names of the members to extract. By default, all files are extracted.
+        A mapping writes each member to ``output_dir / members[name]``
+        instead of its name in the archive.
+
+    Returns
+    -------
+    list[Path]
+        Paths to the extracted files.
+
+    Raises
+    ------
+    ValueError
+        If a member would be written outside ``output_dir``.
+    """
+    output_dir = Path(output_dir)
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+    if members is None:
+        members = {info.filename: info.filename for info in infos}
+    elif not isinstance(members, Mapping):
+        members = {name: name for name in members}
+    infos = [info for info in infos if info.filename in members]
+
+    root = output_dir.resolve()
+    targets = {}
+    for info in infos:
+        target = output_dir / members[info.filename]
+        if root not in target.resolve().parents:
+            raise ValueError(f"Zip member {info.filename!r} is outside {output_dir}")
+        targets[info.filename] = target
+
+    # Create directories up front so workers do not race on them
+    for parent in {target.parent for target in targets.values()}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _extract(info: zipfile.ZipInfo) -> Path:
+        target = targets[info.filename]
+        if _matches_zip_member(target, info):
+            return target
+        with zipfile.ZipFile(zip_path) as zf, zf.open(info) as src:
+            with open(target, "wb", buffering=0) as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+        return target
+
+    if len(infos) <= 1:
+        return [_extract(info) for info in infos]
+    max_workers = min(len(infos), os.cpu_count() or 1, MAX_EXTRACT_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_extract, infos))
@@ -15,6 +15,7 @@ License:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Union
 
@@ -22,7 +23,7 @@ import pandas as pd
 import polars as pl
 
 from finm.data.fama_french._constants import BUNDLED_CSV, LICENSE_INFO
-from finm.data.fama_french._load import load_data
+from finm.data.fama_french._load import load_data, load_long_data
 from finm.data.fama_french._pull import pull_data
 from finm.data.fama_french._transform import to_long_format
 
@@ -114,7 +115,9 @@ def load(
     accept_license : bool, default False
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
-        If True, return a polars LazyFrame instead of DataFrame.
+        If True, return a polars LazyFrame instead of DataFrame. Prefer this
+        when aggregating further (e.g. group-bys on the long format), so the
+        whole query runs in one plan.
 
     Returns
     -------
@@ -126,8 +129,6 @@ def load(
     ValueError
         If pull_if_not_found=True but accept_license=False.
     """
-    from finm.data._utils import pandas_to_polars
-
     # Handle pull_if_not_found
     if pull_if_not_found and data_dir is not None:
         if not accept_license:
@@ -135,9 +136,8 @@ def load(
                 "When pull_if_not_found=True, accept_license must also be True. "
                 "This acknowledges the data provider's license terms."
             )
-        data_path = Path(data_dir)
-        expected_file = f"ff3factors_{frequency}.csv"
-        if not (data_path / expected_file).exists():
+        expected_file = os.path.join(data_dir, f"ff3factors_{frequency}.csv")
+        if not os.path.isfile(expected_file):
             pull_data(
                 data_dir=data_dir,
                 start=start,
@@ -146,14 +146,10 @@ def load(
                 accept_license=True,
             )
 
-    # Load data (internally uses pandas)
-    df = load_data(data_dir=data_dir, start=start, end=end)
-
     if format == "long":
-        df = to_long_format(df)
+        return load_long_data(data_dir=data_dir, start=start, end=end, lazy=lazy)
 
-    # Convert to polars
-    return pandas_to_polars(df, lazy=lazy)
+    return load_data(data_dir=data_dir, start=start, end=end, lazy=lazy)
 
 
 __all__ = ["pull", "load", "to_long_format", "LICENSE_INFO"]
@@ -30,6 +30,17 @@ LICENSE_INFO: Final[dict] = {
 # Bundled data location (within package)
 BUNDLED_DATA_DIR: Final[Path] = Path(__file__).parent / "data"
 BUNDLED_CSV: Final[str] = "ff3factors.csv"
+# Parquet copy of the bundled CSV; read in preference to the CSV when present
+BUNDLED_PARQUET: Final[str] = "ff3factors.parquet"
+# Bundled data already in long format, written alongside the wide copy
+BUNDLED_LONG_PARQUET: Final[str] = "ff3factors_long.parquet"
+# Full paths of the bundled files, built once at import
+BUNDLED_CSV_PATH: Final[Path] = BUNDLED_DATA_DIR / BUNDLED_CSV
+BUNDLED_PARQUET_PATH: Final[Path] = BUNDLED_DATA_DIR / BUNDLED_PARQUET
+BUNDLED_LONG_PARQUET_PATH: Final[Path] = BUNDLED_DATA_DIR / BUNDLED_LONG_PARQUET
+
+# Factor columns in the bundled data, in file order after Date
+FACTOR_COLUMNS: Final[tuple[str, ...]] = ("Mkt-RF", "SMB", "HML", "RF")
 
 # Ken French Data Library dataset names
 DATASET_DAILY: Final[str] = "F-F_Research_Data_Factors_Daily"
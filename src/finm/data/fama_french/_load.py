@@ -2,63 +2,190 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final, Union
 
-import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pv
 
-from finm.data.fama_french._constants import BUNDLED_CSV, BUNDLED_DATA_DIR
+from finm.data._utils import filter_date_range
+from finm.data.fama_french._constants import (
+    BUNDLED_CSV,
+    BUNDLED_CSV_PATH,
+    BUNDLED_LONG_PARQUET_PATH,
+    BUNDLED_PARQUET,
+    BUNDLED_PARQUET_PATH,
+    FACTOR_COLUMNS,
+)
+from finm.data.fama_french._transform import to_long_format
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+# Fixed CSV layout; passing it to the reader skips type inference
+_CSV_SCHEMA: Final[dict[str, pl.DataType]] = {
+    "Date": pl.Datetime("ns"),
+    **dict.fromkeys(FACTOR_COLUMNS, pl.Float64()),
+}
+_ARROW_CSV_TYPES: Final[dict[str, pa.DataType]] = {
+    "Date": pa.timestamp("ns"),
+    **{column: pa.float64() for column in FACTOR_COLUMNS},
+}
+
+
+def _scan_factors(path: Path) -> pl.LazyFrame:
+    """Build a lazy scan of a factor file with typed columns."""
+    if path.suffix == ".parquet":
+        return pl.scan_parquet(path).select("Date", *FACTOR_COLUMNS)
+    return pl.scan_csv(path, schema=_CSV_SCHEMA)
+
+
+@lru_cache(maxsize=4)
+def _read_factors(path: Path, mtime_ns: int) -> pl.DataFrame:
+    """Read a factor file, cached on its path and modification time.
+
+    CSV files are parsed by pyarrow's multi-threaded reader, whose table
+    polars takes over without copying.
+    """
+    if path.suffix == ".parquet":
+        return _scan_factors(path).collect()
+    table = pv.read_csv(
+        path,
+        read_options=pv.ReadOptions(use_threads=True),
+        convert_options=pv.ConvertOptions(
+            column_types=_ARROW_CSV_TYPES,
+            include_columns=list(_ARROW_CSV_TYPES),
+        ),
+    )
+    return pl.DataFrame(pl.from_arrow(table, rechunk=False))
+
+
+@lru_cache(maxsize=4)
+def _read_long_factors(path: Path, mtime_ns: int) -> pl.DataFrame:
+    """Long format of a factor file, cached like ``_read_factors``."""
+    if path == BUNDLED_LONG_PARQUET_PATH:
+        return pl.read_parquet(path).select("unique_id", "ds", "y")
+    # Melt straight from the scan, so the wide frame is never materialized
+    long = to_long_format(_scan_factors(path))
+    assert isinstance(long, pl.LazyFrame)
+    return long.collect()
+
+
+def _data_path(data_dir: Path | str | None) -> Path:
+    """Return the factor file to read, preferring Parquet over CSV."""
+    if data_dir is None:
+        # Load bundled data
+        parquet_path, csv_path = BUNDLED_PARQUET_PATH, BUNDLED_CSV_PATH
+    else:
+        # Load from specified directory
+        data_dir = Path(data_dir)
+        parquet_path, csv_path = data_dir / BUNDLED_PARQUET, data_dir / BUNDLED_CSV
+
+    if parquet_path.exists():
+        return parquet_path
+    if csv_path.exists():
+        return csv_path
+    raise FileNotFoundError(f"Data file not found: {csv_path}")
+
 
 def load_data(
     data_dir: Path | str | None = None,
     start: str | datetime | None = None,
     end: str | datetime | None = None,
-) -> pd.DataFrame:
+    lazy: bool = False,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load Fama-French factors from bundled or cached data.
 
     This function loads pre-downloaded factor data, either from the package's
-    bundled data or from a specified directory.
+    bundled data or from a specified directory. A Parquet copy of the data
+    is read in preference to the CSV when one exists. Parsed files are
+    cached for the life of the process and re-read only when their
+    modification time changes, so repeated loads just slice the cached frame.
+    With ``lazy=True`` nothing is read: the returned plan scans the file when
+    collected, with the date filter pushed into the scan.
 
     Parameters
     ----------
     data_dir : Path or str, optional
-        Directory containing the CSV file. If None, loads bundled data.
+        Directory containing the data file. If None, loads bundled data.
     start : str or datetime, optional
         Start date to filter data. Format: 'YYYY-MM-DD'.
     end : str or datetime, optional
         End date to filter data. Format: 'YYYY-MM-DD'.
+    lazy : bool, default False
+        If True, return a LazyFrame that scans the file when collected.
 
     Returns
     -------
-    pd.DataFrame
-        DataFrame containing the following columns (as decimals):
+    pl.DataFrame or pl.LazyFrame
+        Frame with a Date column and the following factor columns
+        (as decimals):
         - Mkt-RF: Excess return on the market
         - SMB: Small Minus Big (size factor)
         - HML: High Minus Low (value factor)
         - RF: Risk-free rate
+
+    Raises
+    ------
+    FileNotFoundError
+        If neither the Parquet nor the CSV file exists.
     """
-    if data_dir is None:
-        # Load bundled data
-        data_path = BUNDLED_DATA_DIR / BUNDLED_CSV
-    else:
-        # Load from specified directory
-        data_path = Path(data_dir) / BUNDLED_CSV
+    data_path = _data_path(data_dir)
 
-    df = pd.read_csv(
-        data_path,
-        parse_dates=["Date"],
-        index_col="Date",
-        dtype={"Mkt-RF": float, "SMB": float, "HML": float, "RF": float},
-    )
+    if lazy:
+        return filter_date_range(_scan_factors(data_path), "Date", start, end)
+
+    # clone() is shallow; it keeps in-place edits by callers off the cache
+    df = _read_factors(data_path, data_path.stat().st_mtime_ns).clone()
 
     # Filter by date range if specified
-    if start is not None:
-        df = df.loc[start:]
-    if end is not None:
-        df = df.loc[:end]
+    return filter_date_range(df, "Date", start=start, end=end)
+
+
+def load_long_data(
+    data_dir: Path | str | None = None,
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
+    lazy: bool = False,
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Load Fama-French factors in long format.
+
+    The bundled data ships pre-melted, so it is read as is. Other files are
+    melted once per process on eager loads and the result reused, like the
+    wide frames cached by ``load_data``.
+
+    Parameters
+    ----------
+    data_dir : Path or str, optional
+        Directory containing the data file. If None, loads bundled data.
+    start : str or datetime, optional
+        Start date to filter data. Format: 'YYYY-MM-DD'.
+    end : str or datetime, optional
+        End date to filter data. Format: 'YYYY-MM-DD'.
+    lazy : bool, default False
+        If True, return a LazyFrame that scans the file when collected.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Frame with columns [unique_id, ds, y].
+
+    Raises
+    ------
+    FileNotFoundError
+        If neither the Parquet nor the CSV file exists.
+    """
+    if data_dir is None and BUNDLED_LONG_PARQUET_PATH.exists():
+        if lazy:
+            lf = pl.scan_parquet(BUNDLED_LONG_PARQUET_PATH)
+            return filter_date_range(lf, "ds", start, end)
+        data_path = BUNDLED_LONG_PARQUET_PATH
+    elif lazy:
+        return to_long_format(load_data(data_dir, start=start, end=end, lazy=True))
+    else:
+        data_path = _data_path(data_dir)
 
-    return df
+    df = _read_long_factors(data_path, data_path.stat().st_mtime_ns).clone()
+    return filter_date_range(df, "ds", start=start, end=end)
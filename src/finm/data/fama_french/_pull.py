@@ -6,59 +6,46 @@ Website: https://mba.tuck.dartmouth.edu/pages/faculty/ken.french/data_library.ht
 from __future__ import annotations
 
 import logging
+import shutil
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
 
+from finm.data._utils import write_parquet
 from finm.data.fama_french._constants import (
-    BUNDLED_CSV,
-    BUNDLED_DATA_DIR,
+    BUNDLED_LONG_PARQUET_PATH,
+    BUNDLED_PARQUET_PATH,
     DATASET_DAILY,
     DATASET_MONTHLY,
     LICENSE_INFO,
 )
+from finm.data.fama_french._transform import to_long_format
 
 if TYPE_CHECKING:
     from datetime import datetime
 
-# Try to import pandas_datareader (optional dependency)
-try:
-    import pandas_datareader.data as web
-
-    HAS_DATAREADER = True
-except ModuleNotFoundError as e:
-    if "No module named 'distutils'" in str(e):
-        warnings.warn(
-            "Could not import pandas_datareader due to missing distutils. "
-            "Please install setuptools package.",
-            stacklevel=2,
-        )
-    HAS_DATAREADER = False
-    web = None
+FrequencyType = Literal["daily", "monthly"]
 
-# Suppress FutureWarning about date_parser from pandas_datareader
-warnings.filterwarnings("ignore", category=FutureWarning, message=".*date_parser.*")
 
-FrequencyType = Literal["daily", "monthly"]
+_LICENSE_MSG = (
+    f"\n{'='*70}\n"
+    f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
+    f"{'='*70}\n"
+    f"Source: {LICENSE_INFO['terms_url']}\n"
+    f"License: {LICENSE_INFO['license_type']}\n"
+    f"\n{LICENSE_INFO['disclaimer']}\n"
+    f"\nCitation:\n{LICENSE_INFO['citation']}\n"
+    f"\nTo proceed, set accept_license=True\n"
+    f"{'='*70}\n"
+)
 
 
 def _check_license_accepted(accept_license: bool) -> None:
     """Check if the user has accepted the license terms."""
     if not accept_license:
-        msg = (
-            f"\n{'='*70}\n"
-            f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
-            f"{'='*70}\n"
-            f"Source: {LICENSE_INFO['terms_url']}\n"
-            f"License: {LICENSE_INFO['license_type']}\n"
-            f"\n{LICENSE_INFO['disclaimer']}\n"
-            f"\nCitation:\n{LICENSE_INFO['citation']}\n"
-            f"\nTo proceed, set accept_license=True\n"
-            f"{'='*70}\n"
-        )
-        raise ValueError(msg)
+        raise ValueError(_LICENSE_MSG)
 
 
 def pull_data(
@@ -107,11 +94,19 @@ def pull_data(
     """
     _check_license_accepted(accept_license)
 
-    if not HAS_DATAREADER or web is None:
+    # Imported here so that loading data does not pay for pandas_datareader
+    try:
+        import pandas_datareader.data as web
+    except ModuleNotFoundError as e:
+        if "No module named 'distutils'" in str(e):
+            raise ImportError(
+                "Could not import pandas_datareader due to missing distutils. "
+                "Please install setuptools package."
+            ) from e
         raise ImportError(
             "pandas_datareader is required to pull live Fama-French data. "
             "Install with: pip install pandas-datareader"
-        )
+        ) from e
 
     data_dir = Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
@@ -124,18 +119,29 @@ def pull_data(
         raise ValueError(f"frequency must be 'daily' or 'monthly', got '{frequency}'")
 
     logging.info(f"Downloading {dataset_name} from Ken French Data Library...")
-    ff_factors = web.DataReader(dataset_name, "famafrench", start=start, end=end)
+    with warnings.catch_warnings():
+        # Suppress FutureWarning about date_parser from pandas_datareader
+        warnings.filterwarnings(
+            "ignore", category=FutureWarning, message=".*date_parser.*"
+        )
+        ff_factors = web.DataReader(dataset_name, "famafrench", start=start, end=end)
 
-    # First table contains the factors; convert from percentage to decimal
-    df = pd.DataFrame(ff_factors[0]).div(100)
+    # First table contains the factors; convert from percentage to decimal.
+    # The table is ours, so divide in place rather than building a copy.
+    df = ff_factors[0]
+    df /= 100
 
-    # Save to CSV (to match existing bundled format)
+    # Save to CSV (to match existing bundled format) with a Parquet sibling
     output_path = data_dir / f"ff3factors_{frequency}.csv"
     df.to_csv(output_path)
+    parquet_path = write_parquet(df.reset_index(), output_path.with_suffix(".parquet"))
 
-    # Also update the bundled data if saving daily factors
+    # Also update the bundled data if saving daily factors. load() reads the
+    # Parquet copy in preference to the CSV, so copy the file just written
+    # instead of serializing the frame again. A long-format copy is bundled
+    # too, so load(format="long") skips the melt.
     if frequency == "daily":
-        bundled_path = BUNDLED_DATA_DIR / BUNDLED_CSV
-        df.to_csv(bundled_path)
+        shutil.copyfile(parquet_path, BUNDLED_PARQUET_PATH)
+        write_parquet(to_long_format(df), BUNDLED_LONG_PARQUET_PATH)
 
     return df
@@ -2,43 +2,55 @@
 
 from __future__ import annotations
 
+from typing import Union
+
 import pandas as pd
+import polars as pl
 
 
-def to_long_format(df: pd.DataFrame) -> pd.DataFrame:
+def to_long_format(
+    df: Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame],
+) -> Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]:
     """Convert Fama-French factors from wide to long format.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Wide-format DataFrame with date index and factor columns.
+    df : pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Wide-format factors. A pandas frame has a date index; a polars frame
+        has a Date column.
 
     Returns
     -------
-    pd.DataFrame
-        Long-format DataFrame with columns:
+    pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Long-format frame of the same type as the input, with columns:
         - unique_id: Factor name (e.g., "Mkt-RF", "SMB", "HML", "RF")
         - ds: Date
         - y: Factor value
     """
-    # Reset index to make date a column
-    df_reset = df.reset_index()
-    date_col = df_reset.columns[0]  # First column is the date index
-
-    # Melt from wide to long
-    long_df = df_reset.melt(
-        id_vars=[date_col],
-        var_name="unique_id",
-        value_name="y",
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return (
+            df.unpivot(index="Date", variable_name="unique_id", value_name="y")
+            .select(
+                "unique_id",
+                pl.col("Date").alias("ds"),
+                pl.col("y").fill_nan(None),
+            )
+            .drop_nulls("y")
+        )
+
+    # Name the date index ds so it needs no rename after the melt
+    long_df = (
+        df.rename_axis("ds")
+        .reset_index()
+        .melt(
+            id_vars="ds",
+            var_name="unique_id",
+            value_name="y",
+            ignore_index=True,
+        )
     )
 
-    # Rename date column to ds
-    long_df = long_df.rename(columns={date_col: "ds"})
-
-    # Reorder columns
-    long_df = long_df[["unique_id", "ds", "y"]]
-
     # Drop NaN values
-    long_df = long_df.dropna(subset=["y"])
+    long_df = long_df.dropna(subset=["y"]).reset_index(drop=True)
 
-    return long_df.reset_index(drop=True)
+    return long_df[["unique_id", "ds", "y"]]
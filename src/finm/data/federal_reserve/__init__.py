@@ -18,20 +18,18 @@ License:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Literal, Sequence, Union
 
-import pandas as pd
 import polars as pl
 
-from finm.data.federal_reserve._constants import (
-    LICENSE_INFO,
-    PARQUET_ALL,
-    PARQUET_STANDARD,
-)
-from finm.data.federal_reserve._load import load_data
+from finm.data.federal_reserve._constants import LICENSE_INFO, VARIANT_FILES
+from finm.data.federal_reserve._load import read_data, scan_data
 from finm.data.federal_reserve._pull import pull_data
 from finm.data.federal_reserve._transform import to_long_format
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 FormatType = Literal["wide", "long"]
 VariantType = Literal["standard", "all"]
 
@@ -39,11 +37,11 @@ VariantType = Literal["standard", "all"]
 def pull(
     data_dir: Path | str,
     accept_license: bool = False,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> Path:
     """Download Federal Reserve yield curve data.
 
     Downloads the GSW (Gurkaynak, Sack, Wright) yield curve data from
-    the Federal Reserve and saves to parquet files.
+    the Federal Reserve and saves it to parquet.
 
     Website: https://www.federalreserve.gov/data/yield-curve-tables.htm
     Terms: https://www.federalreserve.gov/disclaimer.htm
@@ -57,8 +55,8 @@ def pull(
 
     Returns
     -------
-    tuple[pd.DataFrame, pd.DataFrame]
-        (df_all, df_standard) - Full dataset and filtered dataset.
+    Path
+        Path to the saved parquet file.
 
     Raises
     ------
@@ -71,10 +69,13 @@ def pull(
 def load(
     data_dir: Path | str,
     variant: VariantType = "standard",
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load Federal Reserve yield curve data.
 
@@ -86,6 +87,10 @@ def load(
         Which dataset variant to load:
         - "standard": Only SVENY01-SVENY30 columns
         - "all": Full dataset with all columns
+    start : str or datetime, optional
+        Start date to filter data. Format: 'YYYY-MM-DD'.
+    end : str or datetime, optional
+        End date to filter data. Format: 'YYYY-MM-DD'.
     format : {"wide", "long"}, default "wide"
         Output format:
         - "wide": Original format with yield columns
@@ -96,7 +101,12 @@ def load(
     accept_license : bool, default False
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
-        If True, return a polars LazyFrame instead of DataFrame.
+        If True, return a polars LazyFrame that scans the parquet file
+        instead of reading it; nothing is read until ``.collect()``.
+    columns : sequence of str, optional
+        Only load these yield columns (e.g. ``["SVENY02", "SVENY10"]``). The
+        Date column is always kept, and the long format melts only these
+        columns. Other columns are not read from disk.
 
     Returns
     -------
@@ -110,10 +120,10 @@ def load(
     FileNotFoundError
         If data doesn't exist and pull_if_not_found=False.
     """
-    from finm.data._utils import pandas_to_polars
+    from finm.data._utils import filter_date_range
 
     data_path = Path(data_dir)
-    expected_file = PARQUET_STANDARD if variant == "standard" else PARQUET_ALL
+    expected_file = VARIANT_FILES[variant]
 
     # Handle pull_if_not_found
     if pull_if_not_found:
@@ -125,14 +135,21 @@ def load(
         if not (data_path / expected_file).exists():
             pull_data(data_dir=data_dir, accept_license=True)
 
-    # Load data (internally uses pandas)
-    df = load_data(data_dir=data_dir, variant=variant)
+    result: pl.DataFrame | pl.LazyFrame
+    if lazy or format == "long":
+        # Scan the parquet file so filters and selections reach the reader
+        result = scan_data(data_dir=data_dir, variant=variant, columns=columns)
+    else:
+        result = read_data(data_dir=data_dir, variant=variant, columns=columns)
+    result = filter_date_range(result, "Date", start, end)
 
     if format == "long":
-        df = to_long_format(df)
+        result = to_long_format(result)
+        if not lazy and isinstance(result, pl.LazyFrame):
+            # Scan, filter and unpivot in one pass over the file
+            result = result.collect()
 
-    # Convert to polars
-    return pandas_to_polars(df, lazy=lazy)
+    return result
 
 
 __all__ = ["pull", "load", "to_long_format", "LICENSE_INFO"]
@@ -32,9 +32,30 @@ YIELD_CURVE_URL: Final[str] = (
     "https://www.federalreserve.gov/data/yield-curve-tables/feds200628.csv"
 )
 
-# Parquet file names
+# Parquet file names. Pulls write only PARQUET_ALL; PARQUET_STANDARD was
+# written by earlier versions and is still read if PARQUET_ALL is missing.
 PARQUET_ALL: Final[str] = "fed_yield_curve_all.parquet"
 PARQUET_STANDARD: Final[str] = "fed_yield_curve.parquet"
 
+# Sidecar file holding the ETag/Last-Modified of the last download, used to
+# skip re-downloading an unchanged file
+VALIDATORS_FILE: Final[str] = ".fed_yield_curve.meta.json"
+
 # Standard yield columns (SVENY01 through SVENY30)
-YIELD_COLUMNS: Final[list[str]] = [f"SVENY{str(i).zfill(2)}" for i in range(1, 31)]
+YIELD_COLUMNS: Final[tuple[str, ...]] = tuple(f"SVENY{i:02d}" for i in range(1, 31))
+
+# Map variant to parquet file; "standard" is a column projection of the file
+VARIANT_FILES: Final[dict[str, str]] = {
+    "standard": PARQUET_ALL,
+    "all": PARQUET_ALL,
+}
+
+# Map variant to the columns read (None reads every column)
+VARIANT_COLUMNS: Final[dict[str, tuple[str, ...] | None]] = {
+    "standard": YIELD_COLUMNS,
+    "all": None,
+}
+
+# Rows per parquet row group: about 16 years of daily curves, so date-range
+# scans can skip row groups using their min/max statistics
+ROW_GROUP_SIZE: Final[int] = 4_096
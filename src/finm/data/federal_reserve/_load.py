@@ -2,19 +2,127 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Sequence
 
 import pandas as pd
+import polars as pl
 
-from finm.data.federal_reserve._constants import PARQUET_ALL, PARQUET_STANDARD
+from finm.data._utils import read_parquet
+from finm.data.federal_reserve._constants import (
+    PARQUET_STANDARD,
+    VARIANT_COLUMNS,
+    VARIANT_FILES,
+)
 
 VariantType = Literal["standard", "all"]
 
 
+def _variant_source(
+    data_dir: Path | str,
+    variant: VariantType,
+    columns: Sequence[str] | None,
+) -> tuple[Path, tuple[str, ...] | None]:
+    """Return the parquet file and data columns to read for a variant."""
+    if variant not in VARIANT_FILES:
+        raise ValueError(f"variant must be 'standard' or 'all', got '{variant}'")
+    path = Path(data_dir) / VARIANT_FILES[variant]
+    legacy_path = Path(data_dir) / PARQUET_STANDARD
+    if variant == "standard" and not path.exists() and legacy_path.exists():
+        # The old standard file holds only the yield columns
+        return legacy_path, None if columns is None else tuple(columns)
+    if columns is None:
+        return path, VARIANT_COLUMNS[variant]
+    return path, tuple(columns)
+
+
+def _scan_parquet(path: Path, columns: Sequence[str] | None = None) -> pl.LazyFrame:
+    """Scan a yield curve file with the Date column first."""
+    lf = read_parquet(path, lazy=True)
+    # Files written by pandas store the Date index as the last column
+    if columns is None:
+        return lf.select("Date", pl.exclude("Date"))
+    return lf.select("Date", *columns)
+
+
+@lru_cache(maxsize=8)
+def _read_parquet(
+    path: Path, mtime_ns: int, columns: tuple[str, ...] | None = None
+) -> pl.DataFrame:
+    """Read a yield curve file, cached on its path, mtime and columns."""
+    return _scan_parquet(path, columns).collect()
+
+
+def read_data(
+    data_dir: Path | str,
+    variant: VariantType = "standard",
+    columns: Sequence[str] | None = None,
+) -> pl.DataFrame:
+    """Read Federal Reserve yield curve data from parquet with polars.
+
+    Parameters
+    ----------
+    data_dir : Path or str
+        Directory containing the parquet files.
+    variant : {"standard", "all"}, default "standard"
+        Which dataset variant to read.
+    columns : sequence of str, optional
+        Only read these data columns (e.g. ``["SVENY02", "SVENY10"]``). The
+        Date column is always kept. Other columns are not read from disk.
+
+    Returns
+    -------
+    pl.DataFrame
+        Yield curve data with a Date column.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the parquet file does not exist.
+
+    Notes
+    -----
+    Both variants are read from the full file; "standard" reads only the
+    yield columns. Files are read once per process and cached until their
+    modification time changes.
+    """
+    path, columns = _variant_source(data_dir, variant, columns)
+    if not path.exists():
+        raise FileNotFoundError(f"Data file not found: {path}")
+    return _read_parquet(path, path.stat().st_mtime_ns, columns).clone()
+
+
+def scan_data(
+    data_dir: Path | str,
+    variant: VariantType = "standard",
+    columns: Sequence[str] | None = None,
+) -> pl.LazyFrame:
+    """Scan Federal Reserve yield curve data from parquet without reading it.
+
+    Parameters
+    ----------
+    data_dir : Path or str
+        Directory containing the parquet files.
+    variant : {"standard", "all"}, default "standard"
+        Which dataset variant to scan.
+    columns : sequence of str, optional
+        Only scan these data columns. The Date column is always kept.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Lazy scan with a Date column. Filters and column selections applied
+        downstream are pushed into the parquet reader.
+    """
+    return _scan_parquet(*_variant_source(data_dir, variant, columns))
+
+
 def load_data(
     data_dir: Path | str,
     variant: VariantType = "standard",
+    columns: Sequence[str] | None = None,
+    dtype_backend: Literal["pyarrow"] | None = None,
 ) -> pd.DataFrame:
     """Load Federal Reserve yield curve data from parquet.
 
@@ -26,17 +134,34 @@ def load_data(
         Which dataset variant to load:
         - "standard": Only SVENY01-SVENY30 columns (30 yield columns)
         - "all": Full dataset with all columns
+    columns : sequence of str, optional
+        Only read these data columns (e.g. ``["SVENY02", "SVENY10"]``). The
+        date index is always kept. Other columns are not read from disk.
+    dtype_backend : {"pyarrow"}, optional
+        If "pyarrow", return Arrow-backed columns that share memory with the
+        cached data and convert back to polars without a copy. Missing
+        yields are then nulls rather than NaN. Requires pandas 2.0 or
+        later. By default, columns are NumPy-backed.
 
     Returns
     -------
     pd.DataFrame
         Yield curve data with date index.
-    """
-    data_dir = Path(data_dir)
 
-    if variant == "all":
-        path = data_dir / PARQUET_ALL
-    else:
-        path = data_dir / PARQUET_STANDARD
-
-    return pd.read_parquet(path)
+    Notes
+    -----
+    The file is read through the same cache as :func:`read_data`; each call
+    converts the cached frame into a new pandas frame.
+    """
+    if dtype_backend not in (None, "pyarrow"):
+        raise ValueError(
+            f"dtype_backend must be 'pyarrow' or None, got '{dtype_backend}'"
+        )
+    if dtype_backend == "pyarrow" and int(pd.__version__.split(".")[0]) < 2:
+        raise ImportError(
+            f'dtype_backend="pyarrow" requires pandas>=2.0, found {pd.__version__}'
+        )
+    df = read_data(data_dir, variant, columns)
+    return df.to_pandas(
+        use_pyarrow_extension_array=dtype_backend == "pyarrow"
+    ).set_index("Date")
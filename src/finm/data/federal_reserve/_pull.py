@@ -6,47 +6,71 @@ Terms: https://www.federalreserve.gov/disclaimer.htm
 
 from __future__ import annotations
 
-from io import BytesIO
+import json
 from pathlib import Path
 
-import pandas as pd
-import requests
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pv
 
+from finm.data._utils import get_session, write_parquet
 from finm.data.federal_reserve._constants import (
     LICENSE_INFO,
     PARQUET_ALL,
-    PARQUET_STANDARD,
-    YIELD_COLUMNS,
+    ROW_GROUP_SIZE,
+    VALIDATORS_FILE,
     YIELD_CURVE_URL,
 )
 
+_LICENSE_MSG = (
+    f"\n{'='*70}\n"
+    f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
+    f"{'='*70}\n"
+    f"Source: {LICENSE_INFO['terms_url']}\n"
+    f"License: {LICENSE_INFO['license_type']}\n"
+    f"\n{LICENSE_INFO['disclaimer']}\n"
+    f"\nCitation:\n{LICENSE_INFO['citation']}\n"
+    f"\nTo proceed, set accept_license=True\n"
+    f"{'='*70}\n"
+)
+
 
 def _check_license_accepted(accept_license: bool) -> None:
     """Check if the user has accepted the license terms."""
     if not accept_license:
-        msg = (
-            f"\n{'='*70}\n"
-            f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
-            f"{'='*70}\n"
-            f"Source: {LICENSE_INFO['terms_url']}\n"
-            f"License: {LICENSE_INFO['license_type']}\n"
-            f"\n{LICENSE_INFO['disclaimer']}\n"
-            f"\nCitation:\n{LICENSE_INFO['citation']}\n"
-            f"\nTo proceed, set accept_license=True\n"
-            f"{'='*70}\n"
-        )
-        raise ValueError(msg)
+        raise ValueError(_LICENSE_MSG)
+
+
+def _conditional_headers(data_dir: Path) -> dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from the last download."""
+    if not (data_dir / PARQUET_ALL).exists():
+        return {}
+    try:
+        validators = json.loads((data_dir / VALIDATORS_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
 
 
 def pull_data(
     data_dir: Path | str,
     accept_license: bool = False,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> Path:
     """Download Federal Reserve yield curve data and save to parquet.
 
     Downloads the GSW (Gurkaynak, Sack, Wright) yield curve data from
-    the Federal Reserve and saves both the full dataset and a filtered
-    version with only the standard yield columns (SVENY01-SVENY30).
+    the Federal Reserve and saves the full dataset. The standard yield
+    columns (SVENY01-SVENY30) are loaded from the same file.
+
+    The download is conditional on the ETag/Last-Modified of the previous
+    pull: if the server reports the file unchanged, the saved file is
+    kept without downloading or rewriting it.
 
     Website: https://www.federalreserve.gov/data/yield-curve-tables.htm
     Terms: https://www.federalreserve.gov/disclaimer.htm
@@ -60,8 +84,9 @@ def pull_data(
 
     Returns
     -------
-    tuple[pd.DataFrame, pd.DataFrame]
-        (df_all, df_standard) - Full dataset and filtered dataset.
+    Path
+        Path to the saved parquet file. Read it with ``load`` or
+        ``pl.scan_parquet``; the parsed data is not kept in memory.
 
     Raises
     ------
@@ -73,19 +98,45 @@ def pull_data(
     data_dir = Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download data
-    response = requests.get(YIELD_CURVE_URL)
-    response.raise_for_status()
-    pdf_stream = BytesIO(response.content)
-
-    # Parse CSV (skip header rows)
-    df_all = pd.read_csv(pdf_stream, skiprows=9, index_col=0, parse_dates=True)
+    # Stream the download straight into pyarrow's CSV reader, which parses
+    # blocks as they arrive on several threads instead of waiting for the
+    # whole body (skip the header rows). Only Date is typed up front; the
+    # rest are cast below, so a column that is entirely "NA" still comes
+    # out as a float column.
+    parquet_path = data_dir / PARQUET_ALL
+
+    # Ask the server to skip the body if the file is unchanged since the
+    # last download
+    headers = _conditional_headers(data_dir)
+    with get_session().get(
+        YIELD_CURVE_URL, stream=True, timeout=300, headers=headers
+    ) as response:
+        response.raise_for_status()
+        if response.status_code == 304:
+            print("Fed yield curve unchanged since last pull; using saved data")
+            return parquet_path
+
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        response.raw.decode_content = True
+        table = pv.read_csv(
+            response.raw,
+            read_options=pv.ReadOptions(skip_rows=9),
+            convert_options=pv.ConvertOptions(
+                column_types={"Date": pa.timestamp("ns")},
+                timestamp_parsers=["%Y-%m-%d"],
+                null_values=["", "NA"],
+            ),
+        )
 
-    # Filter to standard yield columns
-    df_standard = df_all[YIELD_COLUMNS]
+    df = pl.DataFrame(pl.from_arrow(table, rechunk=False)).with_columns(
+        pl.exclude("Date").cast(pl.Float64)
+    )
 
-    # Save to parquet
-    df_all.to_parquet(data_dir / PARQUET_ALL)
-    df_standard.to_parquet(data_dir / PARQUET_STANDARD)
+    # Save to parquet; the standard variant is read as a column projection
+    write_parquet(df, parquet_path, row_group_size=ROW_GROUP_SIZE)
+    (data_dir / VALIDATORS_FILE).write_text(json.dumps(validators))
 
-    return df_all, df_standard
+    return parquet_path
@@ -2,46 +2,60 @@
 
 from __future__ import annotations
 
+from typing import Union
+
 import pandas as pd
+import polars as pl
+
+
+def _unpivot(
+    df: Union[pl.DataFrame, pl.LazyFrame], date_column: str
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Melt every column but ``date_column`` into [unique_id, ds, y].
+
+    ``unique_id`` is categorical: a few dozen column names repeated over
+    every row are stored as small integer codes.
+    """
+    return (
+        df.unpivot(index=date_column, variable_name="unique_id", value_name="y")
+        .select(
+            pl.col("unique_id").cast(pl.Categorical),
+            pl.col(date_column).alias("ds"),
+            pl.col("y").fill_nan(None),
+        )
+        .drop_nulls("y")
+    )
 
 
-def to_long_format(df: pd.DataFrame) -> pd.DataFrame:
+def to_long_format(
+    df: Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame],
+) -> Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]:
     """Convert yield curve data from wide to long format.
 
     Transforms the wide-format yield curve data (columns for each maturity)
-    into long format suitable for time series analysis.
+    into long format suitable for time series analysis. The melt runs in
+    polars; pandas input is converted on the way in and out.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        Wide-format DataFrame with date index and yield columns (e.g., SVENY01-SVENY30).
+    df : pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Wide-format yield curve data (e.g., SVENY01-SVENY30). A pandas frame
+        has a date index; a polars frame has a Date column.
 
     Returns
     -------
-    pd.DataFrame
-        Long-format DataFrame with columns:
-        - unique_id: Yield column name (e.g., "SVENY01")
+    pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Long-format frame of the same type as the input, with columns:
+        - unique_id: Yield column name (e.g., "SVENY01"), categorical
         - ds: Date
         - y: Yield value
     """
-    # Reset index to make date a column
-    df_reset = df.reset_index()
-    date_col = df_reset.columns[0]  # First column is the date index
-
-    # Melt from wide to long
-    long_df = df_reset.melt(
-        id_vars=[date_col],
-        var_name="unique_id",
-        value_name="y",
-    )
-
-    # Rename date column to ds
-    long_df = long_df.rename(columns={date_col: "ds"})
-
-    # Reorder columns
-    long_df = long_df[["unique_id", "ds", "y"]]
-
-    # Drop NaN values
-    long_df = long_df.dropna(subset=["y"])
-
-    return long_df.reset_index(drop=True)
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return _unpivot(df, "Date")
+
+    # Hand the date index to polars as the first column without first
+    # copying the frame through reset_index
+    frame = pl.from_pandas(df, include_index=True)
+    long = _unpivot(frame, frame.columns[0])
+    assert isinstance(long, pl.DataFrame)
+    return long.to_pandas()
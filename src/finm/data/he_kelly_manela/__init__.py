@@ -18,31 +18,22 @@ License:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Literal, Union
 
 import pandas as pd
 import polars as pl
 
-from finm.data.he_kelly_manela._constants import (
-    CSV_ALL,
-    CSV_DAILY,
-    CSV_MONTHLY,
-    LICENSE_INFO,
-)
+from finm.data.he_kelly_manela._constants import LICENSE_INFO, VARIANT_FILES
 from finm.data.he_kelly_manela._load import load_data
 from finm.data.he_kelly_manela._pull import pull_data
 from finm.data.he_kelly_manela._transform import to_long_format
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 FormatType = Literal["wide", "long"]
 VariantType = Literal["factors_monthly", "factors_daily", "all"]
 
-# Map variant to expected file
-_VARIANT_FILES = {
-    "factors_monthly": CSV_MONTHLY,
-    "factors_daily": CSV_DAILY,
-    "all": CSV_ALL,
-}
-
 
 def pull(data_dir: Path | str, accept_license: bool = False) -> None:
     """Download He-Kelly-Manela factors and test portfolios.
@@ -73,6 +64,8 @@ def pull(data_dir: Path | str, accept_license: bool = False) -> None:
 def load(
     data_dir: Path | str,
     variant: VariantType = "factors_monthly",
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
@@ -89,6 +82,10 @@ def load(
         - "factors_monthly": Monthly factor data
         - "factors_daily": Daily factor data
         - "all": Factors and test assets (monthly)
+    start : str or datetime, optional
+        Start date to filter data. Format: 'YYYY-MM-DD'.
+    end : str or datetime, optional
+        End date to filter data. Format: 'YYYY-MM-DD'.
     format : {"wide", "long"}, default "wide"
         Output format:
         - "wide": Original format with factor columns
@@ -111,10 +108,10 @@ def load(
     ValueError
         If pull_if_not_found=True but accept_license=False.
     """
-    from finm.data._utils import pandas_to_polars
+    from finm.data._utils import filter_date_range, pandas_to_polars
 
     data_path = Path(data_dir)
-    expected_file = _VARIANT_FILES[variant]
+    expected_file = VARIANT_FILES[variant]
 
     # Handle pull_if_not_found
     if pull_if_not_found:
@@ -129,11 +126,14 @@ def load(
     # Load data (internally uses pandas)
     df = load_data(data_dir=data_dir, variant=variant)
 
+    # Convert to polars, restrict to the requested date range and melt
+    result = pandas_to_polars(df, lazy=lazy)
+    result = filter_date_range(result, "date", start, end)
+
     if format == "long":
-        df = to_long_format(df)
+        result = to_long_format(result)
 
-    # Convert to polars
-    return pandas_to_polars(df, lazy=lazy)
+    return result
 
 
 __all__ = ["pull", "load", "to_long_format", "LICENSE_INFO"]
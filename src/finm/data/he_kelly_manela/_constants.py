@@ -36,6 +36,20 @@ CSV_MONTHLY: Final[str] = "He_Kelly_Manela_Factors_monthly.csv"
 CSV_DAILY: Final[str] = "He_Kelly_Manela_Factors_daily.csv"
 CSV_ALL: Final[str] = "He_Kelly_Manela_Factors_And_Test_Assets_monthly.csv"
 
+# Map variant to CSV file
+VARIANT_FILES: Final[dict[str, str]] = {
+    "factors_monthly": CSV_MONTHLY,
+    "factors_daily": CSV_DAILY,
+    "all": CSV_ALL,
+}
+
+# Map variant to (integer date column, whether it includes the day)
+VARIANT_DATE_COLUMNS: Final[dict[str, tuple[str, bool]]] = {
+    "factors_monthly": ("yyyymm", False),
+    "factors_daily": ("yyyymmdd", True),
+    "all": ("yyyymm", False),
+}
+
 # Factor columns for long format conversion
 FACTOR_COLUMNS: Final[list[str]] = [
     "intermediary_capital_ratio",
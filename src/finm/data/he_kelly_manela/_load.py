@@ -7,11 +7,25 @@ from typing import Literal
 
 import pandas as pd
 
-from finm.data.he_kelly_manela._constants import CSV_ALL, CSV_DAILY, CSV_MONTHLY
+from finm.data.he_kelly_manela._constants import (
+    VARIANT_DATE_COLUMNS,
+    VARIANT_FILES,
+)
 
 VariantType = Literal["factors_monthly", "factors_daily", "all"]
 
 
+def _parse_int_dates(values: pd.Series, daily: bool) -> pd.Series:
+    """Convert yyyymm or yyyymmdd integers to datetimes without string parsing."""
+    if daily:
+        year, rest = divmod(values, 10_000)
+        month, day = divmod(rest, 100)
+    else:
+        year, month = divmod(values, 100)
+        day = 1
+    return pd.to_datetime(pd.DataFrame({"year": year, "month": month, "day": day}))
+
+
 def load_data(
     data_dir: Path | str,
     variant: VariantType = "factors_monthly",
@@ -33,23 +47,13 @@ def load_data(
     pd.DataFrame
         Factor data with parsed date column.
     """
-    data_dir = Path(data_dir)
-
-    if variant == "factors_monthly":
-        path = data_dir / CSV_MONTHLY
-        df = pd.read_csv(path)
-        df["date"] = pd.to_datetime(df["yyyymm"], format="%Y%m")
-    elif variant == "factors_daily":
-        path = data_dir / CSV_DAILY
-        df = pd.read_csv(path)
-        df["date"] = pd.to_datetime(df["yyyymmdd"], format="%Y%m%d")
-    elif variant == "all":
-        path = data_dir / CSV_ALL
-        df = pd.read_csv(path)
-        df["date"] = pd.to_datetime(df["yyyymm"], format="%Y%m")
-    else:
+    if variant not in VARIANT_FILES:
         raise ValueError(
             f"variant must be 'factors_monthly', 'factors_daily', or 'all', got '{variant}'"
         )
 
+    df = pd.read_csv(Path(data_dir) / VARIANT_FILES[variant])
+    date_column, daily = VARIANT_DATE_COLUMNS[variant]
+    df["date"] = _parse_int_dates(df[date_column], daily)
+
     return df
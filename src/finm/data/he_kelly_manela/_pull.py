@@ -6,41 +6,45 @@ Paper: https://doi.org/10.1016/j.jfineco.2017.08.002
 
 from __future__ import annotations
 
-import zipfile
-from io import BytesIO
 from pathlib import Path
+from urllib.parse import urlparse
 
-import requests
 import urllib3
 
+from finm.data._cache import HttpCache, remote_validators
+from finm.data._utils import download_file, extract_zip
 from finm.data.he_kelly_manela._constants import DATA_URL, LICENSE_INFO
 
 # Suppress SSL warnings when verify=False (required for this data source)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+_LICENSE_MSG = (
+    f"\n{'='*70}\n"
+    f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
+    f"{'='*70}\n"
+    f"Source: {LICENSE_INFO['terms_url']}\n"
+    f"License: {LICENSE_INFO['license_type']}\n"
+    f"\n{LICENSE_INFO['disclaimer']}\n"
+    f"\nCitation:\n{LICENSE_INFO['citation']}\n"
+    f"\nTo proceed, set accept_license=True\n"
+    f"{'='*70}\n"
+)
+
+
 def _check_license_accepted(accept_license: bool) -> None:
     """Check if the user has accepted the license terms."""
     if not accept_license:
-        msg = (
-            f"\n{'='*70}\n"
-            f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
-            f"{'='*70}\n"
-            f"Source: {LICENSE_INFO['terms_url']}\n"
-            f"License: {LICENSE_INFO['license_type']}\n"
-            f"\n{LICENSE_INFO['disclaimer']}\n"
-            f"\nCitation:\n{LICENSE_INFO['citation']}\n"
-            f"\nTo proceed, set accept_license=True\n"
-            f"{'='*70}\n"
-        )
-        raise ValueError(msg)
+        raise ValueError(_LICENSE_MSG)
 
 
 def pull_data(data_dir: Path | str, accept_license: bool = False) -> None:
     """Download He-Kelly-Manela factors and test portfolios.
 
     Downloads a zip file containing the HKM factors and extracts it
-    to the specified directory.
+    to the specified directory. If the server reports the same ETag or
+    Last-Modified as the last pull and the extracted files are unchanged,
+    the download is skipped.
 
     Website: https://asaf.manela.org/papers/hkm/intermediarycapitalrisk/
 
@@ -65,11 +69,19 @@ def pull_data(data_dir: Path | str, accept_license: bool = False) -> None:
     data_dir = Path(data_dir)
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download zip file (SSL verification disabled due to certificate issues)
-    response = requests.get(DATA_URL, verify=False)
-    response.raise_for_status()
-
-    # Extract zip contents
-    zip_file = BytesIO(response.content)
-    with zipfile.ZipFile(zip_file, "r") as zip_ref:
-        zip_ref.extractall(data_dir)
+    # Skip the download if the zip is unchanged since the files were
+    # extracted (SSL verification disabled due to certificate issues)
+    http_cache = HttpCache(data_dir)
+    validators = remote_validators(DATA_URL, verify=False)
+    if http_cache.get(DATA_URL, validators) is not None:
+        print("He-Kelly-Manela data unchanged since last pull; using saved data")
+        return
+
+    # Stream the zip file to disk, then extract its members in parallel
+    zip_path = data_dir / Path(urlparse(DATA_URL).path).name
+    download_file(DATA_URL, zip_path, verify=False)
+    try:
+        paths = extract_zip(zip_path, data_dir)
+    finally:
+        zip_path.unlink(missing_ok=True)
+    http_cache.set(DATA_URL, validators, paths)
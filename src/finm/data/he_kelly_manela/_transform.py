@@ -2,48 +2,77 @@
 
 from __future__ import annotations
 
+from typing import Union
+
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from finm.data.he_kelly_manela._constants import FACTOR_COLUMNS
 
 
-def to_long_format(df: pd.DataFrame) -> pd.DataFrame:
+def _unpivot(
+    df: Union[pl.DataFrame, pl.LazyFrame], value_columns: list[str]
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Melt the factor columns of a polars frame into [unique_id, ds, y]."""
+    return (
+        df.unpivot(
+            index="date", on=value_columns, variable_name="unique_id", value_name="y"
+        )
+        .select(
+            "unique_id",
+            pl.col("date").alias("ds"),
+            pl.col("y").fill_nan(None),
+        )
+        .drop_nulls("y")
+    )
+
+
+def to_long_format(
+    df: Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame],
+) -> Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]:
     """Convert He-Kelly-Manela factors from wide to long format.
 
+    Polars input is melted in polars, so a LazyFrame stays lazy; pandas
+    input is built directly from the NumPy values of the factor columns.
+
     Parameters
     ----------
-    df : pd.DataFrame
-        Wide-format DataFrame with date column and factor columns.
+    df : pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Wide-format data with a date column and factor columns.
 
     Returns
     -------
-    pd.DataFrame
-        Long-format DataFrame with columns:
+    pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Long-format frame of the same type as the input, with columns:
         - unique_id: Factor name
         - ds: Date
         - y: Factor value
     """
-    # Determine which factor columns are present
-    available_columns = [col for col in FACTOR_COLUMNS if col in df.columns]
+    if isinstance(df, pl.LazyFrame):
+        columns = set(df.collect_schema().names())
+    else:
+        columns = set(df.columns)
+
+    # Determine which factor columns are present, in FACTOR_COLUMNS order
+    available_columns = [col for col in FACTOR_COLUMNS if col in columns]
 
     if not available_columns:
         raise ValueError(f"No factor columns found. Expected one of: {FACTOR_COLUMNS}")
 
-    # Melt from wide to long
-    long_df = df.melt(
-        id_vars=["date"],
-        value_vars=available_columns,
-        var_name="unique_id",
-        value_name="y",
-    )
-
-    # Rename date column to ds
-    long_df = long_df.rename(columns={"date": "ds"})
-
-    # Reorder columns
-    long_df = long_df[["unique_id", "ds", "y"]]
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return _unpivot(df, available_columns)
 
-    # Drop NaN values
-    long_df = long_df.dropna(subset=["y"])
-
-    return long_df.reset_index(drop=True)
+    # Build each long column once from the factor block in column order
+    values = df[available_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    y = values.ravel(order="F")
+    mask = ~np.isnan(y)
+    return pd.DataFrame(
+        {
+            "unique_id": np.repeat(
+                np.asarray(available_columns, dtype=object), len(df)
+            )[mask],
+            "ds": np.tile(df["date"].to_numpy(), len(available_columns))[mask],
+            "y": y[mask],
+        }
+    )
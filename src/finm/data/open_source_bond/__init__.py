@@ -24,7 +24,7 @@ License:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Literal, Sequence, Union
 
 import pandas as pd
 import polars as pl
@@ -33,15 +33,25 @@ from finm.data.open_source_bond._constants import (
     DATA_INFO,
     DOCUMENTATION,
     LICENSE_INFO,
+    PULL_VARIANT_DATASETS,
+)
+from finm.data.open_source_bond._load import (
+    _find_stored_path,
+    _parquet_path,
+    _scan_partitioned,
 )
-from finm.data.open_source_bond._load import load_data
 from finm.data.open_source_bond._pull import pull_data
 from finm.data.open_source_bond._transform import (
     portfolio_to_long_format,
     to_long_format,
+    write_partitioned_parquet,
+    write_pivot_parquet,
 )
 
-FormatType = Literal["wide", "long"]
+if TYPE_CHECKING:
+    from datetime import datetime
+
+FormatType = Literal["wide", "long", "pivot"]
 VariantType = Literal["treasury", "corporate_daily", "corporate_monthly"]
 PullVariantType = Literal[
     "treasury", "corporate_daily", "corporate_monthly", "corporate_all", "all"
@@ -53,6 +63,7 @@ def pull(
     variant: PullVariantType = "all",
     accept_license: bool = False,
     download_readme: bool = True,
+    use_cache: bool = True,
 ) -> None:
     """Download Open Source Bond data.
 
@@ -77,6 +88,9 @@ def pull(
         The data is provided under the MIT License. Citation is required.
     download_readme : bool, default True
         Whether to save README files when available.
+    use_cache : bool, default True
+        If True, skip datasets whose source file is unchanged since the last
+        pull, judged by its ETag or Last-Modified header.
 
     Raises
     ------
@@ -98,16 +112,21 @@ def pull(
         variant=variant,
         accept_license=accept_license,
         download_readme=download_readme,
+        use_cache=use_cache,
     )
 
 
 def load(
     data_dir: Path | str,
     variant: VariantType = "treasury",
+    start: str | datetime | None = None,
+    end: str | datetime | None = None,
     format: FormatType = "wide",
     pull_if_not_found: bool = False,
     accept_license: bool = False,
     lazy: bool = False,
+    cusips: Sequence[str] | None = None,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load Open Source Bond data.
 
@@ -120,10 +139,16 @@ def load(
         - "treasury": Treasury bond returns
         - "corporate_daily": Daily corporate bond PRICES (not returns)
         - "corporate_monthly": Monthly corporate bond RETURNS with factor signals
-    format : {"wide", "long"}, default "wide"
+    start : str or datetime, optional
+        Start date to filter data. Format: 'YYYY-MM-DD'.
+    end : str or datetime, optional
+        End date to filter data. Format: 'YYYY-MM-DD'.
+    format : {"wide", "long", "pivot"}, default "wide"
         Output format:
         - "wide": Original format with all columns
         - "long": Melted format with [unique_id, ds, y] columns
+        - "pivot": One row per date and one value column per bond
+          (treasury only; read from a file precomputed at pull time)
     pull_if_not_found : bool, default False
         If True and data doesn't exist locally, pull from source.
         Requires accept_license=True.
@@ -131,6 +156,12 @@ def load(
         Must be True when pull_if_not_found=True.
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    cusips : sequence of str, optional
+        Only return these bonds. corporate_daily is stored partitioned by
+        CUSIP prefix, so only the partitions holding these CUSIPs are read.
+    columns : sequence of str, optional
+        Only return these columns (of the output format). Other columns are
+        not read from the parquet file.
 
     Returns
     -------
@@ -157,10 +188,9 @@ def load(
     --------
     https://openbondassetpricing.com/ : Official website
     """
-    from finm.data._utils import pandas_to_polars
+    from finm.data._utils import filter_date_range, read_parquet
 
     data_path = Path(data_dir)
-    expected_file = DATA_INFO[variant]["parquet"]
 
     # Handle pull_if_not_found
     if pull_if_not_found:
@@ -169,17 +199,46 @@ def load(
                 "When pull_if_not_found=True, accept_license must also be True. "
                 "This acknowledges the data provider's license terms."
             )
-        if not (data_path / expected_file).exists():
+        if _find_stored_path(data_dir, variant) is None:
             pull_data(data_dir=data_dir, variant=variant, accept_license=True)
 
-    # Load data (internally uses pandas)
-    df = load_data(data_dir=data_dir, variant=variant)
+    # Scan (lazy) or read the parquet file directly with polars
+    info = DATA_INFO[variant]
+    parquet_path = _parquet_path(data_dir, variant)
+    date_column = info["date_column"]
+
+    # Build a lazy scan so filters and column selections reach the parquet
+    # reader, then collect unless a LazyFrame was requested
+    if format == "pivot":
+        if "pivot_parquet" not in info:
+            raise ValueError(f"format='pivot' is not available for variant '{variant}'")
+        pivot_path = data_path / info["pivot_parquet"]
+        if not pivot_path.exists():
+            # Data pulled before pivot files were written at pull time
+            write_pivot_parquet(data_dir, variant)
+        result = read_parquet(pivot_path, lazy=True)
+        if cusips is not None:
+            pivot_columns = result.collect_schema().names()
+            result = result.select(
+                [date_column] + [c for c in cusips if c in pivot_columns]
+            )
+    else:
+        if parquet_path.is_dir():
+            result = _scan_partitioned(parquet_path, variant, cusips)
+        else:
+            result = read_parquet(parquet_path, lazy=True)
+
+        if cusips is not None:
+            result = result.filter(pl.col(info["id_column"]).is_in(list(cusips)))
 
-    if format == "long":
-        df = to_long_format(df, variant=variant)
+        if format == "long":
+            result = to_long_format(result, variant=variant)
+            date_column = "ds"
 
-    # Convert to polars
-    return pandas_to_polars(df, lazy=lazy)
+    result = filter_date_range(result, date_column, start, end)
+    if columns is not None:
+        result = result.select(columns)
+    return result if lazy else result.collect()
 
 
 __all__ = [
@@ -187,7 +246,10 @@ __all__ = [
     "load",
     "to_long_format",
     "portfolio_to_long_format",
+    "write_pivot_parquet",
+    "write_partitioned_parquet",
     "DATA_INFO",
     "DOCUMENTATION",
     "LICENSE_INFO",
+    "PULL_VARIANT_DATASETS",
 ]
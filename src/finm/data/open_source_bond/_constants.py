@@ -34,6 +34,12 @@ DOCUMENTATION: Final[dict] = {
     "github": "https://github.com/Alexander-M-Dickerson/trace-data-pipeline",
 }
 
+# Warning for the deprecated "corporate" variant, which maps to corporate_monthly
+CORPORATE_DEPRECATION_MSG: Final[str] = (
+    "variant='corporate' is deprecated. Use 'corporate_monthly' for returns "
+    "or 'corporate_daily' for prices. Defaulting to 'corporate_monthly'."
+)
+
 # Minimum expected rows for data validation
 MIN_N_ROWS_EXPECTED: Final[dict] = {
     "treasury": 500,
@@ -48,6 +54,7 @@ DATA_INFO: Final[dict] = {
         "source_format": "csv",
         "csv": "bondret_treasury.csv",
         "parquet": "treasury_bond_returns.parquet",
+        "pivot_parquet": "treasury_bond_returns_pivot.parquet",
         "readme_url": "https://openbondassetpricing.com/wp-content/uploads/2024/06/BNS_README.pdf",
         "readme_file": "treasury_bond_returns_README.pdf",
         "date_column": "date",
@@ -59,6 +66,7 @@ DATA_INFO: Final[dict] = {
         "source_format": "zip_parquet",
         "zip_contents": "stage1_osbap_0k_volume_2025.parquet",
         "parquet": "corporate_bond_prices_daily.parquet",
+        "partition_dir": "corporate_bond_prices_daily",
         "date_column": "trd_exctn_dt",
         "id_column": "cusip_id",
         "value_column": "pr",
@@ -75,3 +83,17 @@ DATA_INFO: Final[dict] = {
         "value_column": "ret_vw",
     },
 }
+
+# Datasets downloaded by the grouped pull variants
+PULL_VARIANT_DATASETS: Final[dict[str, tuple[str, ...]]] = {
+    "all": ("treasury", "corporate_daily", "corporate_monthly"),
+    "corporate_all": ("corporate_daily", "corporate_monthly"),
+}
+
+# Row group size for the precomputed date x id pivot files
+PIVOT_ROW_GROUP_SIZE: Final[int] = 16_384
+
+# Hive partition column for partitioned variants: the first characters of
+# the CUSIP (issuer prefix), so the bucket of any CUSIP is known up front
+PARTITION_COLUMN: Final[str] = "cusip_prefix"
+PARTITION_PREFIX_LENGTH: Final[int] = 2
@@ -9,19 +9,100 @@ Data Dictionary: https://github.com/Alexander-M-Dickerson/trace-data-pipeline/bl
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from stat import S_ISDIR
+from typing import Literal, Sequence
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from finm.data.open_source_bond._constants import DATA_INFO
+from finm.data.open_source_bond._constants import (
+    CORPORATE_DEPRECATION_MSG,
+    DATA_INFO,
+    PARTITION_COLUMN,
+)
+from finm.data.open_source_bond._transform import cusip_prefixes
 
 VariantType = Literal["treasury", "corporate_daily", "corporate_monthly"]
 
 
+def _parquet_path(
+    data_dir: Path | str,
+    variant: VariantType = "treasury",
+) -> Path:
+    """Resolve and check the parquet file for a variant."""
+    # Handle deprecated "corporate" variant
+    if variant == "corporate":
+        warnings.warn(CORPORATE_DEPRECATION_MSG, DeprecationWarning, stacklevel=3)
+        variant = "corporate_monthly"
+
+    if variant not in DATA_INFO:
+        valid_variants = list(DATA_INFO.keys())
+        raise ValueError(
+            f"variant must be one of {valid_variants}, got '{variant}'"
+        )
+
+    parquet_path = _find_stored_path(data_dir, variant)
+    if parquet_path is None:
+        raise FileNotFoundError(
+            f"Data file not found: {Path(data_dir) / DATA_INFO[variant]['parquet']}. "
+            f"Run pull(data_dir, variant='{variant}', accept_license=True) first."
+        )
+
+    return parquet_path
+
+
+@lru_cache(maxsize=8)
+def _read_parquet(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    columns: tuple[str, ...] | None = None,
+) -> pa.Table:
+    """Read a parquet file as an Arrow table, cached on its path, mtime and size."""
+    return pq.read_table(
+        path,
+        columns=None if columns is None else list(columns),
+        use_pandas_metadata=True,
+    )
+
+
+def _find_stored_path(data_dir: Path | str, variant: str) -> Path | None:
+    """Return the pulled file or partitioned directory for a variant, if any."""
+    info = DATA_INFO[variant]
+    data_dir = Path(data_dir)
+    if "partition_dir" in info:
+        partition_dir: Path = data_dir / info["partition_dir"]
+        if partition_dir.is_dir():
+            return partition_dir
+    parquet_path: Path = data_dir / info["parquet"]
+    if parquet_path.exists():
+        return parquet_path
+    return None
+
+
+def _scan_partitioned(
+    partition_dir: Path, variant: VariantType, cusips: Sequence[str] | None = None
+) -> pl.LazyFrame:
+    """Scan a CUSIP-prefix partitioned dataset, reading only needed partitions."""
+    lf = pl.scan_parquet(
+        partition_dir,
+        hive_partitioning=True,
+        hive_schema={PARTITION_COLUMN: pl.String},
+    )
+    if cusips is not None:
+        lf = lf.filter(pl.col(PARTITION_COLUMN).is_in(cusip_prefixes(cusips)))
+    return lf.drop(PARTITION_COLUMN)
+
+
 def load_data(
     data_dir: Path | str,
     variant: VariantType = "treasury",
+    columns: Sequence[str] | None = None,
+    dtype_backend: Literal["pyarrow"] | None = None,
 ) -> pd.DataFrame:
     """Load Open Source Bond data from parquet.
 
@@ -34,6 +115,14 @@ def load_data(
         - "treasury": Treasury bond returns
         - "corporate_daily": Daily corporate bond PRICES (not returns)
         - "corporate_monthly": Monthly corporate bond RETURNS with factor signals
+    columns : sequence of str, optional
+        Only read these columns. Other column chunks are not read from disk,
+        which matters for corporate_monthly and its 108 factor signals.
+    dtype_backend : {"pyarrow"}, optional
+        If "pyarrow", return Arrow-backed columns: CUSIPs become
+        ``string[pyarrow]`` instead of Python objects and numeric columns
+        are not copied into NumPy arrays. Requires pandas 2.0 or later.
+        By default, columns are NumPy-backed.
 
     Returns
     -------
@@ -42,6 +131,10 @@ def load_data(
 
     Notes
     -----
+    - Single-file variants are read once per process and cached until the
+      file's modification time or size changes. Each call converts the
+      cached table into a new DataFrame, so changes to a returned frame do
+      not affect later loads.
     - treasury and corporate_monthly contain RETURNS
     - corporate_daily contains PRICES (use price columns like 'pr', 'prc_vw_par')
     - corporate_monthly includes 108 factor signals for asset pricing research
@@ -51,31 +144,27 @@ def load_data(
     https://openbondassetpricing.com/ : Official website
     https://github.com/Alexander-M-Dickerson/trace-data-pipeline : GitHub repo
     """
-    data_dir = Path(data_dir)
-
-    # Handle deprecated "corporate" variant
-    if variant == "corporate":
-        warnings.warn(
-            "variant='corporate' is deprecated. Use 'corporate_monthly' for returns "
-            "or 'corporate_daily' for prices. Defaulting to 'corporate_monthly'.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
-        variant = "corporate_monthly"
-
-    if variant not in DATA_INFO:
-        valid_variants = list(DATA_INFO.keys())
+    if dtype_backend not in (None, "pyarrow"):
         raise ValueError(
-            f"variant must be one of {valid_variants}, got '{variant}'"
+            f"dtype_backend must be 'pyarrow' or None, got '{dtype_backend}'"
         )
-
-    parquet_file = DATA_INFO[variant]["parquet"]
-    parquet_path = data_dir / parquet_file
-
-    if not parquet_path.exists():
-        raise FileNotFoundError(
-            f"Data file not found: {parquet_path}. "
-            f"Run pull(data_dir, variant='{variant}', accept_license=True) first."
+    if dtype_backend == "pyarrow" and int(pd.__version__.split(".")[0]) < 2:
+        raise ImportError(
+            f'dtype_backend="pyarrow" requires pandas>=2.0, found {pd.__version__}'
         )
 
-    return pd.read_parquet(parquet_path)
+    parquet_path = _parquet_path(data_dir, variant)
+    stat = parquet_path.stat()
+    if S_ISDIR(stat.st_mode):
+        lf = _scan_partitioned(parquet_path, variant)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf.collect().to_pandas(
+            use_pyarrow_extension_array=dtype_backend == "pyarrow"
+        )
+    if columns is not None:
+        columns = tuple(columns)
+    table = _read_parquet(parquet_path, stat.st_mtime_ns, stat.st_size, columns)
+    return table.to_pandas(
+        types_mapper=pd.ArrowDtype if dtype_backend == "pyarrow" else None
+    )
@@ -8,20 +8,31 @@ GitHub: https://github.com/Alexander-M-Dickerson/trace-data-pipeline
 
 from __future__ import annotations
 
-import os
 import warnings
 import zipfile
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Final, Literal
+from urllib.parse import urlparse
 
-import pandas as pd
-import requests
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 
+from finm.data._cache import HttpCache, remote_validators
+from finm.data._utils import download_file, extract_zip, get_session, write_parquet
 from finm.data.open_source_bond._constants import (
+    CORPORATE_DEPRECATION_MSG,
     DATA_INFO,
     LICENSE_INFO,
     MIN_N_ROWS_EXPECTED,
+    PULL_VARIANT_DATASETS,
+)
+from finm.data.open_source_bond._load import _find_stored_path
+from finm.data.open_source_bond._transform import (
+    write_partitioned_parquet,
+    write_pivot_parquet,
 )
 
 VariantType = Literal["treasury", "corporate_daily", "corporate_monthly"]
@@ -30,6 +41,20 @@ PullVariantType = Literal[
 ]
 
 
+_LICENSE_MSG = (
+    f"\n{'='*70}\n"
+    f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
+    f"{'='*70}\n"
+    f"Source: {LICENSE_INFO['terms_url']}\n"
+    f"License: {LICENSE_INFO['license_type']}\n"
+    f"License URL: {LICENSE_INFO['license_url']}\n"
+    f"\n{LICENSE_INFO['disclaimer']}\n"
+    f"\nCitation:\n{LICENSE_INFO['citation']}\n"
+    f"\nTo proceed, set accept_license=True\n"
+    f"{'='*70}\n"
+)
+
+
 def _check_license_accepted(accept_license: bool) -> None:
     """Check if the user has accepted the license terms.
 
@@ -44,23 +69,11 @@ def _check_license_accepted(accept_license: bool) -> None:
         If accept_license is False.
     """
     if not accept_license:
-        msg = (
-            f"\n{'='*70}\n"
-            f"DATA LICENSE ACKNOWLEDGMENT REQUIRED\n"
-            f"{'='*70}\n"
-            f"Source: {LICENSE_INFO['terms_url']}\n"
-            f"License: {LICENSE_INFO['license_type']}\n"
-            f"License URL: {LICENSE_INFO['license_url']}\n"
-            f"\n{LICENSE_INFO['disclaimer']}\n"
-            f"\nCitation:\n{LICENSE_INFO['citation']}\n"
-            f"\nTo proceed, set accept_license=True\n"
-            f"{'='*70}\n"
-        )
-        raise ValueError(msg)
+        raise ValueError(_LICENSE_MSG)
 
 
-def _download_file(url: str, output_path: Path) -> Path:
-    """Download a file from URL.
+def _download_file(url: str, output_path: Path, timeout: float = 300) -> Path:
+    """Download a file from URL, streaming it to disk.
 
     Parameters
     ----------
@@ -68,17 +81,15 @@ def _download_file(url: str, output_path: Path) -> Path:
         URL to download from.
     output_path : Path
         Path to save the file.
+    timeout : float, default 300
+        Request timeout in seconds.
 
     Returns
     -------
     Path
         Path to downloaded file.
     """
-    response = requests.get(url, timeout=300)
-    response.raise_for_status()
-    with open(output_path, "wb") as f:
-        f.write(response.content)
-    return output_path
+    return download_file(url, output_path, timeout=timeout)
 
 
 def _download_and_extract_zip_parquet(
@@ -86,6 +97,8 @@ def _download_and_extract_zip_parquet(
     output_dir: Path,
     expected_parquet: str,
     expected_readme: str | None = None,
+    parquet_name: str | None = None,
+    readme_name: str | None = None,
 ) -> tuple[Path, Path | None]:
     """Download ZIP file and extract parquet (and optionally README).
 
@@ -99,6 +112,12 @@ def _download_and_extract_zip_parquet(
         Expected parquet filename inside ZIP.
     expected_readme : str, optional
         Expected README filename inside ZIP.
+    parquet_name : str, optional
+        File name to extract the parquet member to. Defaults to
+        ``expected_parquet``.
+    readme_name : str, optional
+        File name to extract the README member to. Defaults to
+        ``expected_readme``.
 
     Returns
     -------
@@ -106,61 +125,74 @@ def _download_and_extract_zip_parquet(
         (parquet_path, readme_path) - paths to extracted files.
     """
     print(f"Downloading from {url}...")
-    response = requests.get(url, timeout=600)
-    response.raise_for_status()
+    zip_path = output_dir / Path(urlparse(url).path).name
+    _download_file(url, zip_path, timeout=600)
 
     print("Extracting ZIP contents...")
-    zip_file = BytesIO(response.content)
+    parquet_path = output_dir / (parquet_name or expected_parquet)
     readme_path = None
 
-    with zipfile.ZipFile(zip_file, "r") as zf:
-        if expected_parquet not in zf.namelist():
-            available = ", ".join(zf.namelist())
-            raise ValueError(
-                f"Expected {expected_parquet} not found in ZIP. "
-                f"Available files: {available}"
-            )
-        zf.extract(expected_parquet, output_dir)
-        parquet_path = output_dir / expected_parquet
-
-        if expected_readme and expected_readme in zf.namelist():
-            zf.extract(expected_readme, output_dir)
-            readme_path = output_dir / expected_readme
+    # The archive is only needed until its members are extracted
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            if expected_parquet not in zf.namelist():
+                available = ", ".join(zf.namelist())
+                raise ValueError(
+                    f"Expected {expected_parquet} not found in ZIP. "
+                    f"Available files: {available}"
+                )
+            # Members are written straight to their final names
+            members = {expected_parquet: parquet_path.name}
+            if expected_readme and expected_readme in zf.namelist():
+                readme_path = output_dir / (readme_name or expected_readme)
+                members[expected_readme] = readme_path.name
+
+        extract_zip(zip_path, output_dir, members)
+    finally:
+        zip_path.unlink(missing_ok=True)
 
     return parquet_path, readme_path
 
 
-def _load_and_validate_csv(
-    csv_path: Path, min_rows: int = 500, check_n_rows: bool = True
-) -> pd.DataFrame:
-    """Load CSV and validate row count.
+def _read_csv_stream(url: str, info: dict, timeout: float = 300) -> pl.DataFrame:
+    """Parse a CSV from an HTTP response as it downloads.
+
+    The response body is streamed straight into pyarrow's CSV reader, which
+    parses blocks on several threads as they arrive, so the CSV is never
+    written to disk or held in memory as text. The date, id and value
+    columns are typed up front instead of inferred.
 
     Parameters
     ----------
-    csv_path : Path
-        Path to CSV file.
-    min_rows : int, default 500
-        Minimum expected row count.
-    check_n_rows : bool, default True
-        Whether to validate minimum row count.
+    url : str
+        URL of the CSV file.
+    info : dict
+        Dataset info from DATA_INFO.
+    timeout : float, default 300
+        Timeout in seconds for connecting and for each read.
 
     Returns
     -------
-    pd.DataFrame
-        Loaded DataFrame.
+    pl.DataFrame
+        Parsed data, sorted by date and id.
     """
-    df = pd.read_csv(csv_path)
-
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-
-    if check_n_rows and len(df) < min_rows:
-        raise ValueError(
-            f"Expected at least {min_rows} rows, but found {len(df)}. "
-            "Validate the csv file or set 'check_n_rows=False'."
+    date_column = info["date_column"]
+    with get_session().get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        table = pv.read_csv(
+            response.raw,
+            convert_options=pv.ConvertOptions(
+                column_types={
+                    date_column: pa.timestamp("ns"),
+                    info["id_column"]: pa.string(),
+                    info["value_column"]: pa.float64(),
+                }
+            ),
         )
-
-    return df
+    # Sorted dates let row group statistics skip data on date filters
+    df = pl.DataFrame(pl.from_arrow(table))
+    return df.sort(date_column, info["id_column"], maintain_order=True)
 
 
 def _validate_parquet(parquet_path: Path, min_rows: int) -> None:
@@ -178,16 +210,17 @@ def _validate_parquet(parquet_path: Path, min_rows: int) -> None:
     ValueError
         If row count is below minimum.
     """
-    df = pd.read_parquet(parquet_path)
-    if len(df) < min_rows:
+    n_rows = pq.read_metadata(parquet_path).num_rows
+    if n_rows < min_rows:
         raise ValueError(
-            f"Expected at least {min_rows} rows, but found {len(df)}. "
+            f"Expected at least {min_rows} rows, but found {n_rows}. "
             "Data file may be corrupted or incomplete."
         )
 
 
 def _pull_csv_dataset(
     data_dir: Path,
+    variant_name: str,
     info: dict,
     download_readme: bool = True,
 ) -> None:
@@ -197,23 +230,29 @@ def _pull_csv_dataset(
     ----------
     data_dir : Path
         Directory to save data.
+    variant_name : str
+        Name of the variant (for min_rows lookup and the pivot file).
     info : dict
         Dataset info from DATA_INFO.
     download_readme : bool, default True
         Whether to download README.
     """
     print(f"Downloading {info['csv']}...")
-    csv_path = data_dir / info["csv"]
-    _download_file(info["url"], csv_path)
+    df = _read_csv_stream(info["url"], info)
 
-    min_rows = MIN_N_ROWS_EXPECTED.get("treasury", 500)
-    df = _load_and_validate_csv(csv_path, min_rows=min_rows)
+    min_rows = MIN_N_ROWS_EXPECTED.get(variant_name, 500)
+    if df.height < min_rows:
+        raise ValueError(
+            f"Expected at least {min_rows} rows, but found {df.height}. "
+            "Data file may be corrupted or incomplete."
+        )
 
-    parquet_path = data_dir / info["parquet"]
-    df.to_parquet(parquet_path)
+    parquet_path = write_parquet(df, data_dir / info["parquet"])
     print(f"Saved to {parquet_path}")
 
-    os.remove(csv_path)
+    if "pivot_parquet" in info:
+        pivot_path = write_pivot_parquet(data_dir, variant_name)
+        print(f"Saved pivot to {pivot_path}")
 
     if download_readme and "readme_url" in info:
         readme_path = data_dir / info["readme_file"]
@@ -240,26 +279,70 @@ def _pull_zip_parquet_dataset(
     download_readme : bool, default True
         Whether to save README if present in ZIP.
     """
-    extracted_parquet, extracted_readme = _download_and_extract_zip_parquet(
+    parquet_path, readme_path = _download_and_extract_zip_parquet(
         url=info["url"],
         output_dir=data_dir,
         expected_parquet=info["zip_contents"],
         expected_readme=info.get("readme_contents") if download_readme else None,
+        parquet_name=info["parquet"],
+        readme_name=info.get("readme_file"),
     )
 
     min_rows = MIN_N_ROWS_EXPECTED.get(variant_name, 500)
-    _validate_parquet(extracted_parquet, min_rows)
+    try:
+        _validate_parquet(parquet_path, min_rows)
+    except ValueError:
+        parquet_path.unlink()
+        raise
+    print(f"Saved to {parquet_path}")
+
+    if "partition_dir" in info:
+        print("Partitioning by CUSIP prefix...")
+        partition_dir = write_partitioned_parquet(data_dir, variant_name)
+        print(f"Saved partitioned dataset to {partition_dir}")
+
+    if readme_path is not None:
+        print(f"Saved README to {readme_path}")
+
+
+# Pull function for each source_format in DATA_INFO
+_PULL_HANDLERS: Final[dict[str, Callable[[Path, str, dict, bool], None]]] = {
+    "csv": _pull_csv_dataset,
+    "zip_parquet": _pull_zip_parquet_dataset,
+}
 
-    final_parquet_path = data_dir / info["parquet"]
-    if extracted_parquet != final_parquet_path:
-        extracted_parquet.rename(final_parquet_path)
-    print(f"Saved to {final_parquet_path}")
 
-    if extracted_readme and "readme_file" in info:
-        final_readme_path = data_dir / info["readme_file"]
-        if extracted_readme != final_readme_path:
-            extracted_readme.rename(final_readme_path)
-        print(f"Saved README to {final_readme_path}")
+def _stored_paths(data_dir: Path, dataset_name: str) -> list[Path]:
+    """Return the data files a pull of ``dataset_name`` left in ``data_dir``."""
+    info = DATA_INFO[dataset_name]
+    paths = [_find_stored_path(data_dir, dataset_name)]
+    if "pivot_parquet" in info:
+        paths.append(data_dir / info["pivot_parquet"])
+    return [path for path in paths if path is not None and path.exists()]
+
+
+def _pull_dataset(
+    data_dir: Path, dataset_name: str, download_readme: bool, use_cache: bool = True
+) -> None:
+    """Pull one dataset according to its source format.
+
+    Unless ``use_cache`` is False, the dataset is skipped if the server
+    reports the same ETag or Last-Modified as when its saved files were
+    produced.
+    """
+    info = DATA_INFO[dataset_name]
+    pull_source = _PULL_HANDLERS[info.get("source_format", "csv")]
+
+    print(f"\n--- Pulling {dataset_name} ---")
+
+    http_cache = HttpCache(data_dir)
+    validators = remote_validators(info["url"])
+    if use_cache and http_cache.get(info["url"], validators) is not None:
+        print(f"{dataset_name} unchanged since last pull; using saved data")
+        return
+
+    pull_source(data_dir, dataset_name, info, download_readme)
+    http_cache.set(info["url"], validators, _stored_paths(data_dir, dataset_name))
 
 
 def pull_data(
@@ -267,6 +350,7 @@ def pull_data(
     variant: PullVariantType = "all",
     accept_license: bool = False,
     download_readme: bool = True,
+    use_cache: bool = True,
 ) -> None:
     """Download Open Source Bond data.
 
@@ -291,6 +375,9 @@ def pull_data(
         The data is provided under the MIT License. See LICENSE_INFO for details.
     download_readme : bool, default True
         Whether to save README files when available.
+    use_cache : bool, default True
+        If True, skip datasets whose source file is unchanged since the last
+        pull, judged by its ETag or Last-Modified header.
 
     Returns
     -------
@@ -318,39 +405,36 @@ def pull_data(
 
     # Handle deprecated "corporate" variant
     if variant == "corporate":
-        warnings.warn(
-            "variant='corporate' is deprecated. Use 'corporate_monthly' for returns "
-            "or 'corporate_daily' for prices. Defaulting to 'corporate_monthly'.",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        warnings.warn(CORPORATE_DEPRECATION_MSG, DeprecationWarning, stacklevel=2)
         variant = "corporate_monthly"
 
     # Determine which datasets to download
-    if variant == "all":
-        datasets = ["treasury", "corporate_daily", "corporate_monthly"]
-    elif variant == "corporate_all":
-        datasets = ["corporate_daily", "corporate_monthly"]
-    else:
-        datasets = [variant]
+    datasets = PULL_VARIANT_DATASETS.get(variant, (variant,))
 
+    # Check every dataset before starting any download
     for dataset_name in datasets:
         if dataset_name not in DATA_INFO:
             valid_variants = list(DATA_INFO.keys())
             raise ValueError(
                 f"Unknown variant '{dataset_name}'. Valid variants: {valid_variants}"
             )
-
-        info = DATA_INFO[dataset_name]
-        source_format = info.get("source_format", "csv")
-
-        print(f"\n--- Pulling {dataset_name} ---")
-
-        if source_format == "csv":
-            _pull_csv_dataset(data_dir, info, download_readme)
-        elif source_format == "zip_parquet":
-            _pull_zip_parquet_dataset(data_dir, dataset_name, info, download_readme)
-        else:
+        source_format = DATA_INFO[dataset_name].get("source_format", "csv")
+        if source_format not in _PULL_HANDLERS:
             raise ValueError(f"Unknown source_format: {source_format}")
 
+    if len(datasets) == 1:
+        _pull_dataset(data_dir, datasets[0], download_readme, use_cache)
+    else:
+        # The datasets are independent, so one can be extracted and
+        # converted while the others are still downloading
+        with ThreadPoolExecutor(max_workers=len(datasets)) as executor:
+            futures = [
+                executor.submit(
+                    _pull_dataset, data_dir, name, download_readme, use_cache
+                )
+                for name in datasets
+            ]
+            for future in futures:
+                future.result()
+
     print("\nDone!")
@@ -6,27 +6,51 @@ Data Dictionary: https://github.com/Alexander-M-Dickerson/trace-data-pipeline/bl
 
 from __future__ import annotations
 
-from typing import Literal
+import shutil
+from pathlib import Path
+from typing import Literal, Sequence, TypeVar
 
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
-from finm.data.open_source_bond._constants import DATA_INFO
+from finm.data._utils import (
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_ROW_GROUP_SIZE,
+    select_long_format,
+    write_parquet,
+)
+from finm.data.open_source_bond._constants import (
+    DATA_INFO,
+    PARTITION_COLUMN,
+    PARTITION_PREFIX_LENGTH,
+    PIVOT_ROW_GROUP_SIZE,
+)
 
 VariantType = Literal["treasury", "corporate_daily", "corporate_monthly"]
 
+# Input type of to_long_format, which it returns in long format
+_Frame = TypeVar("_Frame", pd.DataFrame, pl.DataFrame, pl.LazyFrame)
+
 
 def to_long_format(
-    df: pd.DataFrame,
+    df: _Frame,
     id_column: str | None = None,
     date_column: str | None = None,
     value_column: str | None = None,
     variant: VariantType | None = None,
-) -> pd.DataFrame:
+) -> _Frame:
     """Convert bond data to long format.
 
+    Polars input is selected and filtered in polars, so a LazyFrame stays
+    lazy and only the three columns are read from a parquet scan.
+
     Parameters
     ----------
-    df : pd.DataFrame
+    df : pd.DataFrame, pl.DataFrame or pl.LazyFrame
         DataFrame with bond data.
     id_column : str, optional
         Column to use as unique identifier. Auto-detected if variant provided.
@@ -40,9 +64,9 @@ def to_long_format(
 
     Returns
     -------
-    pd.DataFrame
-        Long-format DataFrame with columns:
-        - unique_id: Bond identifier (e.g., CUSIP)
+    pd.DataFrame, pl.DataFrame or pl.LazyFrame
+        Long-format frame of the same type as the input, with columns:
+        - unique_id: Bond identifier (e.g., CUSIP); categorical for pandas
         - ds: Date
         - y: Value (return or price)
 
@@ -71,22 +95,136 @@ def to_long_format(
         value_column = value_column or "bond_ret"
 
     # Validation
-    if id_column not in df.columns:
+    if isinstance(df, pl.LazyFrame):
+        columns = df.collect_schema().names()
+    else:
+        columns = list(df.columns)
+    if id_column not in columns:
         raise ValueError(f"Column '{id_column}' not found in DataFrame")
-    if date_column not in df.columns:
+    if date_column not in columns:
         raise ValueError(f"Column '{date_column}' not found in DataFrame")
-    if value_column not in df.columns:
+    if value_column not in columns:
         raise ValueError(f"Column '{value_column}' not found in DataFrame")
 
-    long_df = df[[id_column, date_column, value_column]].copy()
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return select_long_format(df, id_column, date_column, value_column)
+
+    # Selecting a list of columns already returns a new frame
+    long_df = df[[id_column, date_column, value_column]]
     long_df.columns = ["unique_id", "ds", "y"]
 
     # Drop NaN values
     long_df = long_df.dropna(subset=["y"])
 
+    # Each bond id repeats across many dates; store it once per category
+    long_df["unique_id"] = long_df["unique_id"].astype("category")
+
     return long_df.reset_index(drop=True)
 
 
+def write_pivot_parquet(data_dir: Path | str, variant: str = "treasury") -> Path:
+    """Write the date x id pivot of a variant's value column to parquet.
+
+    The pivot has one row per date and one column per bond, holding the
+    variant's value column (e.g. ``bond_ret`` for treasury). Storing it
+    once at pull time lets ``load(..., format="pivot")`` read columns
+    directly instead of pivoting on every load.
+
+    Parameters
+    ----------
+    data_dir : Path or str
+        Directory containing the variant's parquet file.
+    variant : str, default "treasury"
+        Variant to pivot. Must define ``pivot_parquet`` in DATA_INFO.
+
+    Returns
+    -------
+    Path
+        Path to the pivot parquet file.
+    """
+    info = DATA_INFO[variant]
+    if "pivot_parquet" not in info:
+        raise ValueError(f"No pivot format is available for variant '{variant}'")
+
+    data_dir = Path(data_dir)
+    date_column = info["date_column"]
+    df = pl.read_parquet(
+        data_dir / info["parquet"],
+        columns=[info["id_column"], date_column, info["value_column"]],
+    )
+    pivot = df.pivot(
+        on=info["id_column"],
+        index=date_column,
+        values=info["value_column"],
+        aggregate_function="first",
+        sort_columns=True,
+    ).sort(date_column)
+
+    pivot_path = data_dir / info["pivot_parquet"]
+    return write_parquet(pivot, pivot_path, row_group_size=PIVOT_ROW_GROUP_SIZE)
+
+
+def cusip_prefixes(cusips: Sequence[str]) -> list[str]:
+    """Return the partition values holding the given CUSIPs."""
+    return sorted({c[:PARTITION_PREFIX_LENGTH] for c in cusips})
+
+
+def write_partitioned_parquet(
+    data_dir: Path | str, variant: str = "corporate_daily"
+) -> Path:
+    """Rewrite a variant's parquet file as a dataset partitioned by CUSIP prefix.
+
+    Rows are streamed from the single file into hive-style directories
+    ``<partition_dir>/cusip_prefix=<XX>/`` keyed on the first characters of
+    the id column. A scan filtered on a few CUSIPs then reads only their
+    directories (see ``load(..., cusips=...)``). The single file is removed
+    once the dataset is written.
+
+    Parameters
+    ----------
+    data_dir : Path or str
+        Directory containing the variant's parquet file.
+    variant : str, default "corporate_daily"
+        Variant to partition. Must define ``partition_dir`` in DATA_INFO.
+
+    Returns
+    -------
+    Path
+        Path to the partitioned dataset directory.
+    """
+    info = DATA_INFO[variant]
+    if "partition_dir" not in info:
+        raise ValueError(f"Variant '{variant}' is not stored partitioned")
+
+    data_dir = Path(data_dir)
+    source_path = data_dir / info["parquet"]
+    partition_dir: Path = data_dir / info["partition_dir"]
+
+    source = ds.dataset(source_path, format="parquet")
+    columns = {name: ds.field(name) for name in source.schema.names}
+    columns[PARTITION_COLUMN] = pc.utf8_slice_codeunits(
+        ds.field(info["id_column"]), 0, PARTITION_PREFIX_LENGTH
+    )
+
+    if partition_dir.exists():
+        shutil.rmtree(partition_dir)
+    ds.write_dataset(
+        source.scanner(columns=columns),
+        partition_dir,
+        format="parquet",
+        partitioning=[PARTITION_COLUMN],
+        partitioning_flavor="hive",
+        basename_template="part-{i}.parquet",
+        max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+        ),
+    )
+    source_path.unlink()
+    return partition_dir
+
+
 def portfolio_to_long_format(df: pd.DataFrame) -> pd.DataFrame:
     """Convert portfolio returns from wide to long format.
 
@@ -99,28 +237,22 @@ def portfolio_to_long_format(df: pd.DataFrame) -> pd.DataFrame:
     -------
     pd.DataFrame
         Long-format DataFrame with columns:
-        - unique_id: Portfolio name
+        - unique_id: Portfolio name (categorical)
         - ds: Date
         - y: Return value
     """
-    # Reset index to make date a column
-    df_reset = df.reset_index()
-    date_col = df_reset.columns[0]
-
-    # Melt from wide to long
-    long_df = df_reset.melt(
-        id_vars=[date_col],
-        var_name="unique_id",
-        value_name="y",
+    # Build each long column once, in melt's order: all dates of the first
+    # portfolio, then the next
+    values = df.to_numpy(dtype=np.float64, na_value=np.nan)
+    n_dates, n_portfolios = values.shape
+    y = values.ravel(order="F")
+    mask = ~np.isnan(y)
+    codes = np.repeat(np.arange(n_portfolios), n_dates)[mask]
+    return pd.DataFrame(
+        {
+            # Portfolio names as categories, in the order of the wide columns
+            "unique_id": pd.Categorical.from_codes(codes, categories=df.columns),
+            "ds": np.tile(df.index.to_numpy(), n_portfolios)[mask],
+            "y": y[mask],
+        }
     )
-
-    # Rename date column to ds
-    long_df = long_df.rename(columns={date_col: "ds"})
-
-    # Reorder columns
-    long_df = long_df[["unique_id", "ds", "y"]]
-
-    # Drop NaN values
-    long_df = long_df.dropna(subset=["y"])
-
-    return long_df.reset_index(drop=True)
@@ -13,21 +13,21 @@ Requires WRDS credentials (username).
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Union
+from typing import Literal, Sequence, Union
 
 import pandas as pd
 import polars as pl
 
-from finm.data.wrds._constants import (
-    PARQUET_CORP_BOND,
-    PARQUET_TREASURY_CONSOLIDATED,
-    PARQUET_TREASURY_DAILY,
-    PARQUET_TREASURY_INFO,
-    PARQUET_TREASURY_WITH_RUNNESS,
-)
-from finm.data.wrds._load import load_corp_bond, load_treasury
+from finm.data.wrds._constants import PARQUET_CORP_BOND, PARQUET_TREASURY_CONSOLIDATED
+from finm.data.wrds._load import _treasury_file
 from finm.data.wrds._pull import calc_runness, pull_corp_bond, pull_treasury
-from finm.data.wrds._transform import corp_bond_to_long_format, treasury_to_long_format
+from finm.data.wrds._transform import (
+    _corp_bond_long_columns,
+    _treasury_long_columns,
+    corp_bond_to_long_format,
+    runness_expr,
+    treasury_to_long_format,
+)
 
 FormatType = Literal["wide", "long"]
 DatasetType = Literal["treasury", "corp_bond"]
@@ -102,6 +102,7 @@ def load(
     start_date: str | None = None,
     end_date: str | None = None,
     lazy: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> Union[pl.DataFrame, pl.LazyFrame]:
     """Load WRDS data from local cache.
 
@@ -117,6 +118,7 @@ def load(
         For treasury data, which variant to load.
     with_runness : bool, default True
         For consolidated treasury, whether to load version with runness.
+        If only the consolidated file exists, runness is computed on load.
     pull_if_not_found : bool, default False
         If True and data doesn't exist locally, pull from WRDS.
         Requires wrds_username, start_date, and end_date.
@@ -130,6 +132,9 @@ def load(
         (except for treasury info variant).
     lazy : bool, default False
         If True, return a polars LazyFrame instead of DataFrame.
+    columns : sequence of str, optional
+        Only return these columns (of the output format). Other columns are
+        not read from the parquet file.
 
     Returns
     -------
@@ -141,22 +146,30 @@ def load(
     ValueError
         If pull_if_not_found=True but required credentials/dates not provided.
     """
-    from finm.data._utils import pandas_to_polars
+    from finm.data._utils import read_parquet, select_long_format
 
     data_path = Path(data_dir)
 
     # Determine expected file
     if variant == "treasury":
-        if treasury_variant == "consolidated":
-            expected_file = (
-                PARQUET_TREASURY_WITH_RUNNESS if with_runness else PARQUET_TREASURY_CONSOLIDATED
-            )
-        elif treasury_variant == "daily":
-            expected_file = PARQUET_TREASURY_DAILY
-        else:  # info
-            expected_file = PARQUET_TREASURY_INFO
-    else:  # corp_bond
+        expected_file = _treasury_file(treasury_variant, with_runness)
+    elif variant == "corp_bond":
         expected_file = PARQUET_CORP_BOND
+    else:
+        raise ValueError(f"variant must be 'treasury' or 'corp_bond', got '{variant}'")
+
+    # The runness file is the consolidated file plus a "run" column. If only
+    # the consolidated file is present, add runness in the same query plan
+    # instead of pulling again.
+    derive_runness = (
+        variant == "treasury"
+        and treasury_variant == "consolidated"
+        and with_runness
+        and not (data_path / expected_file).exists()
+        and (data_path / PARQUET_TREASURY_CONSOLIDATED).exists()
+    )
+    if derive_runness:
+        expected_file = PARQUET_TREASURY_CONSOLIDATED
 
     # Handle pull_if_not_found
     if pull_if_not_found:
@@ -190,30 +203,34 @@ def load(
                     end_date=end_date or "",
                 )
 
-    # Load data (internally uses pandas)
-    if variant == "treasury":
-        df = load_treasury(
-            data_dir=data_dir,
-            variant=treasury_variant,
-            with_runness=with_runness,
-        )
-        if format == "long":
-            df = treasury_to_long_format(df)
-    elif variant == "corp_bond":
-        df = load_corp_bond(data_dir=data_dir)
-        if format == "long":
-            df = corp_bond_to_long_format(df)
-    else:
-        raise ValueError(f"variant must be 'treasury' or 'corp_bond', got '{variant}'")
-
-    # Convert to polars
-    return pandas_to_polars(df, lazy=lazy)
+    # Build a lazy scan so column selections reach the parquet reader, then
+    # collect unless a LazyFrame was requested
+    result = read_parquet(data_path / expected_file, lazy=True)
+    if derive_runness:
+        result = result.with_columns(runness_expr())
+
+    if format == "long":
+        frame_columns = result.collect_schema().names()
+        if variant == "treasury":
+            value_column = "price"
+            id_col, date_col = _treasury_long_columns(frame_columns)
+        else:
+            value_column = "ret_eom"
+            id_col, date_col = _corp_bond_long_columns(frame_columns)
+        if value_column not in frame_columns:
+            raise ValueError(f"Column '{value_column}' not found in DataFrame")
+        result = select_long_format(result, id_col, date_col, value_column)
+
+    if columns is not None:
+        result = result.select(columns)
+    return result if lazy else result.collect()
 
 
 __all__ = [
     "pull",
     "load",
     "calc_runness",
+    "runness_expr",
     "treasury_to_long_format",
     "corp_bond_to_long_format",
 ]
@@ -32,3 +32,10 @@ PARQUET_TREASURY_INFO: Final[str] = "CRSP_TFZ_INFO.parquet"
 PARQUET_TREASURY_CONSOLIDATED: Final[str] = "CRSP_TFZ_consolidated.parquet"
 PARQUET_TREASURY_WITH_RUNNESS: Final[str] = "CRSP_TFZ_with_runness.parquet"
 PARQUET_CORP_BOND: Final[str] = "WRDS_Corp_Bond_Monthly.parquet"
+
+# Map treasury variant to parquet file
+TREASURY_VARIANT_FILES: Final[dict[str, str]] = {
+    "daily": PARQUET_TREASURY_DAILY,
+    "info": PARQUET_TREASURY_INFO,
+    "consolidated": PARQUET_TREASURY_CONSOLIDATED,
+}
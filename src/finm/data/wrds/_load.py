@@ -9,15 +9,27 @@ import pandas as pd
 
 from finm.data.wrds._constants import (
     PARQUET_CORP_BOND,
-    PARQUET_TREASURY_CONSOLIDATED,
-    PARQUET_TREASURY_DAILY,
-    PARQUET_TREASURY_INFO,
     PARQUET_TREASURY_WITH_RUNNESS,
+    TREASURY_VARIANT_FILES,
 )
 
 TreasuryVariantType = Literal["daily", "info", "consolidated"]
 
 
+def _treasury_file(
+    variant: TreasuryVariantType = "consolidated",
+    with_runness: bool = True,
+) -> str:
+    """Resolve the parquet file name for a Treasury variant."""
+    if variant not in TREASURY_VARIANT_FILES:
+        raise ValueError(
+            f"variant must be 'daily', 'info', or 'consolidated', got '{variant}'"
+        )
+    if variant == "consolidated" and with_runness:
+        return PARQUET_TREASURY_WITH_RUNNESS
+    return TREASURY_VARIANT_FILES[variant]
+
+
 def load_treasury(
     data_dir: Path | str,
     variant: TreasuryVariantType = "consolidated",
@@ -39,21 +51,8 @@ def load_treasury(
     pd.DataFrame
         Treasury data.
     """
-    data_dir = Path(data_dir)
-
-    if variant == "daily":
-        return pd.read_parquet(data_dir / PARQUET_TREASURY_DAILY)
-    elif variant == "info":
-        return pd.read_parquet(data_dir / PARQUET_TREASURY_INFO)
-    elif variant == "consolidated":
-        if with_runness:
-            return pd.read_parquet(data_dir / PARQUET_TREASURY_WITH_RUNNESS)
-        else:
-            return pd.read_parquet(data_dir / PARQUET_TREASURY_CONSOLIDATED)
-    else:
-        raise ValueError(
-            f"variant must be 'daily', 'info', or 'consolidated', got '{variant}'"
-        )
+    parquet_file = _treasury_file(variant, with_runness)
+    return pd.read_parquet(Path(data_dir) / parquet_file)
 
 
 def load_corp_bond(data_dir: Path | str) -> pd.DataFrame:
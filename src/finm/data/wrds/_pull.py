@@ -6,8 +6,10 @@ from pathlib import Path
 from typing import Literal
 
 import pandas as pd
+import polars as pl
 import wrds
 
+from finm.data._utils import write_parquet
 from finm.data.wrds._constants import (
     PARQUET_CORP_BOND,
     PARQUET_TREASURY_CONSOLIDATED,
@@ -15,6 +17,7 @@ from finm.data.wrds._constants import (
     PARQUET_TREASURY_INFO,
     PARQUET_TREASURY_WITH_RUNNESS,
 )
+from finm.data.wrds._transform import runness_expr
 
 TreasuryVariantType = Literal["daily", "info", "consolidated"]
 
@@ -211,6 +214,12 @@ def _pull_corp_bond(
 def calc_runness(data: pd.DataFrame) -> pd.DataFrame:
     """Calculate on-the-run/off-the-run status for Treasury securities.
 
+    Within each (caldt, original_maturity) group, securities are ranked by
+    issue date ``tdatdt``, newest first: the on-the-run issue gets run 0,
+    the first off-the-run issue 1, and so on. Observations before 1980 get
+    run 0. The ranking is a single polars window expression, see
+    ``runness_expr``.
+
     Parameters
     ----------
     data : pd.DataFrame
@@ -222,21 +231,12 @@ def calc_runness(data: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Input DataFrame with additional 'run' column.
     """
-
-    def _calc_runness(df: pd.DataFrame) -> pd.Series:
-        temp = df.sort_values(by=["caldt", "original_maturity", "tdatdt"])
-        next_temp = (
-            temp.groupby(["caldt", "original_maturity"])["tdatdt"].rank(
-                method="first", ascending=False
-            )
-            - 1
-        )
-        return next_temp
-
-    data_run_ = data[data["caldt"] >= "1980"]
-    runs = _calc_runness(data_run_)
-    data["run"] = 0
-    data.loc[data_run_.index, "run"] = runs
+    runs = (
+        pl.from_pandas(data[["caldt", "original_maturity", "tdatdt"]])
+        .select(runness_expr())
+        .to_series()
+    )
+    data["run"] = runs.to_numpy()
     return data
 
 
@@ -275,19 +275,19 @@ def pull_treasury(
 
     if variant == "daily":
         df = _pull_treasury_daily(start_date, end_date, wrds_username)
-        df.to_parquet(data_dir / PARQUET_TREASURY_DAILY)
+        write_parquet(df, data_dir / PARQUET_TREASURY_DAILY)
 
     elif variant == "info":
         df = _pull_treasury_info(wrds_username)
-        df.to_parquet(data_dir / PARQUET_TREASURY_INFO)
+        write_parquet(df, data_dir / PARQUET_TREASURY_INFO)
 
     elif variant == "consolidated":
         df = _pull_treasury_consolidated(start_date, end_date, wrds_username)
-        df.to_parquet(data_dir / PARQUET_TREASURY_CONSOLIDATED)
+        write_parquet(df, data_dir / PARQUET_TREASURY_CONSOLIDATED)
 
         if with_runness:
             df = calc_runness(df)
-            df.to_parquet(data_dir / PARQUET_TREASURY_WITH_RUNNESS)
+            write_parquet(df, data_dir / PARQUET_TREASURY_WITH_RUNNESS)
 
     return df
 
@@ -320,6 +320,6 @@ def pull_corp_bond(
     data_dir.mkdir(parents=True, exist_ok=True)
 
     df = _pull_corp_bond(start_date, end_date, wrds_username)
-    df.to_parquet(data_dir / PARQUET_CORP_BOND)
+    write_parquet(df, data_dir / PARQUET_CORP_BOND)
 
     return df
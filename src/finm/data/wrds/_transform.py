@@ -2,7 +2,51 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Sequence
+
 import pandas as pd
+import polars as pl
+
+
+def runness_expr() -> pl.Expr:
+    """Polars expression for the on-the-run rank of each Treasury issue.
+
+    Within each (caldt, original_maturity) group, issues are ranked by
+    issue date ``tdatdt``, newest first: the on-the-run issue gets 0, the
+    first off-the-run issue 1, and so on. Observations before 1980 get 0.
+
+    Returns
+    -------
+    pl.Expr
+        Int64 expression named "run".
+    """
+    return (
+        pl.when(pl.col("caldt") >= datetime(1980, 1, 1))
+        .then(
+            pl.col("tdatdt")
+            .rank(method="ordinal", descending=True)
+            .over(["caldt", "original_maturity"])
+            - 1
+        )
+        .otherwise(0)
+        .cast(pl.Int64)
+        .alias("run")
+    )
+
+
+def _treasury_long_columns(columns: Sequence[str]) -> tuple[str, str]:
+    """Return the (id, date) columns of a Treasury frame."""
+    id_col = "kycrspid" if "kycrspid" in columns else "tcusip"
+    date_col = "caldt" if "caldt" in columns else columns[0]
+    return id_col, date_col
+
+
+def _corp_bond_long_columns(columns: Sequence[str]) -> tuple[str, str]:
+    """Return the (id, date) columns of a corporate bond frame."""
+    id_col = "cusip" if "cusip" in columns else "CUSIP"
+    date_col = "date" if "date" in columns else "DATE"
+    return id_col, date_col
 
 
 def treasury_to_long_format(
@@ -26,8 +70,7 @@ def treasury_to_long_format(
         - ds: Date
         - y: Value
     """
-    id_col = "kycrspid" if "kycrspid" in df.columns else "tcusip"
-    date_col = "caldt" if "caldt" in df.columns else df.columns[0]
+    id_col, date_col = _treasury_long_columns(list(df.columns))
 
     if value_column not in df.columns:
         raise ValueError(f"Column '{value_column}' not found in DataFrame")
@@ -62,8 +105,7 @@ def corp_bond_to_long_format(
         - ds: Date
         - y: Return value
     """
-    id_col = "cusip" if "cusip" in df.columns else "CUSIP"
-    date_col = "date" if "date" in df.columns else "DATE"
+    id_col, date_col = _corp_bond_long_columns(list(df.columns))
 
     if value_column not in df.columns:
         raise ValueError(f"Column '{value_column}' not found in DataFrame")
@@ -0,0 +1,77 @@
+"""Tests for the finm data CLI."""
+
+from typer.testing import CliRunner
+
+from finm.data import _cli
+from finm.data._cli import PULLERS, Dataset, app
+
+runner = CliRunner()
+
+
+def test_every_dataset_has_a_puller():
+    """Each Dataset member should dispatch to a pull function."""
+    assert set(PULLERS) == set(Dataset)
+
+
+def test_wrds_pull_requires_dates(tmp_path):
+    """WRDS pulls without a date range should fail before contacting WRDS."""
+    result = runner.invoke(
+        app,
+        ["pull", "wrds_corp_bond", "-d", str(tmp_path), "--wrds-username", "someone"],
+    )
+    assert result.exit_code == 1
+    assert "requires --start-date and --end-date" in result.output
+
+
+def test_non_wrds_pull_skips_credentials(tmp_path, monkeypatch):
+    """Credentials are only resolved when a WRDS dataset is requested."""
+
+    def fail(**kwargs):
+        raise AssertionError("get_credentials should not be called")
+
+    monkeypatch.setattr(_cli, "get_credentials", fail)
+    monkeypatch.setitem(PULLERS, Dataset.fama_french, lambda opts: None)
+    result = runner.invoke(app, ["pull", "fama_french", "-d", str(tmp_path)])
+    assert result.exit_code == 0
+
+
+def test_wrds_pull_requires_username(tmp_path, monkeypatch):
+    """WRDS pulls without a resolvable username fail before any dataset runs."""
+    monkeypatch.setattr(_cli, "get_credentials", lambda **kwargs: {})
+    result = runner.invoke(
+        app,
+        [
+            "pull",
+            "wrds_treasury",
+            "-d",
+            str(tmp_path),
+            "--start-date",
+            "2020-01-01",
+            "--end-date",
+            "2020-12-31",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "WRDS username required" in result.output
+
+
+def test_aliased_datasets_pulled_once(tmp_path, monkeypatch):
+    """Datasets resolving to the same variant should only be pulled once."""
+    calls = []
+    monkeypatch.setattr(
+        _cli,
+        "pull_open_source_bond",
+        lambda **kwargs: calls.append(kwargs["variant"]),
+    )
+    result = runner.invoke(
+        app,
+        [
+            "pull",
+            "open_source_bond_corporate",
+            "open_source_bond_corporate_monthly",
+            "-d",
+            str(tmp_path),
+        ],
+    )
+    assert result.exit_code == 0
+    assert calls == ["corporate_monthly"]
@@ -0,0 +1,60 @@
+"""Tests for credential and data directory resolution."""
+
+import pytest
+
+from finm.data import _credentials
+from finm.data._credentials import get_credentials, get_data_dir
+
+
+@pytest.fixture(autouse=True)
+def _clear_credential_cache():
+    _credentials._credential_cache.clear()
+    yield
+    _credentials._credential_cache.clear()
+
+
+def test_env_file_loaded_once(tmp_path, monkeypatch):
+    """Repeated lookups should parse a given .env file only once."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("WRDS_USERNAME=someone\n")
+    calls = []
+
+    def fake_load_dotenv(path=None):
+        calls.append(path)
+        monkeypatch.setenv("WRDS_USERNAME", "someone")
+        return True
+
+    monkeypatch.setattr(_credentials, "load_dotenv", fake_load_dotenv)
+    _credentials._load_dotenv_once.cache_clear()
+    try:
+        for _ in range(3):
+            creds = get_credentials(env_file=env_file, interactive=False)
+            get_data_dir(env_file=env_file)
+    finally:
+        _credentials._load_dotenv_once.cache_clear()
+
+    assert creds["wrds_username"] == "someone"
+    assert calls == [env_file.resolve()]
+
+
+def test_data_dir_argument_wins(tmp_path, monkeypatch):
+    """An explicit data_dir should take precedence over DATA_DIR."""
+    monkeypatch.setenv("DATA_DIR", "/elsewhere")
+    assert get_data_dir(tmp_path) == tmp_path
+
+
+def test_resolved_username_is_reused(monkeypatch):
+    """A prompted username should be reused; an explicit one should still win."""
+    monkeypatch.delenv("WRDS_USERNAME", raising=False)
+    monkeypatch.setattr(_credentials, "_is_interactive", lambda: True)
+    prompts = []
+    monkeypatch.setattr(
+        _credentials,
+        "_prompt_for_credential",
+        lambda name: prompts.append(name) or "typed",
+    )
+
+    assert get_credentials()["wrds_username"] == "typed"
+    assert get_credentials()["wrds_username"] == "typed"
+    assert get_credentials(wrds_username="explicit")["wrds_username"] == "explicit"
+    assert len(prompts) == 1
@@ -0,0 +1,139 @@
+"""Tests for the pull cache."""
+
+import os
+
+import finm.data as data
+from finm.data._cache import HTTP_CACHE_TTL_ENV, FileCache, HttpCache, cache_key
+
+
+def _write(path, text="x"):
+    path.write_text(text)
+    return path
+
+
+class TestCacheKey:
+    """Tests for cache_key."""
+
+    def test_order_independent(self):
+        """Keys should not depend on argument order."""
+        assert cache_key(a=1, b="2") == cache_key(b="2", a=1)
+
+    def test_distinguishes_params(self):
+        """Different parameters should give different keys."""
+        assert cache_key(start_date="2020-01-01") != cache_key(start_date="2021-01-01")
+
+
+class TestFileCache:
+    """Tests for FileCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """A key should hit only after it has been set."""
+        cache = FileCache.for_data_dir(tmp_path)
+        file = _write(tmp_path / "out.parquet")
+        assert cache.get("k") is None
+        cache.set("k", [file])
+        assert cache.get("k") == [file.resolve()]
+
+    def test_expired_entry_misses(self, tmp_path):
+        """Entries older than the TTL should miss."""
+        cache = FileCache.for_data_dir(tmp_path, ttl_days=0)
+        cache.set("k", [_write(tmp_path / "out.parquet")])
+        assert cache.get("k") is None
+
+    def test_modified_file_misses(self, tmp_path):
+        """Overwriting a cached file should invalidate the entry."""
+        cache = FileCache.for_data_dir(tmp_path)
+        file = _write(tmp_path / "out.parquet")
+        cache.set("k", [file])
+        stat = file.stat()
+        os.utime(file, (stat.st_atime, stat.st_mtime + 10))
+        assert cache.get("k") is None
+
+    def test_deleted_file_misses(self, tmp_path):
+        """Removing a cached file should invalidate the entry."""
+        cache = FileCache.for_data_dir(tmp_path)
+        file = _write(tmp_path / "out.parquet")
+        cache.set("k", [file])
+        file.unlink()
+        assert cache.get("k") is None
+
+
+class TestHttpCache:
+    """Tests for HttpCache."""
+
+    def test_hit_only_with_same_validator(self, tmp_path):
+        """Entries hit when the ETag matches and miss when it changes."""
+        cache = HttpCache(tmp_path)
+        file = _write(tmp_path / "out.parquet")
+        url = "https://example.com/data.csv"
+        assert cache.get(url, {"etag": '"v1"', "last_modified": None}) is None
+
+        cache.set(url, {"etag": '"v1"', "last_modified": None}, [file])
+        assert cache.get(url, {"etag": '"v1"', "last_modified": None}) == [
+            file.resolve()
+        ]
+        assert cache.get(url, {"etag": '"v2"', "last_modified": None}) is None
+
+    def test_last_modified_without_etag(self, tmp_path):
+        """Last-Modified is compared when the server sends no ETag."""
+        cache = HttpCache(tmp_path)
+        file = _write(tmp_path / "out.parquet")
+        old = {"etag": None, "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        new = {"etag": None, "last_modified": "Tue, 02 Jan 2024 00:00:00 GMT"}
+        cache.set("u", old, [file])
+        assert cache.get("u", old) is not None
+        assert cache.get("u", new) is None
+
+    def test_no_validators_never_cached(self, tmp_path):
+        """Without validators a download cannot be shown unchanged."""
+        cache = HttpCache(tmp_path)
+        empty = {"etag": None, "last_modified": None}
+        cache.set("u", empty, [_write(tmp_path / "out.parquet")])
+        assert cache.get("u", empty) is None
+
+    def test_ttl_from_environment(self, tmp_path, monkeypatch):
+        """The TTL can be set with an environment variable."""
+        monkeypatch.setenv(HTTP_CACHE_TTL_ENV, "0")
+        cache = HttpCache(tmp_path)
+        validators = {"etag": '"v1"', "last_modified": None}
+        cache.set("u", validators, [_write(tmp_path / "out.parquet")])
+        assert cache.get("u", validators) is None
+
+
+def test_pull_open_source_bond_defers_to_validators(tmp_path, monkeypatch):
+    """Every pull should reach the ETag check; no TTL cache sits in front."""
+    calls = []
+
+    def fake_pull(data_dir, variant, accept_license, use_cache):
+        calls.append((variant, use_cache))
+
+    monkeypatch.setattr(data.open_source_bond, "pull", fake_pull)
+    data.pull_open_source_bond(tmp_path, variant="treasury", accept_license=True)
+    data.pull_open_source_bond(tmp_path, variant="treasury", accept_license=True)
+    data.pull_open_source_bond(
+        tmp_path, variant="treasury", accept_license=True, use_cache=False
+    )
+    assert calls == [("treasury", True), ("treasury", True), ("treasury", False)]
+
+
+def test_pull_fama_french_factors_reads_cached_file(tmp_path, monkeypatch):
+    """A repeated Fama-French pull should return the saved file."""
+    import pandas as pd
+
+    calls = []
+    table = pd.DataFrame(
+        {"Mkt-RF": [0.01], "SMB": [0.02], "HML": [0.03], "RF": [0.0001]},
+        index=pd.DatetimeIndex(["2024-01-02"], name="Date"),
+    )
+
+    def fake_pull(data_dir, start, end, frequency, accept_license):
+        calls.append(frequency)
+        table.reset_index().to_parquet(tmp_path / f"ff3factors_{frequency}.parquet")
+        return table
+
+    monkeypatch.setattr(data.fama_french, "pull", fake_pull)
+    first = data.pull_fama_french_factors(tmp_path, accept_license=True)
+    second = data.pull_fama_french_factors(tmp_path, accept_license=True)
+    data.pull_fama_french_factors(tmp_path, accept_license=True, use_cache=False)
+    assert calls == ["daily", "daily"]
+    pd.testing.assert_frame_equal(second, first)
@@ -0,0 +1,316 @@
+"""Tests for shared data module utilities."""
+
+import functools
+import http.server
+import os
+import threading
+import zipfile
+from datetime import datetime
+
+import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from finm.data import _utils
+from finm.data._utils import (
+    download_file,
+    extract_zip,
+    filter_date_range,
+    get_session,
+    pandas_to_polars,
+    read_parquet,
+    select_long_format,
+    write_parquet,
+)
+
+
+def _sample_frame() -> pd.DataFrame:
+    index = pd.date_range("2020-01-01", periods=10, freq="D", name="Date")
+    return pd.DataFrame({"x": range(10)}, index=index)
+
+
+class TestPandasToPolars:
+    """Tests for pandas_to_polars conversion."""
+
+    def test_datetime_index_becomes_column(self):
+        """DatetimeIndex should be reset to a column."""
+        df = pandas_to_polars(_sample_frame())
+        assert df.columns == ["Date", "x"]
+
+    def test_lazy_returns_lazyframe(self):
+        """Should return LazyFrame when lazy=True."""
+        lf = pandas_to_polars(_sample_frame(), lazy=True)
+        assert isinstance(lf, pl.LazyFrame)
+
+    def test_index_duplicating_column_is_dropped(self):
+        """A named index that repeats an existing column should not be re-added."""
+        df = _sample_frame().reset_index().set_index("Date", drop=False)
+        assert pandas_to_polars(df).columns == ["Date", "x"]
+
+    def test_nan_becomes_null(self):
+        """NaN floats should arrive in polars as nulls."""
+        df = pd.DataFrame({"y": [1.0, float("nan"), 3.0]})
+        assert pandas_to_polars(df)["y"].null_count() == 1
+
+
+class TestFilterDateRange:
+    """Tests for filter_date_range."""
+
+    def test_no_bounds_is_noop(self):
+        """Without start/end the frame is returned unchanged."""
+        df = pandas_to_polars(_sample_frame())
+        assert filter_date_range(df, "Date").equals(df)
+
+    def test_bounds_are_inclusive(self):
+        """Both endpoints should be kept."""
+        df = pandas_to_polars(_sample_frame())
+        out = filter_date_range(df, "Date", start="2020-01-03", end="2020-01-05")
+        assert out["x"].to_list() == [2, 3, 4]
+
+    def test_accepts_datetime(self):
+        """Should accept datetime bounds as well as strings."""
+        df = pandas_to_polars(_sample_frame())
+        out = filter_date_range(df, "Date", start=datetime(2020, 1, 8))
+        assert out["x"].to_list() == [7, 8, 9]
+
+    def test_lazy_input_stays_lazy(self):
+        """LazyFrame input should produce a LazyFrame."""
+        lf = pandas_to_polars(_sample_frame(), lazy=True)
+        out = filter_date_range(lf, "Date", end="2020-01-02")
+        assert isinstance(out, pl.LazyFrame)
+        assert out.collect().height == 2
+
+
+class TestReadParquet:
+    """Tests for read_parquet."""
+
+    def test_eager_and_lazy(self, tmp_path):
+        """Should read eagerly by default and scan when lazy=True."""
+        path = tmp_path / "sample.parquet"
+        _sample_frame().reset_index().to_parquet(path)
+        df = read_parquet(path)
+        lf = read_parquet(path, lazy=True)
+        assert isinstance(df, pl.DataFrame)
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect().equals(df)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Missing files should raise even when scanning lazily."""
+        with pytest.raises(FileNotFoundError):
+            read_parquet(tmp_path / "missing.parquet", lazy=True)
+
+
+class TestWriteParquet:
+    """Tests for write_parquet."""
+
+    @pytest.mark.parametrize("to_polars", [False, True])
+    def test_zstd_round_trip(self, tmp_path, to_polars):
+        """pandas and polars frames should round-trip with zstd compression."""
+        df = _sample_frame().reset_index()
+        if to_polars:
+            df = pl.from_pandas(df)
+        path = write_parquet(df, tmp_path / "out.parquet", row_group_size=4)
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_row_groups == 3
+        assert meta.row_group(0).column(0).compression == "ZSTD"
+        assert pl.read_parquet(path)["x"].to_list() == list(range(10))
+
+
+class TestSelectLongFormat:
+    """Tests for select_long_format."""
+
+    def test_columns_and_missing_values(self):
+        """Should rename to [unique_id, ds, y] and drop null and NaN values."""
+        df = pl.DataFrame(
+            {
+                "id": ["a", "b", "c"],
+                "date": [1, 2, 3],
+                "value": [1.0, None, float("nan")],
+            }
+        )
+        out = select_long_format(df, "id", "date", "value")
+        assert out.columns == ["unique_id", "ds", "y"]
+        assert out["unique_id"].to_list() == ["a"]
+
+    def test_missing_value_filter_pushed_into_scan(self, tmp_path):
+        """The missing-value filter should be applied by the parquet reader."""
+        path = tmp_path / "data.parquet"
+        df = pl.DataFrame({"id": ["a", "b"], "date": [1, 2], "value": [1.0, None]})
+        df.write_parquet(path)
+        lf = select_long_format(pl.scan_parquet(path), "id", "date", "value")
+        plan = lf.explain()
+        assert "FILTER" not in plan
+        assert "SELECTION" in plan
+
+
+class TestGetSession:
+    """Tests for get_session."""
+
+    def test_shared_session_retries(self):
+        """Every call should return the same session with retrying adapters."""
+        session = get_session()
+        assert get_session() is session
+        for prefix in ("http://", "https://"):
+            assert session.get_adapter(prefix + "example.com").max_retries.total == 3
+
+
+class TestDownloadFile:
+    """Tests for download_file."""
+
+    def test_streams_to_destination(self, tmp_path):
+        """Should write the payload to the destination with no partial file left."""
+        serve_dir = tmp_path / "serve"
+        serve_dir.mkdir()
+        payload = bytes(range(256)) * 5000
+        (serve_dir / "payload.bin").write_bytes(payload)
+
+        handler = functools.partial(
+            http.server.SimpleHTTPRequestHandler, directory=str(serve_dir)
+        )
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/payload.bin"
+            out = download_file(url, tmp_path / "out.bin", chunk_size=4096)
+        finally:
+            server.shutdown()
+
+        assert out.read_bytes() == payload
+        assert not (tmp_path / "out.bin.part").exists()
+
+
+def _range_handler(payload: bytes, honor_ranges: bool, requests_seen: list):
+    """Build a handler serving ``payload`` that advertises byte ranges."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body, extra=None):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", '"v1"')
+            for key, value in (extra or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            return body
+
+        def do_HEAD(self):
+            self._send(200, payload)
+
+        def do_GET(self):
+            requests_seen.append(self.headers.get("Range"))
+            range_header = self.headers.get("Range")
+            if honor_ranges and range_header:
+                start, end = map(int, range_header.split("=")[1].split("-"))
+                body = self._send(
+                    206,
+                    payload[start : end + 1],
+                    {"Content-Range": f"bytes {start}-{end}/{len(payload)}"},
+                )
+            else:
+                body = self._send(200, payload)
+            self.wfile.write(body)
+
+    return Handler
+
+
+class TestDownloadRanges:
+    """Tests for parallel byte-range downloads in download_file."""
+
+    @pytest.mark.parametrize("honor_ranges", [True, False])
+    def test_ranges_reassemble_payload(self, tmp_path, monkeypatch, honor_ranges):
+        """Parts are stitched in order; servers ignoring ranges still work."""
+        monkeypatch.setattr(_utils, "RANGED_DOWNLOAD_MIN_SIZE", 1)
+        payload = bytes(range(256)) * 1001
+        seen = []
+        handler = _range_handler(payload, honor_ranges, seen)
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/payload.bin"
+            out = download_file(url, tmp_path / "out.bin", parts=4)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert out.read_bytes() == payload
+        assert not (tmp_path / "out.bin.part").exists()
+        ranged = [r for r in seen if r is not None]
+        assert len(ranged) == 4
+        if not honor_ranges:
+            # The first full response aborts the ranged attempt; one plain
+            # GET then fetches the file
+            assert seen[-1] is None
+
+
+class TestExtractZip:
+    """Tests for extract_zip."""
+
+    def test_extracts_members_in_parallel(self, tmp_path):
+        """All files, including nested ones, should be extracted intact."""
+        contents = {f"dir/file_{i}.csv": f"a,b\n{i},{i}\n" * 1000 for i in range(5)}
+        contents["top.txt"] = "readme"
+        zip_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, text in contents.items():
+                zf.writestr(name, text)
+
+        out = tmp_path / "out"
+        paths = extract_zip(zip_path, out)
+        assert sorted(paths) == sorted(out / name for name in contents)
+        for name, text in contents.items():
+            assert (out / name).read_text() == text
+
+    def test_selected_members(self, tmp_path):
+        """Only the requested members should be extracted."""
+        zip_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("keep.csv", "x")
+            zf.writestr("skip.csv", "y")
+
+        assert extract_zip(zip_path, tmp_path / "out", ["keep.csv"]) == [
+            tmp_path / "out" / "keep.csv"
+        ]
+        assert not (tmp_path / "out" / "skip.csv").exists()
+
+    def test_rejects_member_outside_output_dir(self, tmp_path):
+        """Members with paths escaping output_dir should not be written."""
+        zip_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("../escape.txt", "x")
+
+        with pytest.raises(ValueError, match="outside"):
+            extract_zip(zip_path, tmp_path / "out")
+        assert not (tmp_path / "escape.txt").exists()
+
+    def test_unchanged_members_not_rewritten(self, tmp_path):
+        """Files matching a member's size and CRC are kept; others are replaced."""
+        zip_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("same.csv", "a,b\n1,2\n")
+            zf.writestr("edited.csv", "a,b\n3,4\n")
+
+        out = tmp_path / "out"
+        extract_zip(zip_path, out)
+        os.utime(out / "same.csv", ns=(0, 0))
+        (out / "edited.csv").write_text("a,b\n3,5\n")
+
+        extract_zip(zip_path, out)
+        assert (out / "same.csv").stat().st_mtime_ns == 0
+        assert (out / "edited.csv").read_text() == "a,b\n3,4\n"
+
+    def test_members_renamed_by_mapping(self, tmp_path):
+        """A mapping of members extracts each one under its new name."""
+        zip_path = tmp_path / "archive.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("nested/source.parquet", "x")
+            zf.writestr("skip.csv", "y")
+
+        out = tmp_path / "out"
+        paths = extract_zip(zip_path, out, {"nested/source.parquet": "final.parquet"})
+        assert paths == [out / "final.parquet"]
+        assert sorted(p.name for p in out.iterdir()) == ["final.parquet"]
@@ -115,4 +115,199 @@ class TestLongFormat:
         # Allow for some NaN values being dropped
         assert len(df_long) <= n_factors * n_dates
 
+    def test_pandas_output_has_fresh_index(self):
+        """Dropped NaN rows should leave a RangeIndex and fixed column order."""
+        df_wide = pd.DataFrame(
+            {"Mkt-RF": [0.01, float("nan")], "SMB": [0.02, 0.03]},
+            index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], name="Date"),
+        )
+        df_long = fama_french.to_long_format(df_wide)
+
+        assert list(df_long.columns) == ["unique_id", "ds", "y"]
+        assert isinstance(df_long.index, pd.RangeIndex)
+        assert df_long.index.tolist() == [0, 1, 2]
+        assert df_long["y"].tolist() == [0.01, 0.02, 0.03]
+
+
+
+
+class TestLoadData:
+    """Tests for the CSV scan behind load()."""
+
+    def test_lazy_scan_applies_date_filter(self):
+        """A lazy load should filter dates when collected."""
+        from finm.data.fama_french._load import load_data
+
+        lf = load_data(start="2022-01-01", end="2022-01-31", lazy=True)
+        assert isinstance(lf, pl.LazyFrame)
+        df = lf.collect()
+        assert df["Date"].min() >= pd.Timestamp("2022-01-01")
+        assert df["Date"].max() <= pd.Timestamp("2022-01-31")
+
+    def test_lazy_load_defers_reading(self, tmp_path):
+        """A lazy load should return a scan plan without reading the file."""
+        from finm.data.fama_french._load import _read_factors
+
+        path = tmp_path / "ff3factors.csv"
+        path.write_text("Date,Mkt-RF,SMB,HML,RF\n2024-01-02,0.01,0.02,0.03,0.0001\n")
+        misses = _read_factors.cache_info().misses
+        lf = fama_french.load(data_dir=tmp_path, format="long", lazy=True)
+        assert _read_factors.cache_info().misses == misses
+        assert "SCAN" in lf.explain()
+        assert lf.collect().height == 4
+
+    def test_missing_file_raises(self, tmp_path):
+        """Loading from a directory without the CSV should raise."""
+        with pytest.raises(FileNotFoundError):
+            fama_french.load(data_dir=tmp_path)
+
+    def test_parsed_csv_is_cached_until_modified(self, tmp_path):
+        """Repeat loads reuse the parse; rewriting the file invalidates it."""
+        import os
+
+        from finm.data.fama_french._load import _read_factors
+
+        path = tmp_path / "ff3factors.csv"
+        path.write_text("Date,Mkt-RF,SMB,HML,RF\n2024-01-02,0.01,0.02,0.03,0.0001\n")
+        first = fama_french.load(data_dir=tmp_path)
+        hits = _read_factors.cache_info().hits
+        fama_french.load(data_dir=tmp_path)
+        assert _read_factors.cache_info().hits == hits + 1
+
+        path.write_text("Date,Mkt-RF,SMB,HML,RF\n2024-01-02,0.05,0.02,0.03,0.0001\n")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        second = fama_french.load(data_dir=tmp_path)
+        assert first["Mkt-RF"][0] == 0.01
+        assert second["Mkt-RF"][0] == 0.05
+
+    def test_parquet_preferred_over_csv(self, tmp_path):
+        """A Parquet copy of the data is read instead of the CSV."""
+        from finm.data._utils import write_parquet
+
+        (tmp_path / "ff3factors.csv").write_text(
+            "Date,Mkt-RF,SMB,HML,RF\n2024-01-02,0.01,0.02,0.03,0.0001\n"
+        )
+        wide = pd.DataFrame(
+            {"Mkt-RF": [0.05], "SMB": [0.02], "HML": [0.03], "RF": [0.0001]},
+            index=pd.DatetimeIndex(["2024-01-02"], name="Date"),
+        )
+        write_parquet(wide.reset_index(), tmp_path / "ff3factors.parquet")
+
+        df = fama_french.load(data_dir=tmp_path)
+        assert df.columns == ["Date", "Mkt-RF", "SMB", "HML", "RF"]
+        assert df["Mkt-RF"][0] == 0.05
+
+
+class TestPolarsLongFormat:
+    """Tests for to_long_format on polars frames."""
+
+    def test_matches_pandas_path(self):
+        """Polars and pandas inputs should melt to the same rows."""
+        df_wide = fama_french.load(end="2021-03-31")
+        expected = fama_french.to_long_format(df_wide.to_pandas().set_index("Date"))
+        result = fama_french.to_long_format(df_wide)
+        assert isinstance(result, pl.DataFrame)
+        assert result.to_pandas().equals(expected)
+
+    def test_lazy_input_drops_missing_values(self):
+        """A LazyFrame stays lazy and NaN or null values are dropped."""
+        lf = pl.LazyFrame(
+            {
+                "Date": [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")],
+                "Mkt-RF": [0.01, float("nan")],
+                "RF": [None, 0.0001],
+            }
+        )
+        result = fama_french.to_long_format(lf)
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect()["y"].to_list() == [0.01, 0.0001]
+
+
+    def test_long_format_is_cached(self):
+        """Repeat long-format loads reuse the melted frame."""
+        from finm.data.fama_french._load import _read_long_factors
+
+        first = fama_french.load(format="long", start="2022-01-01")
+        hits = _read_long_factors.cache_info().hits
+        second = fama_french.load(format="long", start="2022-01-01")
+        assert _read_long_factors.cache_info().hits == hits + 1
+        assert second.equals(first)
+        assert second["ds"].min() >= pd.Timestamp("2022-01-01")
+
+
+    def test_bundled_long_parquet_is_read_directly(self, tmp_path, monkeypatch):
+        """A pre-melted bundled file is used for long loads instead of melting."""
+        from finm.data._utils import write_parquet
+        from finm.data.fama_french import _load
+
+        (tmp_path / "ff3factors.csv").write_text(
+            "Date,Mkt-RF,SMB,HML,RF\n2024-01-02,0.01,0.02,0.03,0.0001\n"
+        )
+        long_df = pd.DataFrame(
+            {
+                "unique_id": ["Mkt-RF", "Mkt-RF"],
+                "ds": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                "y": [0.05, 0.06],
+            }
+        )
+        write_parquet(long_df, tmp_path / "ff3factors_long.parquet")
+        monkeypatch.setattr(_load, "BUNDLED_CSV_PATH", tmp_path / "ff3factors.csv")
+        monkeypatch.setattr(
+            _load, "BUNDLED_PARQUET_PATH", tmp_path / "ff3factors.parquet"
+        )
+        monkeypatch.setattr(
+            _load, "BUNDLED_LONG_PARQUET_PATH", tmp_path / "ff3factors_long.parquet"
+        )
+
+        eager = fama_french.load(format="long", end="2024-01-02")
+        lazy = fama_french.load(format="long", end="2024-01-02", lazy=True)
+        assert eager["y"].to_list() == [0.05]
+        assert lazy.collect().equals(eager)
+
+
+class TestPull:
+    """Tests for fama_french.pull() argument handling."""
+
+    def test_requires_license(self, tmp_path):
+        """Pulling without accepting the license should raise."""
+        with pytest.raises(ValueError, match="LICENSE"):
+            fama_french.pull(data_dir=tmp_path)
+
+    def test_missing_datareader_raises_import_error(self, tmp_path, monkeypatch):
+        """pandas_datareader is only needed, and only imported, when pulling."""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "pandas_datareader", None)
+        monkeypatch.setitem(sys.modules, "pandas_datareader.data", None)
+        with pytest.raises(ImportError, match="pandas-datareader"):
+            fama_french.pull(data_dir=tmp_path, accept_license=True)
+
+    def test_writes_csv_and_parquet(self, tmp_path, monkeypatch):
+        """A pull saves the factors as CSV with a Parquet sibling."""
+        import sys
+        import types
+
+        table = pd.DataFrame(
+            {
+                "Mkt-RF": [1.25, -0.5],
+                "SMB": [0.1, 0.2],
+                "HML": [0.3, 0.4],
+                "RF": [0.01, 0.01],
+            },
+            index=pd.DatetimeIndex(["2024-01-31", "2024-02-29"], name="Date"),
+        )
+        data = types.SimpleNamespace(DataReader=lambda *args, **kwargs: {0: table})
+        package = types.SimpleNamespace(data=data)
+        monkeypatch.setitem(sys.modules, "pandas_datareader", package)
+        monkeypatch.setitem(sys.modules, "pandas_datareader.data", data)
+
+        df = fama_french.pull(
+            data_dir=tmp_path, frequency="monthly", accept_license=True
+        )
+        assert df["Mkt-RF"].tolist() == [0.0125, -0.005]
 
+        from_csv = pd.read_csv(
+            tmp_path / "ff3factors_monthly.csv", parse_dates=["Date"]
+        )
+        from_parquet = pd.read_parquet(tmp_path / "ff3factors_monthly.parquet")
+        pd.testing.assert_frame_equal(from_parquet, from_csv, check_dtype=False)
@@ -0,0 +1,213 @@
+"""Tests for the Federal Reserve yield curve data module."""
+
+import functools
+import http.server
+import io
+import threading
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from finm.data import federal_reserve
+from finm.data.federal_reserve import _pull
+from finm.data.federal_reserve._constants import (
+    PARQUET_ALL,
+    PARQUET_STANDARD,
+    VALIDATORS_FILE,
+    YIELD_COLUMNS,
+)
+
+PREAMBLE = "\n".join(
+    [
+        '"The Federal Reserve Board"',
+        '"Gurkaynak, Sack, and Wright"',
+        '"The U.S. Treasury Yield Curve: 1961 to the Present"',
+        "",
+        '"Yields in percent"',
+        "",
+        "",
+        "",
+        "",
+    ]
+)
+
+
+def _fed_csv() -> str:
+    """Build a small file laid out like feds200628.csv."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2020-01-02", periods=40)
+    columns = ["BETA0", *YIELD_COLUMNS, "TAU1", "EMPTY"]
+    df = pd.DataFrame(
+        rng.normal(2, 0.5, (len(dates), len(columns))).round(4),
+        index=pd.Index(dates.strftime("%Y-%m-%d"), name="Date"),
+        columns=columns,
+    )
+    df.iloc[::5, 3] = np.nan
+    df["EMPTY"] = np.nan
+    return PREAMBLE + "\n" + df.to_csv(na_rep="NA")
+
+
+@pytest.fixture
+def fed_server(tmp_path, monkeypatch):
+    """Serve a sample feds200628.csv over HTTP and point the pull at it."""
+    serve_dir = tmp_path / "serve"
+    serve_dir.mkdir()
+    content = _fed_csv()
+    (serve_dir / "feds200628.csv").write_text(content)
+
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(serve_dir)
+    )
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/feds200628.csv"
+    monkeypatch.setattr(_pull, "YIELD_CURVE_URL", url)
+    yield content
+    server.shutdown()
+    server.server_close()
+
+
+class TestPull:
+    """Tests for federal_reserve.pull()."""
+
+    def test_requires_license(self, tmp_path):
+        """Pulling without accepting the license should raise."""
+        with pytest.raises(ValueError, match="LICENSE"):
+            federal_reserve.pull(data_dir=tmp_path)
+
+    def test_matches_pandas_parse(self, tmp_path, fed_server):
+        """The saved file should match a plain pandas parse of the CSV."""
+        expected = pd.read_csv(
+            io.StringIO(fed_server), skiprows=9, index_col=0, parse_dates=True
+        ).astype(float)
+
+        path = federal_reserve.pull(data_dir=tmp_path / "data", accept_license=True)
+        assert path == tmp_path / "data" / PARQUET_ALL
+        pd.testing.assert_frame_equal(pd.read_parquet(path).set_index("Date"), expected)
+
+    def test_saved_files_load(self, tmp_path, fed_server):
+        """Both variants should load back from the saved parquet file."""
+        data_dir = tmp_path / "data"
+        path = federal_reserve.pull(data_dir=data_dir, accept_license=True)
+
+        standard = federal_reserve.load(data_dir=data_dir)
+        assert standard.columns == ["Date", *YIELD_COLUMNS]
+        assert standard.schema["Date"] == pl.Datetime("ns")
+
+        full = federal_reserve.load(data_dir=data_dir, variant="all", format="long")
+        assert full.height == pd.read_parquet(path).drop(columns="Date").count().sum()
+
+    def test_unchanged_file_is_not_downloaded_again(self, tmp_path, fed_server, capsys):
+        """A 304 response keeps the saved file without rewriting it."""
+        path = federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        mtime = path.stat().st_mtime_ns
+
+        assert federal_reserve.pull(data_dir=tmp_path, accept_license=True) == path
+        assert "unchanged" in capsys.readouterr().out
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_writes_only_full_file(self, tmp_path, fed_server):
+        """The standard variant is a projection of the single saved file."""
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        assert [p.name for p in tmp_path.glob("*.parquet")] == [PARQUET_ALL]
+
+
+class TestToLongFormat:
+    """Tests for federal_reserve.to_long_format()."""
+
+    def test_polars_matches_pandas(self):
+        """Polars and pandas inputs should melt to the same rows."""
+        df = pd.read_csv(
+            io.StringIO(_fed_csv()), skiprows=9, index_col=0, parse_dates=True
+        )
+        from_pandas = federal_reserve.to_long_format(df)
+        from_polars = federal_reserve.to_long_format(pl.from_pandas(df.reset_index()))
+
+        assert isinstance(from_pandas, pd.DataFrame)
+        assert list(from_pandas.columns) == ["unique_id", "ds", "y"]
+        assert len(from_pandas) == df.notna().sum().sum()
+        assert from_polars.height == len(from_pandas)
+        assert from_polars["y"].null_count() == 0
+        assert isinstance(from_pandas["unique_id"].dtype, pd.CategoricalDtype)
+        assert from_polars.schema["unique_id"] == pl.Categorical
+
+
+class TestLoadData:
+    """Tests for the parquet reads behind load()."""
+
+    def test_reads_are_cached_until_modified(self, tmp_path, fed_server):
+        """Repeat loads reuse the parsed file; a new pull invalidates it."""
+        from finm.data.federal_reserve._load import _read_parquet, load_data
+
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        first = load_data(tmp_path)
+        first["extra"] = 1.0
+        hits = _read_parquet.cache_info().hits
+        second = load_data(tmp_path)
+        assert _read_parquet.cache_info().hits == hits + 1
+        assert "extra" not in second.columns
+
+        misses = _read_parquet.cache_info().misses
+        (tmp_path / VALIDATORS_FILE).unlink()
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        load_data(tmp_path)
+        assert _read_parquet.cache_info().misses == misses + 1
+
+    def test_pyarrow_dtype_backend(self, tmp_path, fed_server, monkeypatch):
+        """Arrow-backed frames hold the same data and convert back to polars."""
+        from finm.data._utils import pandas_to_polars
+        from finm.data.federal_reserve._load import load_data
+
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        df = load_data(tmp_path, "all", dtype_backend="pyarrow")
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert pandas_to_polars(df).equals(federal_reserve.load(tmp_path, "all"))
+
+        with pytest.raises(ValueError, match="dtype_backend"):
+            load_data(tmp_path, dtype_backend="numpy_nullable")
+
+        monkeypatch.setattr(pd, "__version__", "1.5.3")
+        with pytest.raises(ImportError, match="pandas>=2.0"):
+            load_data(tmp_path, dtype_backend="pyarrow")
+
+    def test_columns_projection(self, tmp_path, fed_server):
+        """Only the requested columns are loaded; Date is always kept."""
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        wide = federal_reserve.load(
+            data_dir=tmp_path, variant="all", columns=["SVENY02", "TAU1"]
+        )
+        assert wide.columns == ["Date", "SVENY02", "TAU1"]
+
+        long = federal_reserve.load(
+            data_dir=tmp_path, format="long", columns=["SVENY10"], lazy=True
+        )
+        assert long.collect()["unique_id"].unique().to_list() == ["SVENY10"]
+
+    def test_lazy_scans_parquet(self, tmp_path, fed_server):
+        """lazy=True scans the file and matches the eager result."""
+        from finm.data.federal_reserve._load import _read_parquet
+
+        federal_reserve.pull(data_dir=tmp_path, accept_license=True)
+        misses = _read_parquet.cache_info().misses
+        lf = federal_reserve.load(
+            data_dir=tmp_path, variant="all", start="2020-01-10", lazy=True
+        )
+        assert isinstance(lf, pl.LazyFrame)
+        assert _read_parquet.cache_info().misses == misses
+
+        eager = federal_reserve.load(
+            data_dir=tmp_path, variant="all", start="2020-01-10"
+        )
+        assert lf.collect().equals(eager)
+
+    def test_reads_legacy_standard_file(self, tmp_path):
+        """Data directories with only the old standard file still load."""
+        df = pl.DataFrame(
+            {"Date": pd.to_datetime(["2020-01-02", "2020-01-03"]), "SVENY01": 1.0}
+        )
+        df.write_parquet(tmp_path / PARQUET_STANDARD)
+        assert federal_reserve.load(data_dir=tmp_path).equals(df)
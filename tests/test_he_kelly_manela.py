@@ -0,0 +1,100 @@
+"""Tests for the He-Kelly-Manela data module."""
+
+import functools
+import http.server
+import threading
+import zipfile
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from finm.data import he_kelly_manela
+from finm.data.he_kelly_manela import _pull, to_long_format
+from finm.data.he_kelly_manela._constants import VARIANT_FILES
+from finm.data.he_kelly_manela._load import load_data
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Directory holding small monthly and daily factor files."""
+    pd.DataFrame(
+        {"yyyymm": [197001, 199912, 202402], "intermediary_capital_ratio": 0.1}
+    ).to_csv(tmp_path / VARIANT_FILES["factors_monthly"], index=False)
+    pd.DataFrame(
+        {"yyyymmdd": [20000103, 20121231, 20240229], "intermediary_capital_ratio": 0.1}
+    ).to_csv(tmp_path / VARIANT_FILES["factors_daily"], index=False)
+    return tmp_path
+
+
+class TestPull:
+    """Tests for he_kelly_manela.pull()."""
+
+    def test_extracts_streamed_zip(self, tmp_path, data_dir, monkeypatch):
+        """The archive should be extracted once and not fetched again unchanged."""
+        serve_dir = tmp_path / "serve"
+        serve_dir.mkdir()
+        names = [VARIANT_FILES["factors_monthly"], VARIANT_FILES["factors_daily"]]
+        with zipfile.ZipFile(serve_dir / "factors.zip", "w") as zf:
+            for name in names:
+                zf.write(data_dir / name, name)
+
+        handler = functools.partial(
+            http.server.SimpleHTTPRequestHandler, directory=str(serve_dir)
+        )
+        handler.log_message = lambda *args: None
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/factors.zip"
+        monkeypatch.setattr(_pull, "DATA_URL", url)
+        try:
+            he_kelly_manela.pull(tmp_path / "out", accept_license=True)
+            # The server reports the same Last-Modified, so nothing is fetched
+            monkeypatch.setattr(_pull, "download_file", lambda *args, **kw: 1 / 0)
+            he_kelly_manela.pull(tmp_path / "out", accept_license=True)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        for name in names:
+            assert (tmp_path / "out" / name).read_bytes() == (
+                data_dir / name
+            ).read_bytes()
+
+
+class TestLoadData:
+    """Tests for the CSV reads behind load()."""
+
+    @pytest.mark.parametrize(
+        "variant, column, date_format",
+        [
+            ("factors_monthly", "yyyymm", "%Y%m"),
+            ("factors_daily", "yyyymmdd", "%Y%m%d"),
+        ],
+    )
+    def test_dates_match_strptime(self, data_dir, variant, column, date_format):
+        """Integer date columns should parse the same as with a format string."""
+        df = load_data(data_dir, variant)
+        expected = pd.to_datetime(df[column].astype(str), format=date_format)
+        pd.testing.assert_series_equal(df["date"], expected, check_names=False)
+
+
+class TestToLongFormat:
+    """Tests for to_long_format()."""
+
+    def test_polars_matches_pandas(self, data_dir):
+        """Polars and pandas inputs should melt to the same rows."""
+        df = load_data(data_dir, "factors_monthly")
+        df.loc[1, "intermediary_capital_ratio"] = None
+        from_pandas = to_long_format(df)
+        from_polars = to_long_format(pl.from_pandas(df).lazy())
+
+        assert isinstance(from_polars, pl.LazyFrame)
+        assert list(from_pandas.columns) == ["unique_id", "ds", "y"]
+        assert len(from_pandas) == 2
+        assert from_polars.collect().equals(pl.from_pandas(from_pandas))
+
+    def test_requires_factor_columns(self):
+        """Frames without any factor column should raise."""
+        with pytest.raises(ValueError, match="No factor columns"):
+            to_long_format(pl.DataFrame({"date": [1], "other": [1.0]}))
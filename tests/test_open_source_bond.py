@@ -0,0 +1,356 @@
+"""Tests for the Open Source Bond data module."""
+
+import http.server
+import threading
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from finm.data import open_source_bond
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Directory holding a small treasury returns file."""
+    df = pd.DataFrame(
+        {
+            "cusip": ["A", "A", "B", "B", "B"],
+            "date": pd.to_datetime(
+                ["2020-01-31", "2020-02-29", "2020-01-31", "2020-02-29", "2020-03-31"]
+            ),
+            "bond_ret": [0.01, 0.02, 0.03, None, 0.05],
+        }
+    )
+    df.to_parquet(tmp_path / open_source_bond.DATA_INFO["treasury"]["parquet"])
+    return tmp_path
+
+
+class TestLoad:
+    """Tests for load options."""
+
+    def test_columns_projection(self, data_dir):
+        """columns should select output columns, even ones not used to filter."""
+        df = open_source_bond.load(
+            data_dir, variant="treasury", start="2020-02-01", columns=["bond_ret"]
+        )
+        assert df.columns == ["bond_ret"]
+        assert df.height == 3
+
+    def test_load_data_columns(self, data_dir):
+        """load_data should read only the requested columns."""
+        df = open_source_bond._load.load_data(
+            data_dir, "treasury", columns=["date", "bond_ret"]
+        )
+        assert list(df.columns) == ["date", "bond_ret"]
+        assert len(df) == 5
+
+    def test_load_data_cached_until_modified(self, data_dir):
+        """Repeat reads reuse the parsed file; rewriting it invalidates it."""
+        read = open_source_bond._load._read_parquet
+        first = open_source_bond._load.load_data(data_dir, "treasury")
+        first["extra"] = 1.0
+        first.loc[0, "bond_ret"] = 99.0
+        hits = read.cache_info().hits
+        second = open_source_bond._load.load_data(data_dir, "treasury")
+        assert read.cache_info().hits == hits + 1
+        assert "extra" not in second.columns
+        assert second.loc[0, "bond_ret"] != 99.0
+
+        path = data_dir / open_source_bond.DATA_INFO["treasury"]["parquet"]
+        second.head(2).to_parquet(path)
+        assert len(open_source_bond._load.load_data(data_dir, "treasury")) == 2
+
+    def test_load_data_pyarrow_backend(self, data_dir, monkeypatch):
+        """dtype_backend="pyarrow" should return Arrow-backed columns."""
+        df = open_source_bond._load.load_data(
+            data_dir, "treasury", dtype_backend="pyarrow"
+        )
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert df["cusip"].tolist() == ["A", "A", "B", "B", "B"]
+
+        monkeypatch.setattr(pd, "__version__", "1.5.3")
+        with pytest.raises(ImportError, match="pandas>=2.0"):
+            open_source_bond._load.load_data(
+                data_dir, "treasury", dtype_backend="pyarrow"
+            )
+
+    def test_lazy_matches_eager(self, data_dir):
+        """lazy=True should return the same data as an eager load."""
+        eager = open_source_bond.load(data_dir, variant="treasury", format="long")
+        lazy = open_source_bond.load(
+            data_dir, variant="treasury", format="long", lazy=True
+        )
+        assert isinstance(lazy, pl.LazyFrame)
+        assert lazy.collect().equals(eager)
+
+
+class TestPivotFormat:
+    """Tests for format='pivot'."""
+
+    def test_one_column_per_cusip(self, data_dir):
+        """Pivot should have a date column then one column per CUSIP."""
+        df = open_source_bond.load(data_dir, variant="treasury", format="pivot")
+        assert df.columns == ["date", "A", "B"]
+        assert df.height == 3
+        assert df["B"].to_list() == [0.03, None, 0.05]
+
+    def test_written_once_and_filterable(self, data_dir):
+        """The pivot file should be created on first use and support date filters."""
+        pivot_file = data_dir / open_source_bond.DATA_INFO["treasury"]["pivot_parquet"]
+        assert not pivot_file.exists()
+        lf = open_source_bond.load(
+            data_dir, variant="treasury", format="pivot", start="2020-02-01", lazy=True
+        )
+        assert pivot_file.exists()
+        assert isinstance(lf, pl.LazyFrame)
+        assert lf.collect().height == 2
+
+    def test_unsupported_variant_raises(self, data_dir):
+        """Variants without a pivot file should raise."""
+        with pytest.raises(ValueError):
+            open_source_bond.write_pivot_parquet(data_dir, variant="corporate_monthly")
+
+
+class TestPartitionedDaily:
+    """Tests for the CUSIP-prefix partitioned corporate_daily dataset."""
+
+    @pytest.fixture
+    def daily_dir(self, tmp_path):
+        df = pd.DataFrame(
+            {
+                "cusip_id": ["00123AB", "00123AB", "12345XX", "99999ZZ"],
+                "trd_exctn_dt": pd.to_datetime(
+                    ["2020-01-02", "2020-01-03", "2020-01-02", "2020-01-02"]
+                ),
+                "pr": [100.0, 101.0, 99.0, 98.0],
+            }
+        )
+        info = open_source_bond.DATA_INFO["corporate_daily"]
+        df.to_parquet(tmp_path / info["parquet"])
+        open_source_bond.write_partitioned_parquet(tmp_path, "corporate_daily")
+        return tmp_path
+
+    def test_replaces_single_file(self, daily_dir):
+        """Partitioning should leave one directory per CUSIP prefix."""
+        info = open_source_bond.DATA_INFO["corporate_daily"]
+        assert not (daily_dir / info["parquet"]).exists()
+        partition_dir = daily_dir / info["partition_dir"]
+        partitions = sorted(p.name for p in partition_dir.iterdir())
+        assert partitions == ["cusip_prefix=00", "cusip_prefix=12", "cusip_prefix=99"]
+
+    def test_load_matches_original_columns(self, daily_dir):
+        """Loading should not expose the partition column."""
+        df = open_source_bond.load(daily_dir, variant="corporate_daily")
+        assert df.columns == ["cusip_id", "trd_exctn_dt", "pr"]
+        assert df.height == 4
+        assert len(open_source_bond._load.load_data(daily_dir, "corporate_daily")) == 4
+        pdf = open_source_bond._load.load_data(
+            daily_dir, "corporate_daily", columns=["cusip_id", "pr"]
+        )
+        assert list(pdf.columns) == ["cusip_id", "pr"]
+        pdf = open_source_bond._load.load_data(
+            daily_dir, "corporate_daily", dtype_backend="pyarrow"
+        )
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in pdf.dtypes)
+
+    def test_cusips_filter(self, daily_dir):
+        """cusips should restrict rows in wide and long formats."""
+        df = open_source_bond.load(
+            daily_dir, variant="corporate_daily", cusips=["00123AB"], lazy=True
+        ).collect()
+        assert df["pr"].to_list() == [100.0, 101.0]
+        long = open_source_bond.load(
+            daily_dir, variant="corporate_daily", cusips=["12345XX"], format="long"
+        )
+        assert long["unique_id"].to_list() == ["12345XX"]
+
+
+class TestToLongFormat:
+    """Tests for to_long_format()."""
+
+    def test_lazy_matches_pandas(self, data_dir):
+        """A LazyFrame stays lazy and gives the same rows as pandas input."""
+        path = data_dir / open_source_bond.DATA_INFO["treasury"]["parquet"]
+        from_pandas = open_source_bond.to_long_format(
+            pd.read_parquet(path), variant="treasury"
+        )
+        from_polars = open_source_bond.to_long_format(
+            pl.scan_parquet(path), variant="treasury"
+        )
+
+        assert isinstance(from_polars, pl.LazyFrame)
+        assert from_polars.collect().equals(pl.from_pandas(from_pandas))
+        assert isinstance(from_pandas["unique_id"].dtype, pd.CategoricalDtype)
+
+    def test_portfolio_ids_categorical_in_column_order(self):
+        """Portfolio names become categories ordered like the wide columns."""
+        wide = pd.DataFrame(
+            {"P2": [1.0, None], "P1": [2.0, 3.0]},
+            index=pd.Index(pd.to_datetime(["2020-01-31", "2020-02-29"]), name="date"),
+        )
+        long = open_source_bond.portfolio_to_long_format(wide)
+        assert long["unique_id"].cat.categories.tolist() == ["P2", "P1"]
+        assert long["unique_id"].tolist() == ["P2", "P1", "P1"]
+
+
+@pytest.fixture
+def treasury_server(tmp_path, monkeypatch):
+    """Serve a treasury CSV over HTTP and point the treasury pull at it.
+
+    Returns a function taking the CSV text and returning the list of
+    request methods the server receives.
+    """
+    serve_dir = tmp_path / "serve"
+    serve_dir.mkdir()
+    methods = []
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(serve_dir), **kwargs)
+
+        def send_head(self):
+            methods.append(self.command)
+            return super().send_head()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/bondret_treasury.csv"
+    monkeypatch.setitem(open_source_bond.DATA_INFO["treasury"], "url", url)
+
+    def serve(text):
+        (serve_dir / "bondret_treasury.csv").write_text(text)
+        return methods
+
+    yield serve
+    server.shutdown()
+    server.server_close()
+
+
+class TestPull:
+    """Tests for pull_data()."""
+
+    def test_all_variants_pulled_concurrently(self, tmp_path, monkeypatch):
+        """Each dataset of a multi-dataset pull runs on its own thread."""
+        barrier = threading.Barrier(3, timeout=5)
+        pulled = []
+
+        def fake_pull(data_dir, dataset_name, download_readme, use_cache):
+            barrier.wait()  # Times out unless all three run at once
+            pulled.append(dataset_name)
+
+        monkeypatch.setattr(open_source_bond._pull, "_pull_dataset", fake_pull)
+        open_source_bond.pull(tmp_path, variant="all", accept_license=True)
+        assert sorted(pulled) == ["corporate_daily", "corporate_monthly", "treasury"]
+
+    def test_unknown_variant_raises_before_download(self, tmp_path, monkeypatch):
+        """Invalid names are rejected before any dataset is pulled."""
+        monkeypatch.setattr(
+            open_source_bond._pull, "_pull_dataset", lambda *args: pytest.fail()
+        )
+        with pytest.raises(ValueError, match="Unknown variant"):
+            open_source_bond.pull(tmp_path, variant="bogus", accept_license=True)
+
+    def test_unknown_source_format_raises_before_download(self, tmp_path, monkeypatch):
+        """Datasets with an unsupported source format fail before any pull."""
+        monkeypatch.setattr(
+            open_source_bond._pull, "_pull_dataset", lambda *args: pytest.fail()
+        )
+        monkeypatch.setitem(
+            open_source_bond.DATA_INFO["corporate_monthly"], "source_format", "xlsx"
+        )
+        with pytest.raises(ValueError, match="Unknown source_format: xlsx"):
+            open_source_bond.pull(tmp_path, variant="all", accept_license=True)
+
+    def test_treasury_csv_streamed_sorted_by_date(self, treasury_server, tmp_path):
+        """The treasury CSV is parsed as it downloads into a date-sorted file."""
+        import pyarrow.parquet as pq
+
+        source = pd.DataFrame(
+            {
+                "cusip": ["B", "A", "B", "A"] * 150,
+                "date": ["2020-02-29", "2020-02-29", "2020-01-31", "2020-01-31"] * 150,
+                "bond_ret": [0.01, 0.02, 0.03, 0.04] * 150,
+            }
+        )
+        requests = treasury_server(source.to_csv(index=False))
+        for _ in range(2):
+            open_source_bond.pull(
+                tmp_path, variant="treasury", accept_license=True, download_readme=False
+            )
+        # The unchanged Last-Modified skips the second download
+        assert requests.count("GET") == 1
+        open_source_bond.pull(
+            tmp_path,
+            variant="treasury",
+            accept_license=True,
+            download_readme=False,
+            use_cache=False,
+        )
+        assert requests.count("GET") == 2
+
+        path = tmp_path / open_source_bond.DATA_INFO["treasury"]["parquet"]
+        df = pl.read_parquet(path)
+        assert df.height == len(source)
+        assert df.schema["date"] == pl.Datetime("ns")
+        assert df["date"].is_sorted()
+        assert pq.read_metadata(path).row_group(0).column(1).statistics.has_min_max
+        assert not list(tmp_path.glob("*.csv"))
+
+    def test_too_few_rows_raises(self, treasury_server, tmp_path):
+        """A truncated source file fails the row count check."""
+        treasury_server("cusip,date,bond_ret\nA,2020-01-31,0.01\n")
+        with pytest.raises(ValueError, match="at least 500 rows"):
+            open_source_bond.pull(tmp_path, variant="treasury", accept_license=True)
+
+    def test_zip_removed_when_member_missing(self, tmp_path, monkeypatch):
+        """The downloaded archive is deleted even if extraction fails."""
+        import zipfile
+
+        def fake_download(url, output_path, timeout=300):
+            with zipfile.ZipFile(output_path, "w") as zf:
+                zf.writestr("other.parquet", "x")
+            return output_path
+
+        monkeypatch.setattr(open_source_bond._pull, "_download_file", fake_download)
+        with pytest.raises(ValueError, match="not found in ZIP"):
+            open_source_bond._pull._download_and_extract_zip_parquet(
+                "https://example.com/data.zip", tmp_path, "data.parquet"
+            )
+        assert not (tmp_path / "data.zip").exists()
+
+    def test_zip_members_extracted_to_final_names(self, tmp_path, monkeypatch):
+        """The parquet and README members are written under their final names."""
+        import io
+        import zipfile
+
+        info = open_source_bond.DATA_INFO["corporate_monthly"]
+        buffer = io.BytesIO()
+        df = pd.DataFrame({"cusip": ["A"], "date": ["2020-01-31"], "ret_vw": [0.1]})
+        df.to_parquet(buffer)
+
+        def fake_download(url, output_path, timeout=300):
+            with zipfile.ZipFile(output_path, "w") as zf:
+                zf.writestr(info["zip_contents"], buffer.getvalue())
+                zf.writestr(info["readme_contents"], "readme")
+            return output_path
+
+        monkeypatch.setattr(open_source_bond._pull, "_download_file", fake_download)
+        monkeypatch.setattr(
+            open_source_bond._pull,
+            "remote_validators",
+            lambda url: {"etag": None, "last_modified": None},
+        )
+        monkeypatch.setitem(
+            open_source_bond._pull.MIN_N_ROWS_EXPECTED, "corporate_monthly", 1
+        )
+        open_source_bond.pull(
+            tmp_path, variant="corporate_monthly", accept_license=True
+        )
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [info["parquet"], info["readme_file"]]
+        )
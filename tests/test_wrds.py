@@ -0,0 +1,79 @@
+"""Tests for the WRDS data module (no WRDS connection required)."""
+
+import pandas as pd
+
+from finm.data.wrds import calc_runness
+
+
+def test_calc_runness_ranks_newest_issue_first():
+    """Newest issue per (date, maturity) is on-the-run; pre-1980 rows get 0."""
+    df = pd.DataFrame(
+        {
+            "caldt": pd.to_datetime(
+                ["2000-01-03"] * 3 + ["2000-01-03", "1979-06-01", "1979-06-01"]
+            ),
+            "original_maturity": [10, 10, 10, 30, 10, 10],
+            "tdatdt": pd.to_datetime(
+                [
+                    "1995-01-01",
+                    "1999-01-01",
+                    "1997-01-01",
+                    "1990-01-01",
+                    "1975-01-01",
+                    "1978-01-01",
+                ]
+            ),
+        }
+    )
+    out = calc_runness(df)
+    assert out["run"].tolist() == [2, 0, 1, 0, 0, 0]
+
+
+def test_load_derives_runness_from_consolidated_file(tmp_path):
+    """Without the runness file, load should add 'run' to the consolidated data."""
+    from finm.data import wrds
+    from finm.data.wrds._constants import PARQUET_TREASURY_CONSOLIDATED
+
+    df = pd.DataFrame(
+        {
+            "kycrspid": ["a", "b"],
+            "caldt": pd.to_datetime(["2000-01-03", "2000-01-03"]),
+            "original_maturity": [10, 10],
+            "tdatdt": pd.to_datetime(["1995-01-01", "1999-01-01"]),
+            "price": [100.0, 101.0],
+        }
+    )
+    df.to_parquet(tmp_path / PARQUET_TREASURY_CONSOLIDATED)
+    expected = calc_runness(df.copy())["run"].tolist()
+
+    lf = wrds.load(tmp_path, variant="treasury", lazy=True)
+    assert lf.collect()["run"].to_list() == expected == [1, 0]
+
+
+def test_load_columns_projection(tmp_path):
+    """columns should restrict the returned columns."""
+    from finm.data import wrds
+    from finm.data.wrds._constants import PARQUET_CORP_BOND
+
+    pd.DataFrame(
+        {"cusip": ["a"], "date": pd.to_datetime(["2020-01-31"]), "ret_eom": [0.01]}
+    ).to_parquet(tmp_path / PARQUET_CORP_BOND)
+    df = wrds.load(tmp_path, variant="corp_bond", columns=["cusip", "ret_eom"])
+    assert df.columns == ["cusip", "ret_eom"]
+
+
+def test_load_long_format(tmp_path):
+    """Long format should map cusip/date/ret_eom to unique_id/ds/y."""
+    from finm.data import wrds
+    from finm.data.wrds._constants import PARQUET_CORP_BOND
+
+    pd.DataFrame(
+        {
+            "cusip": ["a", "b"],
+            "date": pd.to_datetime(["2020-01-31", "2020-01-31"]),
+            "ret_eom": [0.01, float("nan")],
+        }
+    ).to_parquet(tmp_path / PARQUET_CORP_BOND)
+    df = wrds.load(tmp_path, variant="corp_bond", format="long")
+    assert df.columns == ["unique_id", "ds", "y"]
+    assert df["unique_id"].to_list() == ["a"]